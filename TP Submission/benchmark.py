@@ -0,0 +1,326 @@
+import argparse  # Command line of the benchmark suite
+import json  # Results and baselines are JSON files
+import platform
+import statistics
+import sys
+import time
+import tracemalloc  # Peak memory of a search or a batch of primitive calls
+import numpy as np
+from bitboard import Bitboard
+from game_state import GameState
+from line_counter import LineCounter
+from minimax_ai import AI
+
+# No pygame import: the timings cover the engine alone, without a window.
+
+# Fixed positions: moves are log positions (numbered from 1), X first, so the AI (O) is to move
+CORPUS = [
+    {'name': '3x3/opening_center', 'board_size': 3, 'category': 'opening', 'moves': [5]},
+    {'name': '3x3/opening_corner', 'board_size': 3, 'category': 'opening', 'moves': [1]},
+    {'name': '3x3/midgame', 'board_size': 3, 'category': 'midgame', 'moves': [1, 5, 9]},
+    {'name': '3x3/tactical_block', 'board_size': 3, 'category': 'tactical', 'moves': [1, 5, 2, 3, 7]},
+    {'name': '3x3/near_endgame', 'board_size': 3, 'category': 'near_endgame', 'moves': [1, 5, 9, 2, 8, 7, 3]},
+    {'name': '5x5/opening_center', 'board_size': 5, 'category': 'opening', 'moves': [13]},
+    {'name': '5x5/opening_corner', 'board_size': 5, 'category': 'opening', 'moves': [1]},
+    {'name': '5x5/midgame', 'board_size': 5, 'category': 'midgame', 'moves': [13, 7, 19, 9, 17]},
+    {'name': '5x5/tactical_block', 'board_size': 5, 'category': 'tactical', 'moves': [11, 7, 12, 8, 13, 9, 14]},
+    {'name': '5x5/near_endgame', 'board_size': 5, 'category': 'near_endgame',
+     'moves': [13, 15, 2, 10, 21, 20, 17, 12, 24, 18, 14, 5, 16, 4, 8, 6, 3, 19, 22]},
+]
+
+# Fixed search depths keep the node counts identical from run to run, so times are comparable
+SEARCH_DEPTHS = {3: 9, 5: 4}
+
+
+class Benchmark:
+    """
+    Benchmark suite for the minimax AI: move latency, search throughput and peak memory.
+
+    Searches run AI._best_move on every corpus position with a fixed depth and no time
+    budget, on a fresh engine each time (cold transposition table, no opening book), so
+    the work done is the same on every run and only its speed changes. Each search is
+    timed `repeats` times and the median is reported; the peak memory is measured in a
+    separate run under tracemalloc, which slows the code it traces.
+
+    Primitives time the building blocks of the search (win checks, move make/unmake,
+    heuristic evaluation) in tight loops on the midgame positions, reported per call.
+    """
+
+    PRIMITIVE_CALLS = 20000  # Calls per timed batch of a primitive
+
+    def __init__(self, repeats=5, corpus=None, name_filter=None):
+        """
+        Args:
+            repeats (int): Timed runs per search and per primitive batch.
+            corpus (list or None): Positions to search, CORPUS by default.
+            name_filter (str or None): Only run the benchmarks whose name contains this text.
+        """
+        self.repeats = repeats
+        self.corpus = CORPUS if corpus is None else corpus
+        self.name_filter = name_filter
+
+    def _selected(self, name):
+        """Returns True if the benchmark passes the name filter."""
+        return self.name_filter is None or self.name_filter in name
+
+    @staticmethod
+    def _position(entry):
+        """Returns the GameState of a corpus entry."""
+        state = GameState(entry['board_size'])
+        for index, position in enumerate(entry['moves']):
+            state._make(position - 1, 1 if index % 2 == 0 else 2)
+        return state
+
+    @staticmethod
+    def _new_engine(board_size):
+        """Returns a fresh engine with a fixed-depth search."""
+        return AI(board_size, max_depth=SEARCH_DEPTHS[board_size])
+
+    def _run_search(self, entry):
+        """
+        Benchmarks AI._best_move on one corpus position.
+
+        Returns:
+            dict: Move, depth, nodes, median/min time to move (ms), nodes per second and
+                  peak memory (KiB).
+        """
+        state = self._position(entry)
+        times = []
+        for _ in range(self.repeats):
+            ai = self._new_engine(entry['board_size'])
+            for cell, player in state._moves():
+                ai._notify_move(cell, player)
+            start = time.perf_counter()
+            move = ai._best_move()
+            times.append(time.perf_counter() - start)
+
+        ai = self._new_engine(entry['board_size'])
+        for cell, player in state._moves():
+            ai._notify_move(cell, player)
+        tracemalloc.start()
+        ai._best_move()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        median = statistics.median(times)
+        return {
+            'category': entry['category'],
+            'board_size': entry['board_size'],
+            'depth': SEARCH_DEPTHS[entry['board_size']],
+            'move': list(move) if move is not None else None,
+            'nodes': ai.nodes,
+            'time_ms': round(median * 1000, 3),
+            'time_ms_min': round(min(times) * 1000, 3),
+            'nodes_per_s': round(ai.nodes / median) if median else None,
+            'peak_kib': round(peak / 1024, 1),
+        }
+
+    def _primitives(self, board_size):
+        """
+        Returns the primitive benchmarks of a board size as {name: function(calls)}.
+
+        Each function makes `calls` calls of the primitive on the midgame position.
+        """
+        entry = next(entry for entry in self.corpus if entry['board_size'] == board_size
+                     and entry['category'] == 'midgame')
+        state = self._position(entry)
+        bitboard = Bitboard(board_size)
+        for cell, player in state._moves():
+            bitboard._make(cell, player)
+        lines = LineCounter(board_size)
+        for cell, player in state._moves():
+            lines._make(cell, player)
+        ai = self._new_engine(board_size)
+        empty = bitboard._empty_cells()
+        cell = empty[0]
+
+        def is_win(calls):
+            for _ in range(calls):
+                bitboard._is_win(1)
+
+        def is_win_at(calls):
+            for _ in range(calls):
+                bitboard._is_win_at(cell, 1)
+
+        def bitboard_make_unmake(calls):
+            for _ in range(calls):
+                bitboard._make(cell, 2)
+                bitboard._unmake(cell, 2)
+
+        def line_counter_make_unmake(calls):
+            for _ in range(calls):
+                lines._make(cell, 2)
+                lines._unmake(cell, 2)
+
+        def game_state_make_undo(calls):
+            for _ in range(calls):
+                state._make(cell, 2)
+                state._undo()
+
+        def evaluate_board(calls):
+            for _ in range(calls):
+                ai._evaluate_board(bitboard)
+
+        def evaluate_children(calls):
+            for _ in range(calls):
+                ai.evaluator._evaluate_children(bitboard, empty, 2)
+
+        return {'is_win': is_win, 'is_win_at': is_win_at, 'bitboard_make_unmake': bitboard_make_unmake,
+                'line_counter_make_unmake': line_counter_make_unmake, 'game_state_make_undo': game_state_make_undo,
+                'evaluate_board': evaluate_board, 'evaluate_children': evaluate_children}
+
+    def _run_primitive(self, function, calls):
+        """
+        Benchmarks a primitive.
+
+        Returns:
+            dict: Median/min time per call (ns), calls per second and peak memory of a batch (KiB).
+        """
+        function(min(calls, 100))  # Warm-up
+        times = []
+        for _ in range(self.repeats):
+            start = time.perf_counter()
+            function(calls)
+            times.append((time.perf_counter() - start) / calls)
+
+        tracemalloc.start()
+        function(calls)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        median = statistics.median(times)
+        return {
+            'calls': calls,
+            'ns_per_call': round(median * 1e9, 1),
+            'ns_per_call_min': round(min(times) * 1e9, 1),
+            'calls_per_s': round(1 / median) if median else None,
+            'peak_kib': round(peak / 1024, 1),
+        }
+
+    def _run(self, progress=None):
+        """
+        Runs every selected benchmark.
+
+        Args:
+            progress (callable or None): Called with each benchmark name before it runs.
+
+        Returns:
+            dict: {'meta': ..., 'searches': {name: result}, 'primitives': {name: result}}.
+        """
+        results = {
+            'meta': {
+                'python': platform.python_version(),
+                'numpy': np.__version__,
+                'machine': platform.machine(),
+                'platform': platform.platform(),
+                'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                'repeats': self.repeats,
+            },
+            'searches': {},
+            'primitives': {},
+        }
+        for entry in self.corpus:
+            if self._selected(entry['name']):
+                if progress is not None:
+                    progress(entry['name'])
+                results['searches'][entry['name']] = self._run_search(entry)
+
+        for board_size in sorted({entry['board_size'] for entry in self.corpus}):
+            for name, function in self._primitives(board_size).items():
+                name = f"{board_size}x{board_size}/{name}"
+                if self._selected(name):
+                    if progress is not None:
+                        progress(name)
+                    results['primitives'][name] = self._run_primitive(function, self.PRIMITIVE_CALLS)
+        return results
+
+
+# Compared metrics: (section, metric, True if higher is better). Best times are compared rather
+# than medians: they are the least disturbed by other processes on the machine.
+COMPARED_METRICS = [
+    ('searches', 'time_ms_min', False),
+    ('searches', 'nodes_per_s', True),
+    ('searches', 'peak_kib', False),
+    ('primitives', 'ns_per_call_min', False),
+    ('primitives', 'peak_kib', False),
+]
+
+
+def _compare(baseline, results, threshold=0.10):
+    """
+    Compares results with a saved baseline.
+
+    A metric regresses when it is worse than the baseline by more than `threshold`
+    (a fraction). A search whose node count or move differs from the baseline is
+    reported as changed: the engine now does different work, so its times are not
+    directly comparable.
+
+    Args:
+        baseline (dict): Results of an earlier run.
+        results (dict): Results of this run.
+        threshold (float): Relative change tolerated before flagging a regression.
+
+    Returns:
+        dict: 'regressions', 'improvements' and 'changed' lists, plus 'missing' benchmarks.
+    """
+    report = {'regressions': [], 'improvements': [], 'changed': [], 'missing': []}
+    for section, metric, higher_is_better in COMPARED_METRICS:
+        for name, old in baseline.get(section, {}).items():
+            new = results.get(section, {}).get(name)
+            if new is None:
+                if (section, name) not in report['missing']:
+                    report['missing'].append((section, name))
+                continue
+            if not old.get(metric) or new.get(metric) is None:
+                continue
+            ratio = new[metric] / old[metric]
+            worse = ratio < 1 - threshold if higher_is_better else ratio > 1 + threshold
+            better = ratio > 1 + threshold if higher_is_better else ratio < 1 - threshold
+            entry = {'benchmark': name, 'metric': metric, 'baseline': old[metric], 'current': new[metric],
+                     'change': round(ratio - 1, 4)}
+            if worse:
+                report['regressions'].append(entry)
+            elif better:
+                report['improvements'].append(entry)
+    for name, old in baseline.get('searches', {}).items():
+        new = results.get('searches', {}).get(name)
+        if new is not None and (new['nodes'] != old['nodes'] or new['move'] != old['move']):
+            report['changed'].append({'benchmark': name, 'baseline': {'nodes': old['nodes'], 'move': old['move']},
+                                      'current': {'nodes': new['nodes'], 'move': new['move']}})
+    report['missing'] = [f"{section}:{name}" for section, name in report['missing']]
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the minimax AI's move latency, throughput and memory.")
+    parser.add_argument('--output', default='benchmark.json', help="JSON file receiving the results.")
+    parser.add_argument('--compare', default=None, help="Baseline JSON file to compare the results with.")
+    parser.add_argument('--threshold', type=float, default=0.10, help="Relative change flagged as a regression.")
+    parser.add_argument('--repeats', type=int, default=5, help="Timed runs per benchmark.")
+    parser.add_argument('--filter', default=None, help="Only run benchmarks whose name contains this text.")
+    args = parser.parse_args()
+
+    suite = Benchmark(args.repeats, name_filter=args.filter)
+    result = suite._run(progress=lambda name: print(f"  {name}", file=sys.stderr))
+    with open(args.output, 'w') as results_file:
+        json.dump(result, results_file, indent=2)
+
+    for name, search in result['searches'].items():
+        print(f"{name:24} {search['time_ms']:10.2f} ms  {search['nodes']:8d} nodes  "
+              f"{search['nodes_per_s']:9d} nodes/s  {search['peak_kib']:9.1f} KiB")
+    for name, primitive in result['primitives'].items():
+        print(f"{name:34} {primitive['ns_per_call']:10.1f} ns/call  {primitive['peak_kib']:7.1f} KiB")
+
+    if args.compare:
+        with open(args.compare) as baseline_file:
+            comparison = _compare(json.load(baseline_file), result, args.threshold)
+        for kind in ('regressions', 'improvements'):
+            for entry in comparison[kind]:
+                print(f"{kind[:-1].upper():12} {entry['benchmark']} {entry['metric']}: "
+                      f"{entry['baseline']} -> {entry['current']} ({entry['change']:+.1%})")
+        for entry in comparison['changed']:
+            print(f"CHANGED      {entry['benchmark']}: {entry['baseline']} -> {entry['current']}")
+        for name in comparison['missing']:
+            print(f"MISSING      {name}")
+        if comparison['regressions']:
+            sys.exit(1)  # Lets scripts and CI fail on a regression
@@ -0,0 +1,306 @@
+from zobrist import Zobrist  # Symmetry-aware hash keys
+
+
+class Bitboard:
+    """
+    Compact game state for the search, storing one integer bit mask per player.
+
+    Cell (row, col) is mapped to bit `row * board_size + col`, so the bit order matches
+    the position numbering used by the Logger (minus one). Making a move, undoing it,
+    testing a win and testing a full board are all plain integer operations instead of
+    nested loops over a NumPy array. A packed Zobrist hash is kept up to date on every
+    make/unmake so positions can be looked up in a transposition table.
+
+    A player wins by owning `win_length` consecutive cells of a row, column or diagonal
+    (the whole line when win_length equals the board size).
+    """
+
+    # Win masks only depend on the board size and win length, so they are computed once and shared
+    _win_mask_cache = {}
+
+    def __init__(self, board_size, win_length=None):
+        """
+        Initializes an empty bitboard for the given board size.
+
+        Args:
+            board_size (int): Size of the board (e.g., 3 for 3x3 or 5 for 5x5).
+            win_length (int or None): Pieces in a row needed to win, None for the board size.
+        """
+        if not isinstance(board_size, int):
+            raise ValueError(f"board_size must be an integer, but got {type(board_size)}.")
+        win_length = board_size if win_length is None else win_length
+        if not 1 <= win_length <= board_size:
+            raise ValueError(f"win_length must be between 1 and {board_size}, but got {win_length}.")
+        self.board_size = board_size
+        self.win_length = win_length
+        self.num_cells = board_size * board_size
+        self.full_mask = (1 << self.num_cells) - 1  # Every cell occupied
+        self.masks = [0, 0, 0]  # Index 1 for the human (X), index 2 for the AI (O); index 0 unused
+        self.win_masks, self.masks_through = self._build_win_masks(board_size, win_length)
+        self.not_first_col, self.not_last_col = self._build_column_masks(board_size)
+        self.zobrist = Zobrist(board_size)
+        self.keys = self.zobrist.keys  # keys[player][cell], packed over the 8 symmetries
+        self.hash = 0  # Packed hash of the current position
+
+    @staticmethod
+    def _build_lines(board_size, win_length=None):
+        """
+        Returns the winning segments of the board as lists of cell indices.
+
+        Args:
+            board_size (int): Size of the board.
+            win_length (int or None): Length of a winning segment, None for the board size.
+
+        Returns:
+            list: Segments along rows, then columns, then diagonals and anti-diagonals. With
+                  the default win length these are the rows, the columns and the two diagonals.
+        """
+        n = board_size
+        k = n if win_length is None else win_length
+        lines = []
+        for row in range(n):  # Rows
+            for start in range(n - k + 1):
+                lines.append([row * n + col for col in range(start, start + k)])
+        for col in range(n):  # Columns
+            for start in range(n - k + 1):
+                lines.append([row * n + col for row in range(start, start + k)])
+        for row in range(n - k + 1):  # Diagonals, towards the bottom right
+            for col in range(n - k + 1):
+                lines.append([(row + i) * n + col + i for i in range(k)])
+        for row in range(n - k + 1):  # Anti-diagonals, towards the bottom left
+            for col in range(k - 1, n):
+                lines.append([(row + i) * n + col - i for i in range(k)])
+        return lines
+
+    @classmethod
+    def _build_win_masks(cls, board_size, win_length=None):
+        """
+        Returns the winning segment masks, both as a flat list and grouped by cell.
+
+        Args:
+            board_size (int): Size of the board.
+            win_length (int or None): Length of a winning segment, None for the board size.
+
+        Returns:
+            tuple: (win_masks, masks_through) where masks_through[cell] lists the masks
+                   of the segments passing through that cell (at most 4 * win_length).
+        """
+        key = (board_size, board_size if win_length is None else win_length)
+        if key not in cls._win_mask_cache:
+            win_masks = []
+            masks_through = [[] for _ in range(board_size * board_size)]
+            for line in cls._build_lines(*key):
+                mask = 0
+                for cell in line:
+                    mask |= 1 << cell
+                win_masks.append(mask)
+                for cell in line:
+                    masks_through[cell].append(mask)
+            cls._win_mask_cache[key] = (win_masks, masks_through)
+        return cls._win_mask_cache[key]
+
+    @staticmethod
+    def _build_column_masks(board_size):
+        """Returns the masks of every cell except the first column, and except the last column."""
+        not_first_col = not_last_col = 0
+        for cell in range(board_size * board_size):
+            if cell % board_size != 0:
+                not_first_col |= 1 << cell
+            if cell % board_size != board_size - 1:
+                not_last_col |= 1 << cell
+        return not_first_col, not_last_col
+
+    @classmethod
+    def _from_array(cls, board, win_length=None):
+        """
+        Builds a bitboard from a square board array (NumPy array or nested lists).
+
+        Args:
+            board (ndarray): The board, where 0 is empty, 1 is the human and 2 is the AI.
+            win_length (int or None): Pieces in a row needed to win, None for the board size.
+
+        Returns:
+            Bitboard: The equivalent bitboard.
+        """
+        bitboard = cls(len(board), win_length)
+        for row in range(bitboard.board_size):
+            for col in range(bitboard.board_size):
+                player = int(board[row][col])
+                if player:
+                    bitboard._make(row * bitboard.board_size + col, player)
+        return bitboard
+
+    @classmethod
+    def _from_masks(cls, board_size, masks, win_length=None):
+        """
+        Builds a bitboard from the masks of a position, e.g. one sent to a worker process.
+
+        Args:
+            board_size (int): Size of the board.
+            masks (tuple): (human_mask, ai_mask) of the position.
+            win_length (int or None): Pieces in a row needed to win, None for the board size.
+
+        Returns:
+            Bitboard: The position, with its hash built move by move.
+        """
+        bitboard = cls(board_size, win_length)
+        for player, mask in ((1, masks[0]), (2, masks[1])):
+            for cell in range(board_size * board_size):
+                if mask >> cell & 1:
+                    bitboard._make(cell, player)
+        return bitboard
+
+    def _copy(self):
+        """Returns an independent copy of the bitboard."""
+        clone = Bitboard.__new__(Bitboard)
+        clone.__dict__.update(self.__dict__)  # Tables are shared, they never change
+        clone.masks = list(self.masks)
+        return clone
+
+    def _make(self, cell, player):
+        """Places the player's piece on the given cell index."""
+        self.masks[player] |= 1 << cell
+        self.hash ^= self.keys[player][cell]
+
+    def _unmake(self, cell, player):
+        """Removes the player's piece from the given cell index."""
+        self.masks[player] &= ~(1 << cell)
+        self.hash ^= self.keys[player][cell]
+
+    def _is_win(self, player):
+        """Returns True if the player occupies a complete winning line."""
+        mask = self.masks[player]
+        for win_mask in self.win_masks:
+            if mask & win_mask == win_mask:
+                return True
+        return False
+
+    def _is_win_at(self, cell, player):
+        """
+        Returns True if the player's piece on the given cell completes a line.
+
+        Only the lines through that cell are tested, so this is the check to use right
+        after a move: any other completed line would already have ended the game.
+        """
+        mask = self.masks[player]
+        for win_mask in self.masks_through[cell]:
+            if mask & win_mask == win_mask:
+                return True
+        return False
+
+    def _winner(self):
+        """Returns 2 if the AI has won, 1 if the human has won and 0 otherwise."""
+        if self._is_win(2):
+            return 2
+        if self._is_win(1):
+            return 1
+        return 0
+
+    def _is_full(self):
+        """Returns True if no empty cell is left."""
+        return self.masks[1] | self.masks[2] == self.full_mask
+
+    def _empty_cells(self):
+        """
+        Returns the empty cell indices in row-major order.
+
+        Returns:
+            list: Cell indices of all empty cells.
+        """
+        cells = []
+        empty = self.full_mask & ~(self.masks[1] | self.masks[2])
+        while empty:
+            low_bit = empty & -empty  # Isolate the lowest set bit
+            cells.append(low_bit.bit_length() - 1)
+            empty ^= low_bit
+        return cells
+
+    def _neighborhood(self, radius):
+        """
+        Returns the mask of the empty cells within `radius` rows and columns of a piece.
+
+        The occupied cells are grown one step in all 8 directions `radius` times with
+        shifts; the column masks stop pieces on one edge from leaking onto the other.
+        """
+        occupied = self.masks[1] | self.masks[2]
+        area = occupied
+        n = self.board_size
+        for _ in range(radius):
+            area |= (area << 1 & self.not_first_col) | (area >> 1 & self.not_last_col)  # Left and right
+            area |= (area << n) | (area >> n)  # Up and down, which also covers the diagonals
+            area &= self.full_mask
+        return area & ~occupied
+
+    def _candidate_cells(self, radius=None):
+        """
+        Returns the empty cells worth searching, lowest index first.
+
+        Args:
+            radius (int or None): Only keep cells within this many rows and columns of a
+                                  piece; None keeps every empty cell. An empty board
+                                  only offers its center.
+        """
+        if radius is None:
+            return self._empty_cells()
+        if not self.masks[1] | self.masks[2]:
+            return [(self.board_size // 2) * self.board_size + self.board_size // 2]
+        cells = []
+        area = self._neighborhood(radius)
+        while area:
+            low_bit = area & -area
+            cells.append(low_bit.bit_length() - 1)
+            area ^= low_bit
+        return cells
+
+    def _winning_cells(self, player, cells):
+        """
+        Returns the cells among `cells` where the player would complete a segment.
+
+        Args:
+            player (int): The player (1 or 2).
+            cells (list): Empty cells to test.
+
+        Returns:
+            list: The winning cells, in the order of `cells`.
+        """
+        mask = self.masks[player]
+        winning = []
+        for cell in cells:
+            placed = mask | 1 << cell
+            for win_mask in self.masks_through[cell]:
+                if placed & win_mask == win_mask:
+                    winning.append(cell)
+                    break
+        return winning
+
+    def _count(self, player):
+        """Returns the number of pieces the player has on the board."""
+        return bin(self.masks[player]).count("1")
+
+    def _canonical_key(self, to_move):
+        """
+        Returns the transposition table key of the position.
+
+        Args:
+            to_move (int): The player to move (1 or 2), which is part of the key.
+
+        Returns:
+            int: A key shared by all 8 symmetric variants of the position.
+        """
+        return self._canonical(to_move)[0]
+
+    def _canonical(self, to_move):
+        """
+        Returns the transposition table key of the position and the symmetry mapping the
+        board onto its canonical variant, needed to translate stored moves.
+
+        Args:
+            to_move (int): The player to move (1 or 2), which is part of the key.
+
+        Returns:
+            tuple: (key, symmetry).
+        """
+        key, symmetry = self.zobrist._canonical(self.hash)
+        if to_move == 2:
+            key ^= self.zobrist.side_key
+        return key, symmetry
@@ -0,0 +1,8 @@
+import os
+import sys
+
+# The game modules are flat files in this directory and import each other by name
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+# Tests that touch the renderer run without a window or sound device
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
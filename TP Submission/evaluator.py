@@ -0,0 +1,101 @@
+import numpy as np  # Line counts are computed with array reductions
+from bitboard import Bitboard  # For the winning lines, gathered as an index array
+
+
+class LineEvaluator:
+    """
+    Heuristic evaluation based on open lines.
+
+    A line is open for a player when it holds at least one of their pieces and none of the
+    opponent's, so it can still be completed. Each open line is worth more the fuller it
+    is (1, 10, 100, ... for 1, 2, 3, ... pieces). The score is the AI's open-line total
+    minus the human's, computed for whole stacks of boards at once with precomputed
+    line-index arrays.
+    """
+
+    def __init__(self, board_size, player=2, win_length=None, score_limit=None):
+        """
+        Precomputes the line indices and weights for the given board size.
+
+        Args:
+            board_size (int): Size of the board.
+            player (int): The player whose point of view the scores are from (1 or 2).
+            win_length (int or None): Pieces in a row needed to win, None for the board size.
+            score_limit (int or None): Scores are clipped to [-score_limit, score_limit], so that
+                                       boards with many long segments stay below win scores.
+        """
+        self.board_size = board_size
+        self.num_cells = board_size * board_size
+        self.player = player
+        self.opponent = 3 - player
+        self.win_length = board_size if win_length is None else win_length
+        self.lines = np.array(Bitboard._build_lines(board_size, win_length), dtype=np.intp)  # Shape [L, k]
+        self.score_limit = score_limit
+
+        # weights[count]: value of an open line holding `count` pieces. A full line is a win and
+        # never reaches the evaluator, but it keeps the lookup valid for any count.
+        self.weights = np.array([0] + [10 ** (count - 1) for count in range(1, self.win_length + 1)], dtype=np.int64)
+        self.num_bytes = (self.num_cells + 7) // 8
+
+    def _evaluate_batch(self, boards):
+        """
+        Scores a stack of boards in one call.
+
+        Args:
+            boards (ndarray): Boards of shape [N, n, n] (or already flattened to [N, n * n]),
+                              where 0 is empty and 1/2 are the players' pieces.
+
+        Returns:
+            ndarray: Integer scores of shape [N], from the evaluator's player's point of view.
+        """
+        boards = np.asarray(boards).reshape(-1, self.num_cells)
+        cells = boards[:, self.lines]  # Shape [N, L, k]
+        own = (cells == self.player).sum(axis=2)
+        other = (cells == self.opponent).sum(axis=2)
+        own_open = np.where(other == 0, self.weights[own], 0)
+        other_open = np.where(own == 0, self.weights[other], 0)
+        scores = (own_open - other_open).sum(axis=1)
+        if self.score_limit is not None:
+            scores = np.clip(scores, -self.score_limit, self.score_limit)
+        return scores
+
+    def _evaluate(self, board):
+        """Scores a single board of shape [n, n]."""
+        return int(self._evaluate_batch(np.asarray(board)[None])[0])
+
+    def _board_from_masks(self, human_mask, ai_mask):
+        """
+        Converts bitboard masks to a flat board array.
+
+        Args:
+            human_mask (int): Bit mask of player 1's pieces.
+            ai_mask (int): Bit mask of player 2's pieces.
+
+        Returns:
+            ndarray: Flat int8 array of length n * n with 0, 1 or 2 per cell.
+        """
+        board = self._unpack(human_mask)
+        board += 2 * self._unpack(ai_mask)
+        return board
+
+    def _unpack(self, mask):
+        """Returns the bits of a mask as an int8 array, one entry per cell (cell 0 first)."""
+        packed = np.frombuffer(mask.to_bytes(self.num_bytes, 'little'), dtype=np.uint8)
+        return np.unpackbits(packed, bitorder='little')[:self.num_cells].astype(np.int8)
+
+    def _evaluate_children(self, bitboard, cells, player):
+        """
+        Scores every child of a position at once.
+
+        Args:
+            bitboard (Bitboard): The parent position.
+            cells (list): Empty cells to play, one child per cell.
+            player (int): The player making the move.
+
+        Returns:
+            ndarray: Scores of the children, in the order of `cells`.
+        """
+        base = self._board_from_masks(bitboard.masks[1], bitboard.masks[2])
+        children = np.repeat(base[None], len(cells), axis=0)
+        children[np.arange(len(cells)), cells] = player
+        return self._evaluate_batch(children)
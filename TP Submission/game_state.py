@@ -0,0 +1,161 @@
+import struct  # Compact serialized form
+from array import array  # Move history
+import numpy as np  # Zero-copy board view for the renderer and the engines
+from line_counter import LineCounter  # Incremental win/draw checks
+
+
+class GameState:
+    """
+    The state of a game, shared by the game loop, the players, the AI, the server and the simulator.
+
+    Every move goes through _make, which validates it, applies it and checks it for a win
+    exactly once; the winner and the number of empty cells are then cached, so reading the
+    outcome of the game is free. _undo takes back the last move in O(1).
+
+    Cells are numbered row * board_size + col. The board is a bytearray of cells (0 empty,
+    1 for the human X, 2 for the AI O), kept alongside one bit mask per player for the
+    engines and the move history as an array of cell indices.
+    """
+
+    __slots__ = ('board_size', 'win_length', 'cells', 'masks', 'history', 'lines', 'winner', 'empty_count')
+
+    SERIAL_HEADER = struct.Struct('<BBH')  # Board size, win length, number of moves
+
+    def __init__(self, board_size, win_length=None):
+        """
+        Initializes an empty board.
+
+        Args:
+            board_size (int): Size of the board (e.g., 3 for 3x3 or 5 for 5x5).
+            win_length (int or None): Pieces in a row needed to win, None for the board size.
+        """
+        if not isinstance(board_size, int):
+            raise ValueError(f"board_size must be an integer, but got {type(board_size)}.")
+        self.board_size = board_size
+        self.win_length = board_size if win_length is None else win_length
+        self.lines = LineCounter(board_size, self.win_length)  # Per-line piece counts
+        self._reset()
+
+    def _reset(self):
+        """Clears the board, e.g. when a round is restarted."""
+        self.cells = bytearray(self.board_size * self.board_size)
+        self.masks = [0, 0, 0]  # masks[player]; index 0 unused
+        self.history = array('H')  # Cells played, in order
+        self.lines._reset()
+        self.winner = 0  # 0 while nobody has completed a line
+        self.empty_count = self.board_size * self.board_size
+
+    def _cell(self, row, col):
+        """Returns the cell index of (row, col)."""
+        return row * self.board_size + col
+
+    @staticmethod
+    def _position(cell):
+        """Returns the position of a cell as numbered in the move log (from 1)."""
+        return cell + 1
+
+    def _is_legal(self, cell):
+        """Returns True if the cell is on the board, empty, and the game is not over."""
+        return not self.winner and 0 <= cell < len(self.cells) and not self.cells[cell]
+
+    def _make(self, cell, player):
+        """
+        Plays a move.
+
+        Args:
+            cell (int): Cell index of the move.
+            player (int): The player who moves (1 or 2).
+
+        Returns:
+            bool: True if the move won the game.
+
+        Raises:
+            ValueError: If the game is over or the cell is not an empty cell of the board.
+        """
+        if not self._is_legal(cell):
+            raise ValueError(f"Cell {cell} is not a legal move (game over, occupied or off the board).")
+        self.cells[cell] = player
+        self.masks[player] |= 1 << cell
+        self.history.append(cell)
+        self.empty_count -= 1
+        if self.lines._make(cell, player):
+            self.winner = player
+            return True
+        return False
+
+    def _undo(self):
+        """
+        Takes back the last move.
+
+        Returns:
+            tuple: (cell, player) of the move taken back.
+        """
+        cell = self.history.pop()
+        player = self.cells[cell]
+        self.cells[cell] = 0
+        self.masks[player] &= ~(1 << cell)
+        self.empty_count += 1
+        self.lines._unmake(cell, player)
+        self.winner = 0  # Play stops at the first win, so the position before it had no winner
+        return cell, player
+
+    def _is_full(self):
+        """Returns True if no empty cell is left."""
+        return self.empty_count == 0
+
+    def _is_over(self):
+        """Returns True once a player has won or the board is full."""
+        return bool(self.winner) or self.empty_count == 0
+
+    def _empty_cells(self):
+        """Returns the empty cell indices in row-major order."""
+        return [cell for cell, player in enumerate(self.cells) if not player]
+
+    def _moves(self):
+        """Returns the moves played so far as (cell, player) pairs, in order."""
+        return [(cell, self.cells[cell]) for cell in self.history]
+
+    def _as_array(self):
+        """Returns a (board_size, board_size) NumPy view of the board; it is not copied and follows later moves."""
+        return np.frombuffer(self.cells, dtype=np.uint8).reshape(self.board_size, self.board_size)
+
+    def _copy(self):
+        """Returns an independent copy of the state; the line tables are shared, they never change."""
+        clone = GameState.__new__(GameState)
+        clone.board_size = self.board_size
+        clone.win_length = self.win_length
+        clone.cells = bytearray(self.cells)
+        clone.masks = list(self.masks)
+        clone.history = array('H', self.history)
+        clone.lines = self.lines._copy()
+        clone.winner = self.winner
+        clone.empty_count = self.empty_count
+        return clone
+
+    def _serialize(self):
+        """
+        Returns the state as bytes: a small header, the cells played and who played them.
+
+        The history is stored in native byte order, which is fine between processes of the
+        same machine.
+        """
+        players = bytes(self.cells[cell] for cell in self.history)
+        return self.SERIAL_HEADER.pack(self.board_size, self.win_length, len(self.history)) \
+            + self.history.tobytes() + players
+
+    @classmethod
+    def _deserialize(cls, data):
+        """Rebuilds a state written by _serialize, replaying its moves."""
+        board_size, win_length, count = cls.SERIAL_HEADER.unpack_from(data)
+        start = cls.SERIAL_HEADER.size
+        history = array('H')
+        history.frombytes(data[start:start + count * history.itemsize])
+        players = data[start + count * history.itemsize:]
+        state = cls(board_size, win_length)
+        for cell, player in zip(history, players):
+            state._make(cell, player)
+        return state
+
+    def __reduce__(self):
+        """Pickles as the serialized bytes, so a state sent to a worker process does not carry its tables."""
+        return GameState._deserialize, (self._serialize(),)
@@ -7,18 +7,18 @@ class HumanPlayer(Player):
     It defines the specific behavior for making a move as a human player.
     """
 
-    def _make_move(self, event, board, renderer, logger):
+    def _make_move(self, event, state, renderer, logger):
         """
         Handles the human player's move. The move is made by clicking on the board's cells.
 
         Args:
             event (pygame event): The event generated by the mouse click.
-            board (list): The current Tic-Tac-Toe board (3x3 grid or larger).
+            state (GameState): The current game state (3x3 grid or larger).
             renderer (Renderer): The instance responsible for rendering the game elements.
             logger (Logger): The instance responsible for logging the moves.
 
         Returns:
-            bool: True if the move was successfully made, False otherwise.
+            move (tuple or None): The row and column of the move if one was made, None otherwise.
         """
 
         # Check if the event is a mouse button click
@@ -29,17 +29,14 @@ class HumanPlayer(Player):
             col = mouseX // renderer.square_size
             row = mouseY // renderer.square_size
 
-            # Ensure the selected cell is within bounds and empty (denoted by 0)
-            if 0 <= row < len(board) and 0 <= col < len(board) and board[row][col] == 0:
-                board[row][col] = self.symbol  # Assign the human player's symbol
+            # Ensure the selected cell is within bounds and empty
+            cell = state._cell(row, col)
+            if 0 <= row < state.board_size and 0 <= col < state.board_size and state._is_legal(cell):
+                state._make(cell, self.symbol)  # Assign the human player's symbol
+                logger._log_move(state._position(cell), self.symbol)  # Log the move
 
-                # Log the move: Dynamic position calculation based on the board size
-                position = row * len(board) + col + 1
-
-                logger._log_move(position, self.symbol)  # Log the move
-
-                return True  # Return True indicating the move was made
+                return row, col  # The move that was made
         
-        return False  # Return False if no valid move was made
+        return None  # No valid move was made
 
 
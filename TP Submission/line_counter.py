@@ -0,0 +1,84 @@
+from bitboard import Bitboard  # For the list of winning lines whose pieces are counted
+
+
+class LineCounter:
+    """
+    Tracks how many pieces each player has on every winning line.
+
+    The counts are updated incrementally on every move, so detecting a win only looks at
+    the (at most 4) lines through the cell just played, and a draw is a check of the
+    number of empty cells instead of a scan of the whole board.
+    """
+
+    def __init__(self, board_size, win_length=None):
+        """
+        Initializes the counters for an empty board.
+
+        Args:
+            board_size (int): Size of the board (e.g., 3 for 3x3 or 5 for 5x5).
+            win_length (int or None): Pieces in a row needed to win, None for the board size.
+        """
+        self.board_size = board_size
+        self.lines = Bitboard._build_lines(board_size, win_length)
+        self.line_length = board_size if win_length is None else win_length  # Pieces needed on a line to win
+
+        # For each cell, the indices of the lines passing through it
+        self.lines_through = [[] for _ in range(board_size * board_size)]
+        for index, line in enumerate(self.lines):
+            for cell in line:
+                self.lines_through[cell].append(index)
+
+        self._reset()
+
+    def _reset(self):
+        """Clears the board, e.g. when a round is restarted."""
+        self.counts = [[0] * len(self.lines) for _ in range(3)]  # counts[player][line]; index 0 unused
+        self.empty_count = self.board_size * self.board_size
+        self.winner = 0  # 0 while nobody has completed a line
+
+    def _make(self, cell, player):
+        """
+        Records a move and checks whether it wins.
+
+        Args:
+            cell (int): Cell index (row * board_size + col).
+            player (int): The player who moved (1 or 2).
+
+        Returns:
+            bool: True if the move completed a line for the player.
+        """
+        counts = self.counts[player]
+        self.empty_count -= 1
+        won = False
+        for line in self.lines_through[cell]:
+            counts[line] += 1
+            if counts[line] == self.line_length:
+                won = True
+        if won:
+            self.winner = player
+        return won
+
+    def _unmake(self, cell, player):
+        """
+        Takes back a move recorded with _make.
+
+        Args:
+            cell (int): Cell index of the move.
+            player (int): The player who made the move.
+        """
+        counts = self.counts[player]
+        self.empty_count += 1
+        for line in self.lines_through[cell]:
+            counts[line] -= 1
+        self.winner = 0  # Play stops at the first win, so the position before it had no winner
+
+    def _copy(self):
+        """Returns an independent copy of the counters; the line tables are shared, they never change."""
+        clone = LineCounter.__new__(LineCounter)
+        clone.__dict__.update(self.__dict__)
+        clone.counts = [list(counts) for counts in self.counts]
+        return clone
+
+    def _is_full(self):
+        """Returns True if no empty cell is left."""
+        return self.empty_count == 0
@@ -0,0 +1,112 @@
+import argparse  # Command line of the load generator
+import asyncio
+import json
+import random
+import time
+from server import _percentile  # Same percentiles as the server's metrics
+
+
+class LoadClient:
+    """
+    Load generator for the game server: many concurrent clients each play random games.
+
+    Every client opens its own connection and plays its games one move at a time, timing
+    each move request from send to response (the AI's search included).
+    """
+
+    def __init__(self, clients=8, games=5, board_size=3, time_budget_ms=100, seed=0):
+        """
+        Args:
+            clients (int): Concurrent connections.
+            games (int): Games played by each connection.
+            board_size (int): Size of the board of every game.
+            time_budget_ms (int): Search time budget requested for every game.
+            seed (int): Seed of the random human moves.
+        """
+        self.clients = clients
+        self.games = games
+        self.board_size = board_size
+        self.time_budget_ms = time_budget_ms
+        self.seed = seed
+        self.latencies_ms = []
+        self.errors = 0
+
+    async def _request(self, reader, writer, request):
+        """Sends one request and returns the decoded response."""
+        writer.write(json.dumps(request).encode() + b"\n")
+        await writer.drain()
+        return json.loads(await reader.readline())
+
+    async def _play_client(self, index, connect):
+        """Plays this client's games on its own connection."""
+        rng = random.Random(self.seed * 1000 + index)
+        reader, writer = await connect()
+        try:
+            for _ in range(self.games):
+                state = await self._request(reader, writer, {'op': 'new_game', 'board_size': self.board_size,
+                                                             'time_budget_ms': self.time_budget_ms})
+                game = state['game']
+                while not state.get('over'):
+                    occupied = {tuple(move) for move in state['moves']}
+                    empty = [(row, col) for row in range(self.board_size) for col in range(self.board_size)
+                             if (row, col) not in occupied]
+                    row, col = rng.choice(empty)
+                    start = time.perf_counter()
+                    request = {'op': 'move', 'game': game, 'row': row, 'col': col}
+                    response = await self._request(reader, writer, request)
+                    if 'error' in response:
+                        self.errors += 1
+                        break
+                    self.latencies_ms.append((time.perf_counter() - start) * 1000)
+                    state = response
+                await self._request(reader, writer, {'op': 'close', 'game': game})
+        finally:
+            writer.close()
+
+    async def _run(self, connect):
+        """
+        Runs every client to completion.
+
+        Args:
+            connect (callable): Coroutine function returning a (reader, writer) pair.
+
+        Returns:
+            dict: Moves, errors, throughput in moves per second and p50/p99 move latency (ms),
+                  plus the server's own metrics.
+        """
+        start = time.perf_counter()
+        await asyncio.gather(*(self._play_client(index, connect) for index in range(self.clients)))
+        elapsed = time.perf_counter() - start
+
+        reader, writer = await connect()
+        metrics = await self._request(reader, writer, {'op': 'metrics'})
+        writer.close()
+
+        latencies = sorted(self.latencies_ms)
+        return {'moves': len(latencies), 'errors': self.errors, 'elapsed_s': elapsed,
+                'moves_per_s': len(latencies) / elapsed if elapsed else 0.0,
+                'p50_ms': _percentile(latencies, 0.5), 'p99_ms': _percentile(latencies, 0.99), 'server': metrics}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate load on a running game server.")
+    parser.add_argument('--host', default='127.0.0.1', help="TCP host of the server.")
+    parser.add_argument('--port', type=int, default=8765, help="TCP port of the server.")
+    parser.add_argument('--unix', default=None, help="Unix socket path of the server (instead of TCP).")
+    parser.add_argument('--clients', type=int, default=8, help="Concurrent connections.")
+    parser.add_argument('--games', type=int, default=5, help="Games per connection.")
+    parser.add_argument('--size', type=int, default=3, help="Board size.")
+    parser.add_argument('--budget-ms', type=int, default=100, help="Search time budget per AI move.")
+    args = parser.parse_args()
+
+    def connect_to_server():
+        """Opens a connection to the server given on the command line."""
+        if args.unix:
+            return asyncio.open_unix_connection(args.unix)
+        return asyncio.open_connection(args.host, args.port)
+
+    client = LoadClient(args.clients, args.games, args.size, args.budget_ms)
+    report = asyncio.run(client._run(connect_to_server))
+    print(f"{report['moves']} moves in {report['elapsed_s']:.2f}s: {report['moves_per_s']:.1f} moves/s, "
+          f"p50 {report['p50_ms']:.1f} ms, p99 {report['p99_ms']:.1f} ms, {report['errors']} errors")
+    print(f"Server: {json.dumps(report['server'])}")
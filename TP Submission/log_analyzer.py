@@ -0,0 +1,283 @@
+import argparse  # Command line of the analyzer
+import json  # JSON lines logs and the report output
+import mmap  # The log is read from the page cache, never loaded whole
+import os
+from array import array  # Compact per-round move storage
+from collections import Counter, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from line_counter import LineCounter  # Replays rounds to find the winner
+from logger import Logger  # Binary record layout
+
+# A round of the log: positions are numbered from 1 like in the log, players are 1 (X) or 2 (O)
+Round = namedtuple('Round', ['number', 'board_size', 'win_length', 'positions', 'players'])
+
+
+class LogParser:
+    """
+    Streaming parser for the log files written by Logger, in any of its formats.
+
+    The file is memory-mapped and read record by record, and rounds are yielded one at a
+    time as compact arrays, so memory use does not depend on the size of the log. A parser
+    can be limited to a byte range: it then yields the rounds whose header starts in the
+    range, which lets several processes share a file without overlap.
+    """
+
+    def __init__(self, path):
+        """
+        Opens and maps a log file; the format is detected from its first bytes.
+
+        Args:
+            path (str): Path of the log file.
+        """
+        self.path = path
+        self.file = open(path, 'rb')
+        self.size = os.path.getsize(path)
+        self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ) if self.size else b""
+        if self.data[:len(Logger.BINARY_MAGIC)] == Logger.BINARY_MAGIC:
+            self.log_format = 'binary'
+        elif self.data[:1] == b'{':
+            self.log_format = 'jsonl'
+        else:
+            self.log_format = 'text'
+
+    def _close(self):
+        """Unmaps and closes the log file."""
+        if self.size:
+            self.data.close()
+        self.file.close()
+
+    def _rounds(self, start=0, end=None):
+        """
+        Yields the rounds whose header starts at a byte offset in [start, end).
+
+        Moves logged before the first header of the range belong to a previous range and
+        are skipped; the last round is read to its end even past `end`.
+
+        Yields:
+            Round: The rounds of the range, in file order.
+        """
+        if not self.size:
+            return  # An empty log has no records, and nothing is mapped
+        end = self.size if end is None else end
+        current = None
+        for offset, player, position, number, board_size, win_length in self._records(start):
+            if player == 0:  # Round header
+                if current is not None:
+                    yield current
+                    current = None
+                if offset >= end:
+                    return
+                current = Round(number, board_size, win_length, array('H'), bytearray())
+            elif current is not None:
+                current.positions.append(position)
+                current.players.append(player)
+        if current is not None:
+            yield current
+
+    def _records(self, start):
+        """
+        Yields the records of the log from the first one starting at or after `start`.
+
+        Yields:
+            tuple: (offset, player, position, round number, board size, win length); player 0
+                   is a round header, and moves carry the values of the last header (or 0).
+        """
+        if self.log_format == 'binary':
+            yield from self._binary_records(start)
+        else:
+            yield from self._line_records(start)
+
+    def _line_records(self, start):
+        """Yields the records of a text or JSON lines log."""
+        data = self.data
+        if start > 0:
+            data.seek(start - 1)
+            data.readline()  # Finish the line that started before the range
+        else:
+            data.seek(0)
+        number = board_size = win_length = 0
+        is_text = self.log_format == 'text'
+        while True:
+            offset = data.tell()
+            line = data.readline()
+            if not line:
+                return
+            if is_text:
+                line = line.strip()
+                if line.startswith(b'Round'):  # b"Round 12 (Board Size: 3x3):" or b"... 7x7, Win Length: 4):"
+                    parts = line.split()
+                    number, board_size = int(parts[1]), int(parts[4].split(b'x')[0])
+                    win_length = int(parts[7].rstrip(b'):')) if len(parts) > 7 else board_size
+                    yield offset, 0, 0, number, board_size, win_length
+                elif line[:2] in (b'X:', b'O:'):
+                    player = 1 if line[0] == ord('X') else 2
+                    yield offset, player, int(line[2:]), number, board_size, win_length
+            else:
+                record = json.loads(line)
+                if record['type'] == 'round':
+                    number, board_size = record['round'], record['board_size']
+                    win_length = record.get('win_length', board_size)
+                    yield offset, 0, 0, number, board_size, win_length
+                else:
+                    yield offset, record['player'], record['position'], record['round'], board_size, win_length
+
+    def _binary_records(self, start):
+        """Yields the records of a binary log."""
+        record_size = Logger.BINARY_RECORD.size
+        first = Logger.BINARY_HEADER.size
+        offset = first + max(0, -(-(start - first) // record_size)) * record_size  # First record at or after start
+        unpack_from = Logger.BINARY_RECORD.unpack_from
+        win_length = 0
+        while offset + record_size <= self.size:
+            number, board_size, player, position = unpack_from(self.data, offset)
+            if player == 0:  # The position of a round header holds its win length, 0 for the board size
+                win_length = position or board_size
+            yield offset, player, position, number, board_size, win_length
+            offset += record_size
+
+
+class LogReport:
+    """
+    Aggregate statistics over rounds, mergeable across processes.
+
+    In the game the human plays X (player 1) and the AI plays O (player 2), so an X win is
+    a round where the human beat the AI. Outcomes are found by replaying the moves.
+    Statistics are grouped by variant, a (board size, win length) pair.
+    """
+
+    OUTCOMES = ('x_wins', 'o_wins', 'draws', 'unfinished', 'invalid')
+    MAX_TRACKED_LOSSES = 10000  # Distinct human-win move sequences kept per variant
+
+    def __init__(self, opening_plies=2):
+        """
+        Args:
+            opening_plies (int): Number of first moves that make up an opening.
+        """
+        self.opening_plies = opening_plies
+        self.outcomes = {}  # outcomes[variant] -> Counter of outcome names
+        self.total_moves = Counter()  # Moves of finished rounds per variant
+        self.finished = Counter()  # Finished rounds per variant
+        self.openings = {}  # openings[variant] -> Counter of opening move tuples
+        self.human_wins = {}  # human_wins[variant] -> Counter of move sequences won by X
+        self.line_counters = {}  # One LineCounter per variant, reset for each round
+
+    def _outcome(self, game_round):
+        """Replays a round and returns its outcome name."""
+        size = game_round.board_size
+        variant = (size, game_round.win_length)
+        if variant not in self.line_counters:
+            self.line_counters[variant] = LineCounter(size, game_round.win_length)
+        lines = self.line_counters[variant]
+        lines._reset()
+        occupied = set()
+        for position, player in zip(game_round.positions, game_round.players):
+            cell = position - 1
+            if not 0 <= cell < size * size or cell in occupied or lines.winner:
+                return 'invalid'
+            occupied.add(cell)
+            lines._make(cell, player)
+        if lines.winner:
+            return 'x_wins' if lines.winner == 1 else 'o_wins'
+        return 'draws' if lines._is_full() else 'unfinished'
+
+    def _add(self, game_round):
+        """Adds a round to the statistics."""
+        variant = (game_round.board_size, game_round.win_length)
+        outcome = self._outcome(game_round)
+        self.outcomes.setdefault(variant, Counter())[outcome] += 1
+        if outcome in ('x_wins', 'o_wins', 'draws'):
+            self.finished[variant] += 1
+            self.total_moves[variant] += len(game_round.positions)
+        if len(game_round.positions) >= self.opening_plies:
+            opening = tuple(game_round.positions[:self.opening_plies])
+            self.openings.setdefault(variant, Counter())[opening] += 1
+        if outcome == 'x_wins':
+            losses = self.human_wins.setdefault(variant, Counter())
+            sequence = tuple(game_round.positions)
+            if sequence in losses or len(losses) < self.MAX_TRACKED_LOSSES:
+                losses[sequence] += 1
+
+    def _merge(self, other):
+        """Adds the statistics of another report to this one."""
+        for variant, counter in other.outcomes.items():
+            self.outcomes.setdefault(variant, Counter()).update(counter)
+        self.total_moves.update(other.total_moves)
+        self.finished.update(other.finished)
+        for variant, counter in other.openings.items():
+            self.openings.setdefault(variant, Counter()).update(counter)
+        for variant, counter in other.human_wins.items():
+            self.human_wins.setdefault(variant, Counter()).update(counter)
+
+    def _summary(self, top=10):
+        """
+        Returns the report as a JSON-serializable dict, keyed by variant ("5x5", or "7x7/4"
+        when the win length is not the board size).
+
+        Args:
+            top (int): Number of openings and human-win sequences listed per variant.
+        """
+        summary = {}
+        for size, win_length in sorted(self.outcomes):
+            variant = (size, win_length)
+            outcomes = self.outcomes[variant]
+            rounds = sum(outcomes.values())
+            summary[f"{size}x{size}" + ("" if win_length == size else f"/{win_length}")] = {
+                'rounds': rounds,
+                'outcomes': {name: outcomes[name] for name in self.OUTCOMES},
+                'outcome_rates': {name: outcomes[name] / rounds for name in self.OUTCOMES},
+                'average_length': self.total_moves[variant] / self.finished[variant] if self.finished[variant] else None,
+                'openings': [{'moves': list(moves), 'count': count}
+                             for moves, count in self.openings.get(variant, Counter()).most_common(top)],
+                'human_beat_ai': [{'moves': list(moves), 'count': count}
+                                  for moves, count in self.human_wins.get(variant, Counter()).most_common(top)],
+            }
+        return summary
+
+
+def _analyze_range(path, start, end, opening_plies):
+    """Builds the report of the rounds starting in a byte range of a log (run in a worker)."""
+    parser = LogParser(path)
+    report = LogReport(opening_plies)
+    try:
+        for game_round in parser._rounds(start, end):
+            report._add(game_round)
+    finally:
+        parser._close()
+    return report
+
+
+def _analyze(path, workers=1, opening_plies=2):
+    """
+    Builds the report of a whole log, optionally split across processes by byte range.
+
+    Args:
+        path (str): Path of the log file.
+        workers (int): Number of processes; 1 analyzes in this process.
+        opening_plies (int): Number of first moves that make up an opening.
+
+    Returns:
+        LogReport: The merged report.
+    """
+    size = os.path.getsize(path)
+    if workers <= 1 or size == 0:
+        return _analyze_range(path, 0, size, opening_plies)
+    bounds = [size * index // workers for index in range(workers + 1)]
+    report = LogReport(opening_plies)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_analyze_range, path, bounds[index], bounds[index + 1], opening_plies)
+                   for index in range(workers)]
+        for future in futures:
+            report._merge(future.result())
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Summarize a Tic-Tac-Toe game log.")
+    parser.add_argument('path', nargs='?', default="tictactoe.txt", help="Log file written by Logger.")
+    parser.add_argument('--workers', type=int, default=1, help="Processes sharing the file by byte range.")
+    parser.add_argument('--opening-plies', type=int, default=2, help="Moves that make up an opening.")
+    parser.add_argument('--top', type=int, default=10, help="Openings and human wins listed per variant.")
+    args = parser.parse_args()
+
+    result = _analyze(args.path, args.workers, args.opening_plies)
+    print(json.dumps(result._summary(args.top), indent=2))
@@ -1,53 +1,199 @@
+import json  # Structured log format and round-counter sidecar
 import os
+import struct  # Packed binary log format
+import time
 
 class Logger:
-    """Handles the logging of moves to a file."""
+    """
+    Handles the logging of moves to a file.
+
+    The log file stays open and writes are buffered in memory. The buffer is flushed when a
+    round ends, when it grows past `buffer_size` characters, when `flush_interval` seconds
+    have passed since the last flush, and when the logger is closed.
+
+    Three formats are available:
+    - 'text': the human-readable layout (a "Round" header, then one X/O column per move),
+    - 'jsonl': one JSON object per line, {"type": "round", ...} then {"type": "move", ...},
+    - 'binary': a file header followed by fixed-size records (round, board size, player,
+      position); a record with player 0 starts a round.
+
+    The number of rounds in the file is kept in a small sidecar file (`<log>.idx`) together
+    with the size of the log when it was written, so the next round number is known at
+    startup without reading the log. If the sidecar is missing or out of date (e.g. the log
+    was edited), the log is scanned once and the sidecar rebuilt.
+    """
+
+    FORMATS = ('text', 'jsonl', 'binary')
+    MIN_BOARD_SIZE = 3
+    MAX_BOARD_SIZE = 15
+    BINARY_MAGIC = b'TTTL'
+    BINARY_HEADER = struct.Struct('<4sB')  # Magic, version
+    BINARY_RECORD = struct.Struct('<IBBH')  # Round, board size, player (0 starts a round), position
+
+    def __init__(self, path="tictactoe.txt", log_format='text', buffer_size=8192, flush_interval=5.0):
+        """
+        Initializes the Logger object with an empty move log and sets the first round number.
+
+        Args:
+            path (str): Log file, appended to.
+            log_format (str): 'text', 'jsonl' or 'binary'.
+            buffer_size (int): Buffered characters (or bytes) that trigger a flush.
+            flush_interval (float): Seconds after which buffered moves are flushed on the next move.
+        """
+        if log_format not in self.FORMATS:
+            raise ValueError(f"Unknown log format {log_format!r}, expected one of {self.FORMATS}.")
+        self.path = path
+        self.index_path = path + ".idx"
+        self.log_format = log_format
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.file = None  # Opened on the first flush, then kept open
+        self.buffer = []  # Pending chunks (str, or bytes for the binary format)
+        self.buffered = 0  # Length of the pending chunks
+        self.last_flush = time.monotonic()
+        self.rounds_logged = 0  # Round headers in the file, including the buffered ones
 
-    def __init__(self):
-        """Initializes the Logger object with an empty move log and sets the first round number."""
         self.move_log = []  # List to store the moves made during the game
         self.round_number = 1  # Initialize round number as 1
         self.new_round_started = True  # Always start with the first round header
         self.board_size = None  # Initially set to None, to be updated dynamically
+        self.win_length = None  # Marks in a row needed to win, set with the board size
         self._set_round_number()
 
     def _set_round_number(self):
-        """Sets the round number by checking how many rounds are already logged in the file."""
-        if os.path.exists("tictactoe.txt"):
-            with open("tictactoe.txt", "r") as file:
-                # Count how many rounds are already logged by looking for the "Round" keyword
-                round_count = sum(1 for line in file if "Round" in line)
-                self.round_number = round_count + 1  # Increment round number based on existing rounds
+        """Sets the round number from the sidecar index, scanning the log only if the index is stale."""
+        if not os.path.exists(self.path):
+            self.rounds_logged = 0
+        else:
+            log_size = os.path.getsize(self.path)
+            index = self._read_index()
+            if index is not None and index.get('log_bytes') == log_size and index.get('format') == self.log_format:
+                self.rounds_logged = index['rounds']
+            else:
+                self.rounds_logged = self._count_rounds()  # Legacy log or edited file: count once
+                self._write_index(log_size)
+        self.round_number = self.rounds_logged + 1  # Increment round number based on existing rounds
+
+    def _read_index(self):
+        """Returns the sidecar index as a dict, or None if it is missing or unreadable."""
+        try:
+            with open(self.index_path, "r") as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return None
+
+    def _write_index(self, log_size):
+        """Atomically rewrites the sidecar index for a log of `log_size` bytes."""
+        temporary = self.index_path + ".tmp"
+        with open(temporary, "w") as file:
+            json.dump({'rounds': self.rounds_logged, 'log_bytes': log_size, 'format': self.log_format}, file)
+        os.replace(temporary, self.index_path)
+
+    def _count_rounds(self):
+        """Counts the rounds already in the log file by reading it."""
+        if self.log_format == 'binary':
+            with open(self.path, "rb") as file:
+                data = file.read()
+            records = data[self.BINARY_HEADER.size:]
+            records = records[:len(records) - len(records) % self.BINARY_RECORD.size]
+            return sum(1 for _, _, player, _ in self.BINARY_RECORD.iter_unpack(records) if player == 0)
+        with open(self.path, "r") as file:
+            if self.log_format == 'jsonl':
+                return sum(1 for line in file if '"type": "round"' in line)
+            # Count how many rounds are already logged by looking for the "Round" keyword
+            return sum(1 for line in file if "Round" in line)
 
     def _log_move(self, position, player):
-        """Logs the current move to a file in vertical format."""
+        """Logs the current move to the buffer, writing the round header first if needed."""
         move = f"{'X' if player == 1 else 'O'}:{position}"
         self.move_log.append(move)
 
-        # Open the file "tictactoe.txt" in append mode to log the moves
-        with open("tictactoe.txt", "a") as file:
-            # Write round header only if this is the first move of the new round
-            if self.new_round_started:
-                if self.board_size is not None:  # Check if board_size has been set
-                    file.write(f"\nRound {self.round_number} (Board Size: {self.board_size}x{self.board_size}):\nX\tO\n")
-                    self.new_round_started = False  # Reset the flag after writing header
-                else:
-                    raise ValueError("Board size is not set before logging the move.")
-
-            # Log the current move
-            if player == 1:  # Player 1 is 'X'
-                file.write(f"{move}\t\n")
-            else:  # Player 2 is 'O'
-                file.write(f"\t{move}\n")
-
-    def _set_board_size(self, size):
-        """Sets the board size for logging purposes."""
-        if size not in [3, 5]:  # Assuming valid sizes are only 3 and 5
-            raise ValueError("Invalid board size. Only 3x3 or 5x5 boards are supported.")
+        # Write round header only if this is the first move of the new round
+        if self.new_round_started:
+            if self.board_size is None:  # Check if board_size has been set
+                raise ValueError("Board size is not set before logging the move.")
+            self._write(self._format_round())
+            self.rounds_logged += 1
+            self.new_round_started = False  # Reset the flag after writing header
+
+        # Log the current move
+        self._write(self._format_move(position, player))
+        if self.buffered >= self.buffer_size or time.monotonic() - self.last_flush >= self.flush_interval:
+            self._flush()
+
+    def _format_round(self):
+        """Returns the round header in the logger's format."""
+        # The win length is only written when it differs from the board size, so regular rounds keep their layout
+        full_line = self.win_length == self.board_size
+        if self.log_format == 'binary':  # The position field of a round record holds the win length
+            return self.BINARY_RECORD.pack(self.round_number, self.board_size, 0, 0 if full_line else self.win_length)
+        if self.log_format == 'jsonl':
+            header = {'type': 'round', 'round': self.round_number, 'board_size': self.board_size}
+            if not full_line:
+                header['win_length'] = self.win_length
+            return json.dumps(header) + "\n"
+        size = f"{self.board_size}x{self.board_size}" + ("" if full_line else f", Win Length: {self.win_length}")
+        return f"\nRound {self.round_number} (Board Size: {size}):\nX\tO\n"
+
+    def _format_move(self, position, player):
+        """Returns a move in the logger's format."""
+        if self.log_format == 'binary':
+            return self.BINARY_RECORD.pack(self.round_number, self.board_size, player, position)
+        if self.log_format == 'jsonl':
+            return json.dumps({'type': 'move', 'round': self.round_number, 'player': player,
+                               'position': position}) + "\n"
+        if player == 1:  # Player 1 is 'X'
+            return f"X:{position}\t\n"
+        return f"\tO:{position}\n"  # Player 2 is 'O'
+
+    def _write(self, chunk):
+        """Adds a chunk to the write buffer."""
+        self.buffer.append(chunk)
+        self.buffered += len(chunk)
+
+    def _flush(self):
+        """Writes the buffered moves to the log file and updates the sidecar index."""
+        self.last_flush = time.monotonic()
+        if not self.buffer:
+            return
+        if self.file is None:
+            if self.log_format == 'binary':
+                is_new = not os.path.exists(self.path) or os.path.getsize(self.path) == 0
+                self.file = open(self.path, "ab")
+                if is_new:
+                    self.file.write(self.BINARY_HEADER.pack(self.BINARY_MAGIC, 1))
+            else:
+                self.file = open(self.path, "a")
+        self.file.write((b"" if self.log_format == 'binary' else "").join(self.buffer))
+        self.file.flush()
+        self.buffer.clear()
+        self.buffered = 0
+        self._write_index(os.path.getsize(self.path))
+
+    def _close(self):
+        """Flushes the pending moves and closes the log file."""
+        self._flush()
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def _set_board_size(self, size, win_length=None):
+        """Sets the board size (and the number of marks in a row needed to win) for logging purposes."""
+        if not self.MIN_BOARD_SIZE <= size <= self.MAX_BOARD_SIZE:
+            raise ValueError(f"Invalid board size. Boards from {self.MIN_BOARD_SIZE}x{self.MIN_BOARD_SIZE} "
+                             f"to {self.MAX_BOARD_SIZE}x{self.MAX_BOARD_SIZE} are supported.")
+        if win_length is not None and not 1 <= win_length <= size:
+            raise ValueError(f"Invalid win length {win_length} for a {size}x{size} board.")
         self.board_size = size  # Dynamically set the board size
+        self.win_length = size if win_length is None else win_length
+
+    def _end_round(self):
+        """Marks the end of a round (win or draw): the round's moves are flushed to the file."""
+        self._flush()
 
     def _restart_round(self):
         """Restarts the round and prepares for a new round."""
+        self._flush()  # The previous round is complete
         self.round_number += 1  # Increment round number
         self.move_log.clear()  # Clear the move log
         self.new_round_started = True  # Mark that a new round has started
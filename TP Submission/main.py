@@ -1,21 +1,26 @@
 import pygame  # For initializing Pygame and handling the game window
 import sys  # For handling system exit
-import numpy as np  # For working with the board as a NumPy array
 from renderer import Renderer  # Importing the Renderer class for visual representation
 from logger import Logger  # Importing the Logger class to log moves
-from minimax_ai import AI  # Importing the AI class to handle AI's logic
+from game_state import GameState  # Importing the GameState class: board, move history and win/draw checks
 from humanPlayer import HumanPlayer  # Importing the HumanPlayer class to handle human player's moves
 from aiPlayer import AIPlayer  # Importing the AIPlayer class for AI-controlled moves
 
 class TicTacToe:
-    def __init__(self):
-        """Initialize the game with the chosen board size and necessary components."""
-        self.board_size = self.get_board_size()  # Prompt the user to select the board size (3x3 or 5x5)
+    def __init__(self, fps=60, block_when_idle=True):
+        """
+        Initialize the game with the chosen board size and necessary components.
+
+        Args:
+            fps (int or None): Frame rate cap of the game loop, None for no cap.
+            block_when_idle (bool): While waiting for the human (or after the game ended), sleep
+                                    until the next event instead of running frames.
+        """
+        self.board_size = self.get_board_size()  # Prompt the user to select the board size (3x3 to 15x15)
+        self.win_length = self.get_win_length()  # Prompt the user for the marks in a row needed to win
         self.square_size = 600 // self.board_size  # Dynamically adjust square size for rendering
-        self.board = np.zeros((self.board_size, self.board_size), dtype=int)  # Initialize the board based on size
-        
-        # Initialize the AI with the correct board size (ensure it's an integer)
-        self.ai = AI(self.board_size)  # Correctly passing the integer board size
+        # The board, its move history and the winner, checked once per move
+        self.state = GameState(self.board_size, self.win_length)
         
         self.game_over = False  # This initializes the game_over attribute
         self.current_player_idx = 0  # This initializes the current player index
@@ -26,42 +31,79 @@ class TicTacToe:
             'BLACK': (0, 0, 0),
             'RED': (250, 0, 0),
             'GREEN': (0, 255, 0),
-        })
+        }, fps=fps)
+        self.block_when_idle = block_when_idle
 
         # Initialize Logger
         self.logger = Logger()
-        self.logger._set_board_size(self.board_size)  # Set the board size in the logger
+        self.logger._set_board_size(self.board_size, self.win_length)  # Set the board size in the logger
         
         # Players: Human (symbol 1) and AI (symbol 2)
-        self.players = [HumanPlayer(1), AIPlayer(2, self.board_size, self.logger)]  # Pass board_size and logger to AIPlayer
+        self.players = [HumanPlayer(1), AIPlayer(2, self.board_size, self.logger, ponder=True,
+                                                          win_length=self.win_length)]  # Pass board_size and logger to AIPlayer
 
     def get_board_size(self):
-        """Prompt the user to select the board size (3x3 or 5x5)."""
+        """Prompt the user to select the board size (3x3 to 15x15)."""
         while True:
             try:
-                size = int(input("Choose board size: Enter 3 for 3x3 or 5 for 5x5: "))
-                if size in [3, 5]:
+                size = int(input("Choose board size: Enter a number from 3 to 15 (e.g. 3 for 3x3): "))
+                if 3 <= size <= 15:
                     return size
                 else:
-                    print("Invalid choice. Please enter 3 or 5.")
+                    print("Invalid choice. Please enter a number from 3 to 15.")
+            except ValueError:
+                print("Invalid input. Please enter a valid number.")
+
+    def get_win_length(self):
+        """Prompt the user for the number of marks in a row needed to win (default: the full row, 5 on large boards)."""
+        default = self.board_size if self.board_size <= 5 else 5
+        while True:
+            try:
+                answer = input(f"Marks in a row to win (3 to {self.board_size}, Enter for {default}): ").strip()
+                length = int(answer) if answer else default
+                if 3 <= length <= self.board_size:
+                    return length
+                else:
+                    print(f"Invalid choice. Please enter a number from 3 to {self.board_size}.")
             except ValueError:
                 print("Invalid input. Please enter a valid number.")
 
     def play(self):
         """Main game loop where the game runs continuously until a player wins or a draw occurs."""
         while True:
+            if self.block_when_idle and (self.game_over or isinstance(self.players[self.current_player_idx], HumanPlayer)):
+                events = [pygame.event.wait()] + pygame.event.get()  # Nothing changes until the next event
+                self.renderer._mark_idle()
+            else:
+                events = pygame.event.get()
+
             # Loop through all events in the Pygame window
-            for event in pygame.event.get():
+            for event in events:
                 # If the user closes the window, exit the game
                 if event.type == pygame.QUIT:
+                    for player in self.players:
+                        if isinstance(player, AIPlayer):
+                            player._close()  # Stop a search in progress so the process can exit
+                    self.logger._close()  # Write the buffered moves before exiting
+                    report = self.renderer._frame_report()
+                    print(f"Frames: {report['fps']:.1f} fps, {report['frame_ms_mean']:.2f} ms mean / "
+                          f"{report['frame_ms_max']:.2f} ms worst frame time, "
+                          f"{report['frame_interval_ms_max']:.2f} ms worst gap between frames, "
+                          f"{report['cpu_percent']:.1f}% CPU")
                     sys.exit()
 
                 # Check if 'r' key is pressed to restart the game
                 if event.type == pygame.KEYDOWN and event.key == pygame.K_r:
+                    for player in self.players:
+                        if isinstance(player, AIPlayer):
+                            player._cancel_move()  # Abandon a search of the old board before the board changes
                     self.renderer._restart_game()  # Clear visual elements on the screen
-                    self.board = np.zeros((self.board_size, self.board_size))  # Reset the board state
+                    self.state._reset()  # Reset the board state
                     self.game_over = False  # Reset the game over flag
                     self.current_player_idx = 0  # Reset to the first player
+                    for player in self.players:
+                        if isinstance(player, AIPlayer):
+                            player._new_game()  # Reset the AI's position but keep its engine warm
                     self.logger._restart_round()  # Inform logger about the round restart
                     print("Game restarted!")
 
@@ -71,45 +113,40 @@ class TicTacToe:
 
                     # If it's the human player's turn
                     if isinstance(current_player, HumanPlayer):
-                        if event.type == pygame.MOUSEBUTTONDOWN:
-                            mouseX, mouseY = event.pos
-                            col = mouseX // self.square_size
-                            row = mouseY // self.square_size
-
-                            if self.board[row][col] == 0:
-                                self.board[row][col] = current_player.symbol
-                                position = row * self.board_size + col + 1
-                                self.logger._log_move(position, current_player.symbol)
+                        move_made = current_player._make_move(event, self.state, self.renderer, self.logger)
+                        if move_made:
+                            row, col = move_made
+                            for player in self.players:
+                                if isinstance(player, AIPlayer):
+                                    player._notify_move(row, col, current_player.symbol)  # Incremental engine update
+                            self.end_turn(current_player, "Human")
 
-                                # Check for a win
-                                if self.ai._check_win(self.board):
-                                    print(f"Player {current_player.symbol} (Human) wins!")
-                                    self.game_over = True
-                                elif self.ai._is_board_full(self.board):
-                                    print("It's a draw!")
-                                    self.game_over = True
-                                else:
-                                    self.switch_player()
+            # If it's the AI player's turn: search in the background and check once per frame
+            current_player = self.players[self.current_player_idx]
+            if not self.game_over and isinstance(current_player, AIPlayer):
+                if not current_player._is_thinking():
+                    current_player._start_move(self.state)
+                if current_player._poll_move(self.state, self.logger):
+                    self.end_turn(current_player, "AI")
+            self.renderer._show_thinking(any(isinstance(player, AIPlayer) and player._is_thinking()
+                                             for player in self.players))
 
-                    # If it's the AI player's turn
-                    elif isinstance(current_player, AIPlayer):
-                        move_made = current_player._make_move(self.board, self.logger, self.renderer)
-                        if move_made:
-                            # Check for a win
-                            if self.ai._check_win(self.board):
-                                print(f"Player {current_player.symbol} (AI) wins!")
-                                self.game_over = True
-                            elif self.ai._is_board_full(self.board):
-                                print("It's a draw!")
-                                self.game_over = True
-                            else:
-                                self.switch_player()
+            # Render updates: only the cells that changed are redrawn
+            self.renderer._render(self.state._as_array())
+            self.renderer._tick()
 
-            # Render updates
-            self.renderer.screen.fill(self.renderer.colors['BLACK'])
-            self.renderer._draw_grid()
-            self.renderer._draw_figures(self.board)
-            pygame.display.update()
+    def end_turn(self, player, name):
+        """Ends the round if the player's move won or filled the board, otherwise passes the turn."""
+        if self.state.winner:  # Checked by the game state when the move was made
+            print(f"Player {player.symbol} ({name}) wins!")
+            self.game_over = True
+            self.logger._end_round()  # Flush the finished round to the log
+        elif self.state._is_full():
+            print("It's a draw!")
+            self.game_over = True
+            self.logger._end_round()  # Flush the finished round to the log
+        else:
+            self.switch_player()
 
     def switch_player(self):
         """Switch between human and AI players."""
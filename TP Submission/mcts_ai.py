@@ -0,0 +1,276 @@
+import math
+import random
+import time  # For the per-move time budget
+from bitboard import Bitboard  # Position and winning segments shared with the minimax engine
+from search_stats import SearchStats  # Optional per-move search statistics
+
+
+class MCTSNode:
+    """A node of the search tree: the position reached after `player` played `move`."""
+
+    __slots__ = ('move', 'player', 'children', 'untried', 'visits', 'wins', 'winner')
+
+    def __init__(self, move, player, winner=None):
+        """
+        Args:
+            move (int or None): Cell played to reach the node, None for a root without a last move.
+            player (int): The player who played the move (1 or 2).
+            winner (int or None): For a finished game, the winner (0 for a draw); None otherwise.
+        """
+        self.move = move
+        self.player = player
+        self.children = {}  # Cell -> MCTSNode, for the moves already expanded
+        self.untried = None  # Cells not expanded yet, filled on the first visit
+        self.visits = 0
+        self.wins = 0.0  # Playout results from `player`'s point of view: 1 per win, 0.5 per draw
+        self.winner = winner
+
+
+class MCTS:
+    """
+    Monte Carlo Tree Search (UCT) engine, with the same interface as the minimax AI.
+
+    Each iteration walks down the tree picking the child with the best UCB1 score, adds
+    one new node, finishes the game with random moves (a playout) and credits the result
+    to every node on the path. The move played is the most visited child of the root.
+
+    Playouts work on the bit masks of the position: the empty cells are shuffled once and
+    played in order, and a win is detected with the precomputed segment masks through the
+    cell just played, so no board array is copied or scanned.
+
+    The tree is kept between moves: the moves of both players passed to _notify_move walk
+    the root down to the matching child, so the statistics gathered for that subtree are
+    reused by the next search. Like the minimax AI, the engine plays as player 2.
+    """
+
+    DEFAULT_ITERATIONS = 10000  # Budget when neither iterations nor a time budget are given
+    TIME_CHECK_INTERVAL = 64  # Iterations between two reads of the clock
+
+    def __init__(self, board_size, time_budget_ms=None, iterations=None, exploration=1.4, win_length=None,
+                 radius=None, max_nodes=1 << 20, seed=None, collect_stats=False):
+        """
+        Initializes the engine for the given board size.
+
+        Args:
+            board_size (int): Size of the board (e.g. 3 for 3x3, up to 15 for 15x15).
+            time_budget_ms (int or None): Time allowed per move in milliseconds.
+            iterations (int or None): Playouts per move. With a time budget as well, the search
+                                      stops at whichever limit comes first.
+            exploration (float): UCB1 exploration constant; higher values try more moves.
+            win_length (int or None): Pieces in a row needed to win, None for the board size.
+            radius (int or None): Only expand empty cells within this many rows and columns of a
+                                  piece. None uses 2 on boards larger than 5x5 and every empty
+                                  cell otherwise. Playouts always use every empty cell.
+            max_nodes (int): Tree size above which no new nodes are added (playouts go on).
+            seed (int or None): Seed of the playout random generator.
+            collect_stats (bool): Record per-move search statistics in self.stats (a SearchStats).
+        """
+        if not isinstance(board_size, int):
+            raise ValueError(f"board_size must be an integer, but got {type(board_size)}.")
+        if time_budget_ms is not None and time_budget_ms <= 0:
+            raise ValueError("time_budget_ms must be positive.")
+        if iterations is not None and iterations <= 0:
+            raise ValueError("iterations must be positive.")
+        self.board_size = board_size
+        self.win_length = board_size if win_length is None else win_length
+        self.radius = (2 if board_size > 5 else None) if radius is None else radius
+        self.time_budget_ms = time_budget_ms
+        self.iterations = self.DEFAULT_ITERATIONS if iterations is None and time_budget_ms is None else iterations
+        self.exploration = exploration
+        self.max_nodes = max_nodes
+        self.random = random.Random(seed)
+
+        self.stop_requested = False  # Set from another thread to abandon the current search
+        self.nodes = 0  # Playouts of the current search
+        self.completed_depth = 0  # Deepest node reached by the current search
+        self.best_score = None  # Win rate of the move returned by the last search
+        self.stats = SearchStats(board_size) if collect_stats else None
+
+        self.position = Bitboard(board_size, self.win_length)  # Current game position, see _new_game/_notify_move
+        self.root = None  # Tree of the current position, None until the next search builds it
+        self.tree_size = 0  # Nodes in the tree below the root (approximated after a move, see _notify_move)
+
+    def _close(self):
+        """Nothing to stop: the engine has no worker processes."""
+
+    def _new_game(self):
+        """Starts a new game from an empty board, dropping the tree."""
+        self.position = Bitboard(self.board_size, self.win_length)
+        self.root = None
+
+    def _notify_move(self, cell, player):
+        """
+        Applies a move (by either player) to the engine's own copy of the position and
+        moves the root of the tree to the matching child, if it was expanded.
+
+        Args:
+            cell (int): Cell index (row * board_size + col) of the move.
+            player (int): The player who moved (1 or 2).
+        """
+        self.position._make(cell, player)
+        child = self.root.children.get(cell) if self.root is not None else None
+        if child is None or child.player != player:
+            self.root = None
+            return
+        self.root = child
+        self.tree_size = child.visits  # Each playout added at most one node, the rest of the tree is dropped
+
+    def _best_move(self, board=None):
+        """
+        Finds the best move for the AI (player 2) with Monte Carlo Tree Search.
+
+        Args:
+            board (ndarray or None): Board to search. None searches the position kept up to
+                                     date by _new_game/_notify_move; a board replaces that
+                                     position and starts a new tree.
+
+        Returns:
+            tuple or None: (row, col) of the most visited root move, None on a full board.
+        """
+        if board is not None:
+            self.position = Bitboard._from_array(board, self.win_length)
+            self.root = None
+        position = self.position
+        if position._is_full() or position._winner():
+            return None
+
+        start = time.perf_counter()
+        deadline = start + self.time_budget_ms / 1000 if self.time_budget_ms is not None else None
+        self.nodes = 0
+        self.completed_depth = 0
+        stats = self.stats
+        if stats is not None:
+            stats._begin_move()
+
+        moves, forced = self._root_moves(position)
+        if forced or self.root is None or self.root.player != 1:
+            self.root = MCTSNode(None, 1)  # The opponent (player 1) moved last
+            self.tree_size = 1
+        root = self.root
+        if root.untried is None:
+            root.untried = moves
+
+        iterations = self.iterations
+        while iterations is None or self.nodes < iterations:
+            self._iterate(root, position)
+            self.nodes += 1
+            if self.nodes % self.TIME_CHECK_INTERVAL == 0:
+                if self.stop_requested or (deadline is not None and time.perf_counter() >= deadline):
+                    break
+
+        best = max(root.children.values(), key=lambda child: child.visits)
+        self.best_score = best.wins / best.visits
+        if stats is not None:
+            stats._end_move(divmod(best.move, self.board_size), round(self.best_score, 4), self.nodes,
+                            self.completed_depth, time.perf_counter() - start)
+        return divmod(best.move, self.board_size)
+
+    def _root_moves(self, position):
+        """
+        Returns the moves searched at the root: an immediate win if there is one, otherwise
+        the cells blocking the opponent's immediate wins, otherwise every candidate cell.
+
+        Returns:
+            tuple: (cells, forced) where forced is True for a win or blocks; a reused tree
+                   does not know about the restriction, so it is rebuilt then.
+        """
+        cells = position._candidate_cells(self.radius)
+        wins = position._winning_cells(2, cells)
+        if wins:
+            return wins[:1], True
+        blocks = position._winning_cells(1, cells)
+        if blocks:
+            return blocks, True
+        self.random.shuffle(cells)
+        return cells, False
+
+    def _iterate(self, root, position):
+        """Runs one selection, expansion, playout and backpropagation pass from the root."""
+        masks = list(position.masks)  # The tree walk plays on a copy of the masks
+        masks_through = position.masks_through
+        node = root
+        path = [node]
+
+        # Selection: descend through fully expanded nodes
+        while node.winner is None and not node.untried and node.children:
+            log_visits = math.log(node.visits)
+            exploration = self.exploration
+            best_child, best_value = None, -1.0
+            for child in node.children.values():
+                value = child.wins / child.visits + exploration * math.sqrt(log_visits / child.visits)
+                if value > best_value:
+                    best_child, best_value = child, value
+            node = best_child
+            masks[node.player] |= 1 << node.move
+            path.append(node)
+
+        # Expansion: add one child of the node, unless the game is over there
+        if node.winner is None:
+            if node.untried is None:
+                node.untried = self._expansion_moves(masks)
+            if node.untried and self.tree_size < self.max_nodes:
+                cell = node.untried.pop()
+                player = 3 - node.player
+                masks[player] |= 1 << cell
+                placed = masks[player]
+                winner = None
+                for win_mask in masks_through[cell]:
+                    if placed & win_mask == win_mask:
+                        winner = player
+                        break
+                if winner is None and masks[1] | masks[2] == position.full_mask:
+                    winner = 0
+                node = MCTSNode(cell, player, winner)
+                path[-1].children[cell] = node
+                path.append(node)
+                self.tree_size += 1
+        if len(path) - 1 > self.completed_depth:
+            self.completed_depth = len(path) - 1
+
+        # Playout, then backpropagation
+        result = node.winner if node.winner is not None else self._playout(masks, 3 - node.player, position)
+        for visited in path:
+            visited.visits += 1
+            if result == visited.player:
+                visited.wins += 1.0
+            elif result == 0:
+                visited.wins += 0.5
+
+    def _expansion_moves(self, masks):
+        """Returns the cells to expand below a node, in random order."""
+        occupied = masks[1] | masks[2]
+        if self.radius is None or not occupied:
+            empty = self.position.full_mask & ~occupied
+            cells = [cell for cell in range(self.position.num_cells) if empty >> cell & 1]
+        else:
+            scratch = self.position._copy()
+            scratch.masks = list(masks)
+            cells = scratch._candidate_cells(self.radius)
+        self.random.shuffle(cells)
+        return cells
+
+    def _playout(self, masks, to_move, position):
+        """
+        Finishes the game with random moves.
+
+        Args:
+            masks (list): Bit masks of the position, modified in place.
+            to_move (int): The player to move.
+            position (Bitboard): Any position of the game, for its segment masks.
+
+        Returns:
+            int: The winner, or 0 for a draw.
+        """
+        empty = position.full_mask & ~(masks[1] | masks[2])
+        cells = [cell for cell in range(position.num_cells) if empty >> cell & 1]
+        self.random.shuffle(cells)
+        masks_through = position.masks_through
+        player = to_move
+        for cell in cells:
+            placed = masks[player] | 1 << cell
+            masks[player] = placed
+            for win_mask in masks_through[cell]:
+                if placed & win_mask == win_mask:
+                    return player
+            player = 3 - player
+        return 0
@@ -1,135 +1,539 @@
+import time  # For the per-move time budget
+from bitboard import Bitboard  # Bit mask representation used by the search
+from transposition import TranspositionTable  # Cache of already searched positions
+from move_ordering import MoveOrderer  # Hash move, killer and history move ordering
+from evaluator import LineEvaluator  # Vectorized open-line heuristic
+from search_stats import SearchStats  # Optional per-move search statistics
+
+
+class SearchTimeout(Exception):
+    """Raised inside the search when the per-move time budget is used up."""
+
+
 class AI:
     """AI logic for Tic-Tac-Toe, implementing the minimax algorithm with optimizations."""
+
+    WIN_SCORE = 1000000  # Score of a win found right after the root move, far above any heuristic score
+    MAX_PLY = 1000  # Scores within MAX_PLY of WIN_SCORE are wins/losses at a known distance
+    TIME_CHECK_INTERVAL = 256  # Nodes between two reads of the clock
+    ASPIRATION_WINDOW = 10  # Half-width of the root window around the previous iteration's score
     
-    def __init__(self, board_size):
+    def __init__(self, board_size, tt_size=1 << 18, tt_policy='lru', time_budget_ms=None, max_depth=None,
+                 move_ordering=True, workers=1, book=None, collect_stats=False, win_length=None, radius=None):
         """
         Initializes the AI with the given board size.
         
         Args:
-            board_size (int): Size of the board (either 3 for 3x3 or 5 for 5x5).
+            board_size (int): Size of the board (e.g. 3 for 3x3, up to 15 for 15x15).
+            tt_size (int): Maximum number of positions kept in the transposition table.
+            tt_policy (str): Transposition table replacement policy, 'lru' or 'depth'.
+            time_budget_ms (int or None): Time allowed per move in milliseconds. None searches
+                                          every depth up to max_depth without a deadline.
+            max_depth (int or None): Deepest iteration of iterative deepening. Defaults to 5
+                                     without a time budget and to the whole game with one.
+            move_ordering (bool): Order moves (hash move, PV, killers, history) and use PVS with
+                                  aspiration windows. False searches in row-major order with plain
+                                  alpha-beta, which is useful to measure the node reduction.
+            workers (int): Number of processes searching root moves in parallel. 1 searches
+                           serially in this process; more returns the same moves as the serial
+                           search at the same depth.
+            book (OpeningBook or None): Book of precomputed moves consulted before searching.
+            collect_stats (bool): Record per-move search statistics in self.stats (a SearchStats).
+            win_length (int or None): Pieces in a row needed to win, None for the board size.
+            radius (int or None): Only search empty cells within this many rows and columns of a
+                                  piece, trying immediate wins and blocks first. None uses 2 on
+                                  boards larger than 5x5 and searches every empty cell otherwise.
         """
         if not isinstance(board_size, int):
             raise ValueError(f"board_size must be an integer, but got {type(board_size)}.")
+        if time_budget_ms is not None and time_budget_ms <= 0:
+            raise ValueError("time_budget_ms must be positive.")
         self.board_size = board_size
-        self.depth_limit = 3 if board_size == 3 else 4  # Depth limit for faster AI moves
-        self.max_depth = 5  # Max depth for iterative deepening
+        self.win_length = board_size if win_length is None else win_length
+        self.time_budget_ms = time_budget_ms
+        self.radius_setting = radius  # As passed; None derives the radius from the board size
+        self.max_depth_setting = max_depth  # As passed; None derives the max depth from the board size
+        self._set_size_limits()
+        self.tt = TranspositionTable(tt_size, tt_policy)  # Shared by every iteration of _best_move
+
+        self.deadline = None  # perf_counter() value at which the current search must stop
+        self.nodes = 0  # Nodes visited by the current search
+        self.next_time_check = 0  # Node count at which the clock is read next
+        self.stop_requested = False  # Set from another thread to abandon the current search
+        self.stop_check = None  # Optional callable polled with the clock; True abandons the search
+        self.pv = []  # Principal variation (cells) of the last completed iteration
+        self.pv_table = []  # pv_table[depth] holds the best line found below a node at that depth
+        self.follow_pv = False  # True while the search is still on the previous iteration's PV
+        self.completed_depth = 0  # Depth of the last completed iteration
+        self.best_score = None  # Score of the move returned by the last completed iteration
+        self.nodes_per_depth = {}  # Nodes searched by each completed iteration of the last move
+        self.move_ordering = move_ordering
+        self.orderer = MoveOrderer(board_size, self.win_length)  # Killers and history persist across iterations
+        self.evaluator = LineEvaluator(board_size, win_length=self.win_length,
+                                       score_limit=self.WIN_SCORE - self.MAX_PLY - 1)
+
+        self.position = Bitboard(board_size, self.win_length)  # Current game position, see _new_game/_notify_move
+        self.book = book
+        self.stats = SearchStats(board_size) if collect_stats else None  # None keeps the hot loop free of bookkeeping
 
-    def _update_board_size(self, new_size):
-        """Updates the board size for the AI."""
+        self.parallel = None  # Process pool for the root search, only with several workers
+        if workers > 1:
+            from parallel_search import ParallelSearch  # Imported here: parallel_search imports this module
+            self.parallel = ParallelSearch(workers)
+
+    def _close(self):
+        """Stops the worker processes of the parallel search, if any."""
+        if self.parallel is not None:
+            self.parallel._shutdown()
+            self.parallel = None
+
+    def _update_board_size(self, new_size, win_length=None):
+        """Updates the board size (and the number of pieces in a row needed to win) for the AI."""
         if not isinstance(new_size, int):
             raise ValueError(f"new_size must be an integer, but got {type(new_size)}.")
         self.board_size = new_size
-        self.depth_limit = 3 if new_size == 3 else 4
+        self.win_length = new_size if win_length is None else win_length
+        self._set_size_limits()
+        self.tt._clear()  # Stored positions belong to the old board size
+        self.orderer = MoveOrderer(new_size, self.win_length)
+        self.evaluator = LineEvaluator(new_size, win_length=self.win_length, score_limit=self.WIN_SCORE - self.MAX_PLY - 1)
+        if self.stats is not None:
+            self.stats = SearchStats(new_size)
+        self._new_game()
+
+    def _set_size_limits(self):
+        """Sets the radius and the max depth for the board size, unless they were given explicitly."""
+        radius, max_depth = self.radius_setting, self.max_depth_setting
+        self.radius = (2 if self.board_size > 5 else None) if radius is None else radius
+        if max_depth is None:
+            max_depth = 5 if self.time_budget_ms is None else self.board_size * self.board_size
+        self.max_depth = max_depth  # Max depth for iterative deepening
+
+    def _new_game(self):
+        """
+        Starts a new game from an empty board.
+
+        Only the position is reset: the transposition table, the history scores and the
+        precomputed tables stay warm, since they remain valid from one game to the next.
+        """
+        self.position = Bitboard(self.board_size, self.win_length)
+
+    def _notify_move(self, cell, player):
+        """
+        Applies a move (by either player) to the engine's own copy of the position.
+
+        Args:
+            cell (int): Cell index (row * board_size + col) of the move.
+            player (int): The player who moved (1 or 2).
+        """
+        self.position._make(cell, player)
+
+    def _best_move(self, board=None, time_budget_ms=None):
+        """
+        Finds the best move for the AI using iterative deepening.
+
+        Each iteration searches one ply deeper than the previous one, trying the previous
+        principal variation first and starting from an aspiration window around the previous
+        score. With a time budget, an iteration that runs past the deadline is abandoned and
+        the move of the last completed iteration is returned.
+
+        Args:
+            board (ndarray or None): Board to search. None searches the position kept up to
+                                     date by _new_game/_notify_move; a board replaces that
+                                     position (it is converted once at the root).
+            time_budget_ms (int or None): Time budget of this search only, e.g. one request of
+                                          a shared engine. None uses the engine's own budget.
+        """
+        if board is not None:
+            self.position = Bitboard._from_array(board, self.win_length)  # The search never touches the array
+        bitboard = self.position
+        empty_count = len(bitboard._empty_cells())
+        if empty_count == 0:
+            return None
 
-    def _best_move(self, board):
-        """Finds the best move for the AI using iterative deepening."""
+        if time_budget_ms is None:
+            time_budget_ms = self.time_budget_ms
+        start = time.perf_counter()
+        self.deadline = None  # The first iteration always completes so that there is a move to play
+        self.nodes = 0
+        self.next_time_check = self.TIME_CHECK_INTERVAL
+        self.nodes_per_depth = {}
+        self.pv = []
+        self.completed_depth = 0
+        self.best_score = None
+        stats = self.stats
+        if stats is not None:
+            stats._begin_move()
+
+        if self.book is not None:
+            hit = self.book._lookup(bitboard)
+            if hit is not None:  # Precomputed move, no search needed
+                best_move, self.best_score = hit
+                if stats is not None:
+                    stats._end_move(best_move, self.best_score, 0, 0, time.perf_counter() - start, 'book')
+                return best_move
+
+        self.orderer._new_search()
+        self.tt._new_search()  # Deep entries of earlier moves may now be replaced
         best_move = None
-        best_score = -float('inf')
-        
-        for depth in range(1, self.max_depth + 1):  # Iterative deepening
-            move, score = self._iterative_deepening(board, depth)
-            if score > best_score:
-                best_score = score
-                best_move = move
-        
+        score = None
+
+        for depth in range(1, min(self.max_depth, empty_count) + 1):  # Iterative deepening
+            nodes_before = self.nodes
+            iteration_start = time.perf_counter()
+            try:
+                # Search a copy: an aborted iteration leaves its moves on the board
+                if self.parallel is not None:
+                    move, score = self.parallel._search_root(self, bitboard, depth, self.deadline)
+                elif self.move_ordering and score is not None and abs(score) < self.WIN_SCORE - self.MAX_PLY:
+                    alpha, beta = score - self.ASPIRATION_WINDOW, score + self.ASPIRATION_WINDOW
+                    previous_pv = self.pv
+                    move, score = self._iterative_deepening(bitboard._copy(), depth, alpha, beta)
+                    if score <= alpha or score >= beta:  # Outside the window: the score is only a bound
+                        self.pv = previous_pv  # The failed search's line is not a real PV
+                        move, score = self._iterative_deepening(bitboard._copy(), depth)
+                else:
+                    move, score = self._iterative_deepening(bitboard._copy(), depth)
+            except SearchTimeout:
+                break
+            best_move = move
+            self.best_score = score
+            self.completed_depth = depth
+            self.nodes_per_depth[depth] = self.nodes - nodes_before
+            if stats is not None:
+                stats._record_iteration(depth, self.nodes - nodes_before, score, time.perf_counter() - iteration_start)
+            if abs(score) > self.WIN_SCORE - self.MAX_PLY:
+                break  # Forced win or loss found; searching deeper cannot change it
+            if time_budget_ms is not None:
+                self.deadline = start + time_budget_ms / 1000
+                if time.perf_counter() >= self.deadline:
+                    break
+
+        self.deadline = None
+        if stats is not None:
+            stats._end_move(best_move, self.best_score, self.nodes, self.completed_depth, time.perf_counter() - start)
         return best_move
 
-    def _iterative_deepening(self, board, depth):
-        """Perform the minimax search up to the specified depth."""
+    def _iterative_deepening(self, bitboard, depth, alpha=-float('inf'), beta=float('inf')):
+        """
+        Perform the minimax search up to the specified depth.
+
+        Args:
+            bitboard (Bitboard): The root position, with the AI to move.
+            depth (int): Depth of this iteration.
+            alpha (float): Lower bound of the root window.
+            beta (float): Upper bound of the root window.
+
+        Returns:
+            tuple: The best move as (row, col) and its score. If the score is outside the
+                   window it is only a bound and the move should not be trusted.
+        """
         best_move = None
         best_score = -float('inf')
-        
-        for row in range(self.board_size):
-            for col in range(self.board_size):
-                if board[row][col] == 0:  # Only consider empty spots
-                    board[row][col] = 2  # AI's move
-                    score = self._minimax(board, 0, False, -float('inf'), float('inf'), depth)
-                    board[row][col] = 0  # Reset the spot
-                    if score > best_score:
-                        best_score = score
-                        best_move = (row, col)
-        
+        best_line = []
+        self._start_iteration(depth)
+
+        for index, cell in enumerate(self._root_moves(bitboard)):
+            # Principal variation search: after the first move, prove with a null window that a move is not better
+            null_window = index > 0 and self.move_ordering
+            score = self._search_root_move(bitboard, cell, depth, alpha, beta, null_window)
+            self.follow_pv = False  # Only the first root move continues along the previous PV
+            if score > best_score:
+                best_score = score
+                best_move = divmod(cell, self.board_size)  # Cell index back to (row, col)
+                best_line = [cell] + self.pv_table[0]
+            alpha = max(alpha, score)
+            if beta <= alpha:
+                break  # Fail high, the caller re-searches with a full window
+
+        self.pv = best_line
         return best_move, best_score
 
-    def _minimax(self, board, depth, is_maximizing, alpha, beta, max_depth):
-        """Minimax algorithm with alpha-beta pruning."""
-        if depth >= max_depth:
-            return self._evaluate_board(board)  # Use heuristic evaluation
-        
-        # Check for terminal conditions (win, loss, draw)
-        winner = self._check_win(board)
-        if winner == 2:  # AI wins
-            return 10 - depth
-        elif winner == 1:  # Human wins
-            return depth - 10
-        elif self._is_board_full(board):  # Draw
+    def _root_moves(self, bitboard):
+        """
+        Returns the root moves in search order: immediate wins and blocks (on boards with a
+        restricted neighborhood), then the previous iteration's best move, then by static score.
+        """
+        cells = bitboard._candidate_cells(self.radius)  # Only consider empty spots
+        if self.move_ordering:
+            cells = self.orderer._order_root(cells, self.pv[0] if self.pv else None, self._threats(bitboard, cells, 2))
+        return cells
+
+    def _threats(self, bitboard, cells, player):
+        """
+        Returns the moves that win on the spot for the player, then those that block an
+        immediate win of the opponent. Only computed when move generation is restricted to
+        a neighborhood (large boards); otherwise the regular ordering is left unchanged.
+        """
+        if self.radius is None:
+            return []
+        return bitboard._winning_cells(player, cells) + bitboard._winning_cells(3 - player, cells)
+
+    def _start_iteration(self, depth):
+        """Resets the per-iteration PV bookkeeping before searching the root moves."""
+        self.pv_table = [[] for _ in range(depth + 2)]
+        self.follow_pv = bool(self.pv)
+
+    def _search_root_move(self, bitboard, cell, depth, alpha, beta, null_window):
+        """
+        Plays one root move for the AI and searches the position behind it.
+
+        Args:
+            bitboard (Bitboard): The root position; it is restored before returning.
+            cell (int): The root move.
+            depth (int): Depth of the iteration.
+            alpha (float): Lower bound of the window.
+            beta (float): Upper bound of the window.
+            null_window (bool): Search with the null window (alpha, alpha + 1) first and only
+                                re-search with the full window if the move beats alpha.
+
+        Returns:
+            int: Score of the move; the line below it is left in pv_table[0].
+        """
+        bitboard._make(cell, 2)  # AI's move
+        if bitboard._is_win_at(cell, 2):  # Immediate win, nothing to search
+            score = self.WIN_SCORE
+            self.pv_table[0] = []
+        elif not null_window:
+            score = self._minimax(bitboard, 0, False, alpha, beta, depth)
+        else:
+            score = self._minimax(bitboard, 0, False, alpha, alpha + 1, depth)
+            if alpha < score < beta:
+                score = self._minimax(bitboard, 0, False, alpha, beta, depth)
+        bitboard._unmake(cell, 2)  # Reset the spot
+        return score
+
+    def _check_time(self):
+        """
+        Raises SearchTimeout once the deadline has passed or a stop was requested (only
+        checked every few nodes).
+        """
+        if self.stop_requested or (self.deadline is not None and time.perf_counter() >= self.deadline):
+            raise SearchTimeout()
+        if self.stop_check is not None and self.stop_check():
+            raise SearchTimeout()
+
+    def _pv_move(self, depth):
+        """
+        Returns the previous iteration's PV move for a node at this depth, if still on the PV.
+        """
+        if self.follow_pv:
+            ply = depth + 1  # Index in the PV of the move played from a node at this depth
+            if ply < len(self.pv):
+                return self.pv[ply]
+            self.follow_pv = False  # Past the end of the PV
+        return None
+
+    def _minimax(self, bitboard, depth, is_maximizing, alpha, beta, max_depth):
+        """
+        Minimax algorithm with alpha-beta pruning over a Bitboard.
+
+        Only the player who just moved can have completed a line, so wins are detected
+        right after each move instead of rescanning both players at every node. Interior
+        nodes are looked up in and stored to the transposition table, and with move ordering
+        enabled every move after the first is searched with a null window first (PVS).
+        """
+        self.nodes += 1
+        if self.nodes >= self.next_time_check:  # Frontier nodes add several leaves at once
+            self.next_time_check = self.nodes + self.TIME_CHECK_INTERVAL
+            self._check_time()
+        self.pv_table[depth] = []  # No line below this node until a best move is found
+
+        if bitboard._is_full():  # Draw (the move that filled the board was not a win)
             return 0
 
+        if depth >= max_depth:
+            return self._evaluate_board(bitboard)  # Use heuristic evaluation
+
+        # A stored score is only reused at exactly the same remaining depth: heuristic scores
+        # depend on where the horizon is, and this keeps results independent of search history
+        remaining = max_depth - depth
+        player = 2 if is_maximizing else 1
+        key, symmetry = bitboard._canonical(player)
+        entry = self.tt._probe(key)
+        hash_move = None
+        if entry is not None:
+            if entry[3] is not None:
+                hash_move = bitboard.zobrist.inverse_permutations[symmetry][entry[3]]
+            if entry[0] == remaining:
+                score = self._score_from_tt(entry[1], depth)
+                bound = entry[2]
+                if bound == TranspositionTable.EXACT:
+                    return score
+                if bound == TranspositionTable.LOWER and score >= beta:
+                    return score
+                if bound == TranspositionTable.UPPER and score <= alpha:
+                    return score
+
+        if remaining == 1:  # Every child is a leaf: score them all in one batch
+            return self._search_frontier(bitboard, depth, is_maximizing, beta if is_maximizing else alpha, key, symmetry)
+
+        cells = bitboard._candidate_cells(self.radius)
+        if self.move_ordering:
+            first_moves = self._threats(bitboard, cells, player) + [self._pv_move(depth), hash_move]
+            cells = self.orderer._order(cells, depth, player, first_moves)
+
+        original_alpha, original_beta = alpha, beta
+        pv_table = self.pv_table
+        best_cell = None
+        first = True
         if is_maximizing:  # AI's turn
             best_score = -float('inf')
-            for row in range(self.board_size):
-                for col in range(self.board_size):
-                    if board[row][col] == 0:
-                        board[row][col] = 2  # AI's move
-                        score = self._minimax(board, depth + 1, False, alpha, beta, max_depth)
-                        board[row][col] = 0  # Reset the spot
-                        best_score = max(score, best_score)
-                        alpha = max(alpha, score)
-                        if beta <= alpha:
-                            break  # Prune the branch
-            return best_score
+            for cell in cells:
+                bitboard._make(cell, 2)  # AI's move
+                if bitboard._is_win_at(cell, 2):  # AI wins
+                    score = self.WIN_SCORE - (depth + 1)
+                    pv_table[depth + 1] = []
+                elif first or not self.move_ordering:
+                    score = self._minimax(bitboard, depth + 1, False, alpha, beta, max_depth)
+                else:
+                    score = self._minimax(bitboard, depth + 1, False, alpha, alpha + 1, max_depth)
+                    if alpha < score < beta:  # The null window failed high, get the exact score
+                        score = self._minimax(bitboard, depth + 1, False, alpha, beta, max_depth)
+                bitboard._unmake(cell, 2)  # Reset the spot
+                first = False
+                self.follow_pv = False  # Only the first move of a PV node stays on the PV
+                if score > best_score:
+                    best_score = score
+                    best_cell = cell
+                    if score > alpha:  # New best line inside the window
+                        pv_table[depth] = [cell] + pv_table[depth + 1]
+                alpha = max(alpha, score)
+                if beta <= alpha:
+                    if self.move_ordering:
+                        self.orderer._record_cutoff(cell, depth, 2, remaining)
+                    if self.stats is not None:
+                        self.stats.cutoffs[depth] += 1
+                    break  # Prune the branch
         else:  # Human's turn
             best_score = float('inf')
-            for row in range(self.board_size):
-                for col in range(self.board_size):
-                    if board[row][col] == 0:
-                        board[row][col] = 1  # Human's move
-                        score = self._minimax(board, depth + 1, True, alpha, beta, max_depth)
-                        board[row][col] = 0  # Reset the spot
-                        best_score = min(score, best_score)
-                        beta = min(beta, score)
-                        if beta <= alpha:
-                            break  # Prune the branch
-            return best_score
-
-    def _evaluate_board(self, board):
-        """Heuristic evaluation function to speed up the decision-making process."""
-        score = 0
-        # Check for immediate threats or opportunities (e.g., 2 in a row, 1 in a row)
-        for row in range(self.board_size):
-            for col in range(self.board_size):
-                if board[row][col] == 2:  # AI's piece
-                    score += 1
-                elif board[row][col] == 1:  # Human's piece
-                    score -= 1
+            for cell in cells:
+                bitboard._make(cell, 1)  # Human's move
+                if bitboard._is_win_at(cell, 1):  # Human wins
+                    score = (depth + 1) - self.WIN_SCORE
+                    pv_table[depth + 1] = []
+                elif first or not self.move_ordering:
+                    score = self._minimax(bitboard, depth + 1, True, alpha, beta, max_depth)
+                else:
+                    score = self._minimax(bitboard, depth + 1, True, beta - 1, beta, max_depth)
+                    if alpha < score < beta:  # The null window failed low, get the exact score
+                        score = self._minimax(bitboard, depth + 1, True, alpha, beta, max_depth)
+                bitboard._unmake(cell, 1)  # Reset the spot
+                first = False
+                self.follow_pv = False  # Only the first move of a PV node stays on the PV
+                if score < best_score:
+                    best_score = score
+                    best_cell = cell
+                    if score < beta:  # New best line inside the window
+                        pv_table[depth] = [cell] + pv_table[depth + 1]
+                beta = min(beta, score)
+                if beta <= alpha:
+                    if self.move_ordering:
+                        self.orderer._record_cutoff(cell, depth, 1, remaining)
+                    if self.stats is not None:
+                        self.stats.cutoffs[depth] += 1
+                    break  # Prune the branch
+
+        # Scores are from the AI's point of view in both max and min nodes
+        if best_score <= original_alpha:
+            bound = TranspositionTable.UPPER
+        elif best_score >= original_beta:
+            bound = TranspositionTable.LOWER
+        else:
+            bound = TranspositionTable.EXACT
+        canonical_move = bitboard.zobrist.permutations[symmetry][best_cell]
+        self.tt._store(key, remaining, self._score_to_tt(best_score, depth), bound, canonical_move)
+        return best_score
+
+    def _search_frontier(self, bitboard, depth, is_maximizing, cutoff, key, symmetry):
+        """
+        Searches a node whose children are all at the horizon.
+
+        Instead of visiting the children one by one, an immediate win is looked for with the
+        bitboard and the remaining children are evaluated together with one batched call to
+        the evaluator. The result is exact, whatever the alpha-beta window.
+
+        Args:
+            bitboard (Bitboard): The position, with the node's player to move.
+            depth (int): Depth of the node.
+            is_maximizing (bool): True if the AI is to move.
+            cutoff (float): Beta for the AI, alpha for the human; reaching it counts as a
+                            cutoff for the killer/history tables.
+            key (int): Transposition table key of the position.
+            symmetry (int): Symmetry mapping the position onto its canonical variant.
+
+        Returns:
+            int: The exact score of the node.
+        """
+        player = 2 if is_maximizing else 1
+        cells = bitboard._candidate_cells(self.radius)
+        self.nodes += len(cells)
+
+        best_cell = None
+        for cell in cells:
+            bitboard._make(cell, player)
+            won = bitboard._is_win_at(cell, player)
+            bitboard._unmake(cell, player)
+            if won:  # Nothing beats winning right away
+                best_cell = cell
+                best_score = self.WIN_SCORE - (depth + 1) if is_maximizing else (depth + 1) - self.WIN_SCORE
+                break
+
+        if best_cell is None:
+            if bitboard.masks[1] | bitboard.masks[2] | 1 << cells[0] == bitboard.full_mask:
+                # The only move left fills the board without winning
+                best_cell, best_score = cells[0], 0
+            else:
+                scores = self.evaluator._evaluate_children(bitboard, cells, player)
+                if self.stats is not None:
+                    self.stats.leaf_evaluations += len(cells)
+                index = int(scores.argmax() if is_maximizing else scores.argmin())
+                best_cell, best_score = cells[index], int(scores[index])
+
+        self.pv_table[depth] = [best_cell]
+        if best_score >= cutoff if is_maximizing else best_score <= cutoff:
+            if self.move_ordering:
+                self.orderer._record_cutoff(best_cell, depth, player, 1)
+            if self.stats is not None:
+                self.stats.cutoffs[depth] += 1
+        canonical_move = bitboard.zobrist.permutations[symmetry][best_cell]
+        self.tt._store(key, 1, self._score_to_tt(best_score, depth), TranspositionTable.EXACT, canonical_move)
+        return best_score
+
+    def _score_to_tt(self, score, depth):
+        """
+        Converts a win/loss score from root-relative to node-relative distance before storing.
+
+        Win scores encode how many plies after the root the game ends. A stored position can
+        be reached at a different ply (e.g. after the next move), so the table keeps the
+        distance from the position itself.
+        """
+        if score > self.WIN_SCORE - self.MAX_PLY:
+            return score + depth
+        if score < self.MAX_PLY - self.WIN_SCORE:
+            return score - depth
+        return score
+
+    def _score_from_tt(self, score, depth):
+        """Converts a stored node-relative win/loss score back to the current root."""
+        if score > self.WIN_SCORE - self.MAX_PLY:
+            return score - depth
+        if score < self.MAX_PLY - self.WIN_SCORE:
+            return score + depth
         return score
 
+    def _evaluate_board(self, bitboard):
+        """Heuristic evaluation function to speed up the decision-making process."""
+        # Open lines count positively for the AI and negatively for the human, weighted by how full they are
+        if self.stats is not None:
+            self.stats.leaf_evaluations += 1
+        board = self.evaluator._board_from_masks(bitboard.masks[1], bitboard.masks[2])
+        return int(self.evaluator._evaluate_batch(board[None])[0])
+
     def _check_win(self, board):
         """Checks if there is a winner on the board."""
-        for row in range(self.board_size):
-            if all(board[row][col] == 2 for col in range(self.board_size)):  # AI wins
-                return 2
-            if all(board[row][col] == 1 for col in range(self.board_size)):  # Human wins
-                return 1
-        
-        for col in range(self.board_size):
-            if all(board[row][col] == 2 for row in range(self.board_size)):  # AI wins
-                return 2
-            if all(board[row][col] == 1 for row in range(self.board_size)):  # Human wins
-                return 1
-        
-        if all(board[i][i] == 2 for i in range(self.board_size)):  # AI wins
-            return 2
-        if all(board[i][i] == 1 for i in range(self.board_size)):  # Human wins
-            return 1
-        
-        if all(board[i][self.board_size - 1 - i] == 2 for i in range(self.board_size)):  # AI wins
-            return 2
-        if all(board[i][self.board_size - 1 - i] == 1 for i in range(self.board_size)):  # Human wins
-            return 1
-        
-        return 0  # No winner yet
+        return Bitboard._from_array(board, self.win_length)._winner()
 
     def _is_board_full(self, board):
         """Checks if the board is full."""
-        return all(board[row][col] != 0 for row in range(self.board_size) for col in range(self.board_size))
+        return Bitboard._from_array(board, self.win_length)._is_full()
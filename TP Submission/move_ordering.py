@@ -0,0 +1,132 @@
+from bitboard import Bitboard  # For the winning lines that make up the static cell scores
+
+
+class MoveOrderer:
+    """
+    Orders the moves of a search node so that alpha-beta cutoffs happen as early as possible.
+
+    Moves are tried in this order:
+    0. threats, when the search provides them: moves that win on the spot, then moves
+       that block an immediate win of the opponent,
+    1. the hash move (best move stored in the transposition table for the position),
+    2. the principal variation move of the previous iteration,
+    3. the killer moves of the ply (moves that recently caused a cutoff at the same ply),
+    4. the remaining moves by history score (how often a move caused cutoffs anywhere),
+       with ties broken by a static score favouring central cells on many winning lines.
+    """
+
+    NUM_KILLERS = 2  # Killer moves remembered per ply
+
+    def __init__(self, board_size, win_length=None):
+        """
+        Initializes the static scores and empty killer/history tables.
+
+        Args:
+            board_size (int): Size of the board.
+            win_length (int or None): Pieces in a row needed to win, None for the board size.
+        """
+        self.board_size = board_size
+        num_cells = board_size * board_size
+
+        # Static score: lines through the cell, then closeness to the center as a tie-breaker
+        lines_through = [0] * num_cells
+        for line in Bitboard._build_lines(board_size, win_length):
+            for cell in line:
+                lines_through[cell] += 1
+        center = (board_size - 1) / 2
+        self.static_scores = []
+        for cell in range(num_cells):
+            row, col = divmod(cell, board_size)
+            distance = abs(row - center) + abs(col - center)
+            self.static_scores.append(lines_through[cell] * board_size * 2 - distance)
+
+        self._clear()
+
+    def _clear(self):
+        """Forgets all killer moves and history scores, e.g. for a new game."""
+        num_cells = self.board_size * self.board_size
+        self.killers = [[] for _ in range(num_cells + 2)]  # killers[depth], most recent first
+        self.history = [[0] * num_cells for _ in range(3)]  # history[player][cell]; index 0 unused
+
+    def _new_search(self):
+        """
+        Prepares the tables for the search of a new move.
+
+        Killers are indexed by depth from the root, which shifts from one move to the next,
+        so they are dropped. History scores stay useful but are halved so that recent
+        cutoffs weigh more than old ones.
+        """
+        self.killers = [[] for _ in self.killers]
+        for scores in self.history:
+            for cell in range(len(scores)):
+                scores[cell] >>= 1
+
+    def _order(self, cells, depth, player, first_moves=()):
+        """
+        Sorts the moves of a node.
+
+        Args:
+            cells (list): Empty cells of the node.
+            depth (int): Depth of the node in the search.
+            player (int): The player to move.
+            first_moves (iterable): Moves to try before everything else (hash move, PV move),
+                                    in order; None entries are ignored.
+
+        Returns:
+            list: The cells in the order they should be searched.
+        """
+        history = self.history[player]
+        static = self.static_scores
+        ordered = sorted(cells, key=lambda cell: (history[cell], static[cell]), reverse=True)
+
+        # Killers go right after the forced first moves, in reverse so the most recent ends first
+        for killer in reversed(self.killers[depth]):
+            if killer in cells:
+                ordered.remove(killer)
+                ordered.insert(0, killer)
+
+        for move in reversed([move for move in first_moves if move is not None]):
+            if move in cells:
+                ordered.remove(move)
+                ordered.insert(0, move)
+        return ordered
+
+    def _order_root(self, cells, pv_move=None, threats=()):
+        """
+        Sorts the root moves: threats, the previous iteration's best move, then by static score.
+
+        The root order deliberately ignores killers and history, so that it only depends on
+        the position and the previous result. Serial and parallel searches then try root
+        moves in the same order and break ties between equal scores the same way.
+
+        Args:
+            cells (list): Empty cells of the root position.
+            pv_move (int or None): Best move of the previous iteration.
+            threats (iterable): Immediate wins and blocks, tried first in this order.
+
+        Returns:
+            list: The cells in the order they should be searched.
+        """
+        static = self.static_scores
+        ordered = sorted(cells, key=lambda cell: static[cell], reverse=True)
+        for move in reversed([*threats, pv_move]):
+            if move in cells:
+                ordered.remove(move)
+                ordered.insert(0, move)
+        return ordered
+
+    def _record_cutoff(self, cell, depth, player, remaining):
+        """
+        Rewards a move that caused a beta cutoff.
+
+        Args:
+            cell (int): The move that caused the cutoff.
+            depth (int): Depth of the node where the cutoff happened.
+            player (int): The player who played the move.
+            remaining (int): Remaining search depth at the node; deeper cutoffs weigh more.
+        """
+        killers = self.killers[depth]
+        if cell not in killers:
+            killers.insert(0, cell)
+            del killers[self.NUM_KILLERS:]
+        self.history[player][cell] += remaining * remaining
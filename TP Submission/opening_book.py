@@ -0,0 +1,285 @@
+import argparse  # Command line of the offline generator
+import mmap  # The book is read straight from the page cache, without loading it
+import os
+import struct
+from bitboard import Bitboard
+from zobrist import Zobrist  # Symmetry permutations of the board
+from minimax_ai import AI
+from move_ordering import MoveOrderer  # Static cell order, to prefer central moves among equal ones
+
+
+class OpeningBook:
+    """
+    Read-only book of precomputed best moves, stored in a compact binary file.
+
+    The file holds a small header followed by fixed-size records sorted by key. A key
+    packs the canonical variant of a position (over the 8 board symmetries) into one
+    64-bit integer: the human's mask in the high bits and the AI's mask in the low bits.
+    Each record also stores the best move (in the canonical frame) and its score.
+    Records are found by binary search in the memory-mapped file.
+
+    All positions in a book have the AI (player 2) to move.
+
+    Book files are generated offline, e.g.:
+        python opening_book.py --size 3               (complete 3x3 tablebase)
+        python opening_book.py --size 5 --max-stones 2 --depth 5
+    """
+
+    MAGIC = b'TTTB'
+    VERSION = 1
+    HEADER = struct.Struct('<4sBBI')  # Magic, version, board size, record count
+    RECORD = struct.Struct('<QiB')  # Position key, score, best move
+
+    def __init__(self, path):
+        """
+        Opens and maps a book file.
+
+        Args:
+            path (str): Path of the book file.
+
+        Raises:
+            ValueError: If the file is not a book file of a supported version.
+        """
+        self.path = path
+        self.file = open(path, 'rb')
+        self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, board_size, count = self.HEADER.unpack_from(self.data, 0)
+        if magic != self.MAGIC or version != self.VERSION:
+            self._close()
+            raise ValueError(f"{path} is not a version {self.VERSION} opening book.")
+        self.board_size = board_size
+        self.count = count
+        self.zobrist = Zobrist(board_size)
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def _load_default(cls, board_size):
+        """
+        Opens the book shipped next to this module for the board size, if it was generated.
+
+        Returns:
+            OpeningBook or None: The book, or None if there is no book file for the size.
+        """
+        path = cls._default_path(board_size)
+        return cls(path) if os.path.exists(path) else None
+
+    @staticmethod
+    def _default_path(board_size):
+        """Returns the default book file path for a board size."""
+        return os.path.join(os.path.dirname(os.path.abspath(__file__)), f"book_{board_size}x{board_size}.bin")
+
+    @staticmethod
+    def _canonical(masks, zobrist):
+        """
+        Returns the packed key of the canonical variant of a position.
+
+        Args:
+            masks (tuple): (human_mask, ai_mask) of the position.
+            zobrist (Zobrist): Provides the symmetry permutations for the board size.
+
+        Returns:
+            tuple: (key, symmetry) where symmetry maps the position onto its canonical variant.
+        """
+        num_cells = zobrist.board_size * zobrist.board_size
+        best_key, best_symmetry = None, 0
+        for symmetry, permutation in enumerate(zobrist.permutations):
+            packed = 0
+            for shift, mask in ((num_cells, masks[0]), (0, masks[1])):
+                while mask:
+                    low_bit = mask & -mask
+                    packed |= 1 << (permutation[low_bit.bit_length() - 1] + shift)
+                    mask ^= low_bit
+            if best_key is None or packed < best_key:
+                best_key, best_symmetry = packed, symmetry
+        return best_key, best_symmetry
+
+    def _lookup(self, bitboard):
+        """
+        Looks up the best move of a position.
+
+        Args:
+            bitboard (Bitboard): The position, with the AI to move.
+
+        Returns:
+            tuple or None: ((row, col), score) on a hit, None if the position is not in the book.
+        """
+        if bitboard.board_size != self.board_size or bitboard.win_length != self.board_size:
+            return None  # Books are built for full-line wins
+        key, symmetry = self._canonical((bitboard.masks[1], bitboard.masks[2]), self.zobrist)
+
+        low, high = 0, self.count
+        while low < high:  # Binary search over the sorted records
+            middle = (low + high) // 2
+            record_key, score, move = self.RECORD.unpack_from(self.data, self.HEADER.size + middle * self.RECORD.size)
+            if record_key < key:
+                low = middle + 1
+            elif record_key > key:
+                high = middle
+            else:
+                self.hits += 1
+                cell = self.zobrist.inverse_permutations[symmetry][move]
+                return divmod(cell, self.board_size), score
+        self.misses += 1
+        return None
+
+    def _close(self):
+        """Unmaps and closes the book file."""
+        self.data.close()
+        self.file.close()
+
+    @classmethod
+    def _write(cls, path, board_size, entries):
+        """
+        Writes a book file.
+
+        Args:
+            path (str): Destination path.
+            board_size (int): Size of the board.
+            entries (dict): Maps canonical keys to (score, canonical move).
+        """
+        with open(path, 'wb') as file:
+            file.write(cls.HEADER.pack(cls.MAGIC, cls.VERSION, board_size, len(entries)))
+            for key in sorted(entries):
+                score, move = entries[key]
+                file.write(cls.RECORD.pack(key, score, move))
+
+
+class BookGenerator:
+    """Builds the entries of an opening book offline."""
+
+    def __init__(self, board_size):
+        """
+        Args:
+            board_size (int): Size of the board. Keys must fit in 64 bits (5x5 at most).
+        """
+        if 2 * board_size * board_size > 64:
+            raise ValueError("Opening books support boards up to 5x5.")
+        self.board_size = board_size
+        self.zobrist = Zobrist(board_size)
+
+    def _positions(self, max_stones):
+        """
+        Enumerates the canonical positions with the AI to move and at most max_stones pieces.
+
+        Both move orders are covered: the human moved first (one more human piece) or the
+        AI moved first (equal counts). Positions that are already won are skipped.
+
+        Returns:
+            dict: Maps canonical keys to a Bitboard of one variant of the position.
+        """
+        positions = {}
+        frontier = [Bitboard(self.board_size)]
+        for stones in range(max_stones + 1):
+            next_frontier = {}
+            for bitboard in frontier:
+                human, ai = bitboard._count(1), bitboard._count(2)
+                if human in (ai, ai + 1):  # The AI is to move in some game
+                    key = OpeningBook._canonical((bitboard.masks[1], bitboard.masks[2]), self.zobrist)[0]
+                    positions.setdefault(key, bitboard)
+                if stones == max_stones:
+                    continue
+                for cell in bitboard._empty_cells():
+                    for player in (1, 2):
+                        child = bitboard._copy()
+                        child._make(cell, player)
+                        if child._is_win_at(cell, player) or child._is_full():
+                            continue
+                        if abs(child._count(1) - child._count(2)) > 1:  # Not reachable in any game
+                            continue
+                        child_key = OpeningBook._canonical((child.masks[1], child.masks[2]), self.zobrist)[0]
+                        next_frontier.setdefault(child_key, child)
+            frontier = list(next_frontier.values())
+        return positions
+
+    def _entry(self, bitboard, move, score):
+        """Returns the (key, (score, canonical move)) record of a solved position."""
+        key, symmetry = OpeningBook._canonical((bitboard.masks[1], bitboard.masks[2]), self.zobrist)
+        return key, (score, self.zobrist.permutations[symmetry][move])
+
+    def _solve(self, max_stones=None):
+        """
+        Solves positions exactly with a full-depth memoized minimax.
+
+        Scores follow AI._best_move: a win with the AI's next move is AI.WIN_SCORE, and each
+        extra ply before the game ends brings the score one step closer to 0.
+
+        Args:
+            max_stones (int or None): Largest number of pieces; None solves every position.
+
+        Returns:
+            dict: Book entries.
+        """
+        max_stones = self.board_size * self.board_size if max_stones is None else max_stones
+        memo = {}
+        static_scores = MoveOrderer(self.board_size).static_scores
+        static_order = sorted(range(self.board_size * self.board_size), key=lambda cell: static_scores[cell], reverse=True)
+
+        def solve(bitboard, player):
+            """Returns (score, best move) for the player to move, scores from the AI's side."""
+            key = (bitboard.masks[1], bitboard.masks[2], player)
+            if key in memo:
+                return memo[key]
+            best = None
+            for cell in static_order:
+                if (bitboard.masks[1] | bitboard.masks[2]) >> cell & 1:
+                    continue
+                bitboard._make(cell, player)
+                if bitboard._is_win_at(cell, player):
+                    score = AI.WIN_SCORE if player == 2 else -AI.WIN_SCORE
+                elif bitboard._is_full():
+                    score = 0
+                else:
+                    score = solve(bitboard, 3 - player)[0]
+                    score -= (score > 0) - (score < 0)  # One ply further away from the end
+                bitboard._unmake(cell, player)
+                if best is None or (score > best[0] if player == 2 else score < best[0]):
+                    best = (score, cell)
+            memo[key] = best
+            return best
+
+        entries = {}
+        for bitboard in self._positions(max_stones).values():
+            score, move = solve(bitboard, 2)
+            key, record = self._entry(bitboard, move, score)
+            entries[key] = record
+        return entries
+
+    def _search(self, max_stones, depth):
+        """
+        Finds book moves with the regular depth-limited search.
+
+        Args:
+            max_stones (int): Largest number of pieces in a book position.
+            depth (int): Search depth used for every position.
+
+        Returns:
+            dict: Book entries.
+        """
+        ai = AI(self.board_size, max_depth=depth)
+        entries = {}
+        for bitboard in self._positions(max_stones).values():
+            ai.position = bitboard._copy()
+            row, col = ai._best_move()
+            key, record = self._entry(bitboard, row * self.board_size + col, ai.best_score)
+            entries[key] = record
+        return entries
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate an opening book file.")
+    parser.add_argument('--size', type=int, choices=[3, 5], required=True, help="Board size.")
+    parser.add_argument('--max-stones', type=int, default=None,
+                        help="Largest number of pieces in a book position (default: all for 3x3, 2 for 5x5).")
+    parser.add_argument('--depth', type=int, default=5, help="Search depth for sizes that are not solved exactly.")
+    parser.add_argument('--output', default=None, help="Output path (default: next to this module).")
+    args = parser.parse_args()
+
+    generator = BookGenerator(args.size)
+    if args.size == 3:
+        book_entries = generator._solve(args.max_stones)
+    else:
+        book_entries = generator._search(2 if args.max_stones is None else args.max_stones, args.depth)
+    output = args.output or OpeningBook._default_path(args.size)
+    OpeningBook._write(output, args.size, book_entries)
+    print(f"Wrote {len(book_entries)} positions to {output}")
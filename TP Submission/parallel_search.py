@@ -0,0 +1,235 @@
+import multiprocessing  # Shared alpha bound between the worker processes
+import time  # Deadlines and the scaling benchmark
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from bitboard import Bitboard
+from minimax_ai import AI, SearchTimeout
+from opening_book import OpeningBook  # Book of the game server's search workers
+
+# State of a worker process, set up once by _init_worker
+_shared_alpha = None  # multiprocessing.Value holding the best root score found so far
+_shared_generation = None  # Number of the root iteration the workers are searching for
+_worker_engines = {}  # One AI per engine settings, kept warm across tasks
+
+
+def _init_worker(shared_alpha, shared_generation):
+    """Stores the shared alpha bound and iteration number in the worker process."""
+    global _shared_alpha, _shared_generation
+    _shared_alpha = shared_alpha
+    _shared_generation = shared_generation
+
+
+def _engine_settings(ai):
+    """Returns the settings a worker needs to build an engine searching like `ai`."""
+    return ai.board_size, ai.win_length, ai.radius, ai.move_ordering
+
+
+def _worker_engine(settings, with_book=False, max_depth=None):
+    """
+    Returns the worker's engine for the settings, creating it on first use.
+
+    Args:
+        settings (tuple): Board size, win length, radius and move ordering, see _engine_settings.
+        with_book (bool): Give a new engine the default opening book of its board size, if
+                          one was generated (only full-line wins have books).
+        max_depth (int or None): Deepest iteration of the engine's own searches, see AI.
+    """
+    key = settings + (with_book, max_depth)
+    if key not in _worker_engines:
+        board_size, win_length, radius, move_ordering = settings
+        book = OpeningBook._load_default(board_size) if with_book and win_length == board_size else None
+        _worker_engines[key] = AI(board_size, max_depth=max_depth, move_ordering=move_ordering, book=book,
+                                  win_length=win_length, radius=radius)
+    return _worker_engines[key]
+
+
+def _search_root_move(settings, masks, cell, depth, pv, deadline, generation):
+    """
+    Searches a single root move in a worker process.
+
+    Args:
+        settings (tuple): Board size, win length, radius and move ordering of the calling AI.
+        masks (tuple): (human_mask, ai_mask) of the root position.
+        cell (int): The root move to search.
+        depth (int): Depth of the iteration.
+        pv (list): Previous principal variation if it starts with this move, otherwise empty.
+        deadline (float or None): Wall-clock time (time.time()) at which to give up.
+        generation (int): Number of the root iteration the task belongs to. Once the caller
+                          has moved on to another iteration (or abandoned this one), the
+                          task gives up and its score is not published.
+
+    Returns:
+        tuple: (cell, score, line, nodes), or (cell, None, [], nodes) if the deadline passed
+               or the iteration was abandoned.
+    """
+    ai = _worker_engine(settings)
+    bitboard = Bitboard._from_masks(ai.board_size, masks, ai.win_length)
+
+    # Scores at or below alpha - 1 lose to a move already searched; anything else is
+    # searched exactly, so equal best scores are recognized and ties break by root order
+    with _shared_alpha.get_lock():
+        if _shared_generation.value != generation:
+            return cell, None, [], 0  # Queued behind the iteration's end: the alpha is not ours
+        alpha = _shared_alpha.value
+    alpha = -float('inf') if alpha == -float('inf') else alpha - 1
+
+    ai.pv = pv
+    ai.nodes = 0
+    ai.next_time_check = ai.TIME_CHECK_INTERVAL
+    ai.deadline = None if deadline is None else time.perf_counter() + (deadline - time.time())
+    ai.stop_check = lambda: _shared_generation.value != generation
+    ai._start_iteration(depth)
+    try:
+        score = ai._search_root_move(bitboard, cell, depth, alpha, float('inf'), False)
+    except SearchTimeout:
+        return cell, None, [], ai.nodes
+    finally:
+        ai.deadline = None
+        ai.stop_check = None
+
+    with _shared_alpha.get_lock():
+        if _shared_generation.value == generation and score > _shared_alpha.value:
+            _shared_alpha.value = score
+    return cell, score, ai.pv_table[0], ai.nodes
+
+
+def _worker_engine_ready(settings, hold_seconds):
+    """Builds the worker's engine; holding the worker briefly makes every worker get one task."""
+    _worker_engine(settings)
+    time.sleep(hold_seconds)
+
+
+class ParallelSearch:
+    """
+    Splits the root moves of each iterative deepening iteration across a process pool.
+
+    Every root move is a separate task, submitted in root order so the most promising
+    moves start first. Workers publish the best score they find in a shared value and
+    later tasks start with it as their alpha bound, which lets them prune moves that
+    cannot be better. The move returned is the first move in root order with the highest
+    score, which is also what the serial search returns, so both modes play the same
+    moves for the same depth.
+
+    Each iteration has a number, shared with the workers next to the alpha bound. A task
+    only reads and writes the alpha bound of its own iteration, and gives up (polling at
+    the same interval as the clock) once the iteration is over. So tasks still running
+    after a stop or a timeout cannot leak their scores into the next search.
+    """
+
+    POLL_INTERVAL = 0.05  # Seconds between two checks of the AI's stop request while waiting
+
+    def __init__(self, workers):
+        """
+        Starts the process pool.
+
+        Args:
+            workers (int): Number of worker processes.
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1.")
+        self.workers = workers
+        self.shared_alpha = multiprocessing.Value('d', -float('inf'))
+        self.shared_generation = multiprocessing.RawValue('q', 0)  # Written under the alpha lock
+        self.executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                            initargs=(self.shared_alpha, self.shared_generation))
+
+    def _search_root(self, ai, bitboard, depth, deadline=None):
+        """
+        Runs one iteration of the root search in parallel.
+
+        Args:
+            ai (AI): The engine, used for root ordering and to record the PV and node count.
+            bitboard (Bitboard): The root position, with the AI to move.
+            depth (int): Depth of the iteration.
+            deadline (float or None): time.perf_counter() value at which the iteration is abandoned.
+
+        Returns:
+            tuple: The best move as (row, col) and its score.
+
+        Raises:
+            SearchTimeout: If the deadline passed before every root move was searched.
+        """
+        cells = ai._root_moves(bitboard)
+
+        wall_deadline = None if deadline is None else time.time() + (deadline - time.perf_counter())
+        masks = (bitboard.masks[1], bitboard.masks[2])
+        with self.shared_alpha.get_lock():
+            self.shared_generation.value += 1
+            self.shared_alpha.value = -float('inf')
+            generation = self.shared_generation.value
+        pending = {
+            self.executor.submit(_search_root_move, _engine_settings(ai), masks, cell, depth,
+                                 ai.pv if ai.pv and ai.pv[0] == cell else [], wall_deadline, generation)
+            for cell in cells
+        }
+
+        results = {}
+        while pending and not ai.stop_requested:
+            timeout = self.POLL_INTERVAL
+            if deadline is not None:
+                timeout = min(timeout, max(0.0, deadline - time.perf_counter()))
+            done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            if not done:
+                if deadline is not None and time.perf_counter() >= deadline:
+                    break
+                continue
+            for future in done:
+                cell, score, line, nodes = future.result()
+                ai.nodes += nodes
+                results[cell] = (score, line)
+
+        if pending or any(score is None for score, _ in results.values()):
+            for future in pending:
+                future.cancel()
+            with self.shared_alpha.get_lock():
+                self.shared_generation.value += 1  # Tasks already running give up at their next check
+            raise SearchTimeout()
+
+        best_score = max(score for score, _ in results.values())
+        best_cell = next(cell for cell in cells if results[cell][0] == best_score)  # First in root order
+        ai.pv = [best_cell] + results[best_cell][1]
+        return divmod(best_cell, bitboard.board_size), best_score
+
+    def _warm_up(self, ai):
+        """Starts every worker process and builds its engine, so the first search is not slowed down."""
+        futures = [self.executor.submit(_worker_engine_ready, _engine_settings(ai), 0.05)
+                   for _ in range(self.workers)]
+        wait(futures)
+
+    def _shutdown(self):
+        """Stops the worker processes."""
+        self.executor.shutdown(cancel_futures=True)
+
+
+def _run_scaling_benchmark(worker_counts=(1, 2, 4, 8), depth=5):
+    """
+    Times a fixed-depth 5x5 search with each worker count and checks that all agree.
+
+    Args:
+        worker_counts (tuple): Worker counts to compare; 1 runs the serial search.
+        depth (int): Fixed search depth.
+    """
+    board = [[0] * 5 for _ in range(5)]
+    board[2][2] = 1  # Human took the center
+    board[0][0] = 2
+    board[1][2] = 1
+
+    baseline_time = None
+    baseline_move = None
+    for workers in worker_counts:
+        ai = AI(5, max_depth=depth, workers=workers)
+        if ai.parallel is not None:
+            ai.parallel._warm_up(ai)  # Process start-up is not part of the measurement
+        start = time.perf_counter()
+        move = ai._best_move(board)
+        elapsed = time.perf_counter() - start
+        ai._close()
+
+        if baseline_time is None:
+            baseline_time, baseline_move = elapsed, move
+        status = "same move" if move == baseline_move else "DIFFERENT MOVE"
+        print(f"{workers} worker(s): {elapsed:.3f}s, speedup {baseline_time / elapsed:.2f}x, "
+              f"move {move}, {ai.nodes} nodes, {status}")
+
+
+if __name__ == "__main__":
+    _run_scaling_benchmark()
@@ -1,10 +1,21 @@
 import pygame
 import numpy as np
+import time  # Frame time and CPU usage measurements
 
 class Renderer:
-    """Handles all rendering of the game elements."""
-    
-    def __init__(self, board_width, board_height, board_rows, board_cols, colors):
+    """
+    Handles all rendering of the game elements.
+
+    _render draws incrementally: the grid and the X/O figures are pre-rendered once per
+    square size into cached surfaces, and each frame only the cells that changed since
+    the previous frame are blitted and passed to pygame.display.update. _tick caps the
+    frame rate and keeps frame time and CPU usage statistics.
+    """
+
+    CAPTION = "AI-Based Tic Tac Toe"
+    _surface_cache = {}  # (width, height, square size, line widths, colors) -> (grid, {symbol: sprite})
+
+    def __init__(self, board_width, board_height, board_rows, board_cols, colors, fps=60):
         """
         Initializes the Renderer object with game board dimensions, colors, and other properties.
         
@@ -14,6 +25,7 @@ class Renderer:
             board_rows (int): Number of rows on the Tic-Tac-Toe board.
             board_cols (int): Number of columns on the Tic-Tac-Toe board.
             colors (dict): A dictionary containing color mappings for different elements of the game.
+            fps (int or None): Frame rate cap of _tick, None for no cap.
         """
         self.board_width = board_width
         self.board_height = board_height
@@ -28,16 +40,23 @@ class Renderer:
         self.circle_radius = self.square_size // 3
         
         # Define the width for drawing the circle and cross
-        self.circle_width = 15
-        self.cross_width = 25
+        # (thinner on large boards, so marks stay inside their squares)
+        self.circle_width = min(15, max(2, self.square_size // 8))
+        self.cross_width = min(25, max(3, self.square_size // 4))
         
         # Set up the Pygame window for rendering
         self.screen = pygame.display.set_mode((self.board_width, self.board_height))
-        pygame.display.set_caption("AI-Based Tic Tac Toe")
+        pygame.display.set_caption(self.CAPTION)
+        self.thinking = False  # Whether the caption shows that the AI is thinking
         
         # Fill the screen with black color at the start
         self.screen.fill(self.colors['BLACK'])
 
+        self.fps = fps
+        self.clock = pygame.time.Clock()
+        self.drawn = None  # Board as last drawn by _render, None forces a full redraw
+        self._reset_frame_stats()
+
     def _draw_grid(self):
         """
         Draws the grid lines for the Tic-Tac-Toe board.
@@ -96,12 +115,142 @@ class Renderer:
                          self.cross_width
                     )
 
+    def _cached_surfaces(self):
+        """
+        Returns the pre-rendered grid and figure sprites for the current square size.
+
+        Returns:
+            tuple: (grid, sprites) where grid is a window-sized surface with the empty board
+                   and sprites maps symbols 1 and 2 to square-sized surfaces with a
+                   transparent background.
+        """
+        key = (self.board_width, self.board_height, self.board_rows, self.board_cols, self.square_size,
+               self.circle_width, self.cross_width, tuple(sorted(self.colors.items())))
+        if key not in self._surface_cache:
+            screen = self.screen
+            grid = pygame.Surface((self.board_width, self.board_height))
+            grid.fill(self.colors['BLACK'])
+            self.screen = grid  # Reuse the drawing code on the off-screen surfaces
+            self._draw_grid()
+
+            sprites = {}
+            for symbol in (1, 2):
+                sprite = pygame.Surface((self.square_size, self.square_size), pygame.SRCALPHA)
+                self.screen = sprite
+                figure = np.zeros((self.board_rows, self.board_cols), dtype=int)
+                figure[0][0] = symbol  # Drawn in the top-left cell, which covers the whole sprite
+                self._draw_figures(figure)
+                sprites[symbol] = sprite
+            self.screen = screen
+            self._surface_cache[key] = (grid, sprites)
+        return self._surface_cache[key]
+
+    def _render(self, board):
+        """
+        Draws the cells that changed since the last call and updates only their rectangles.
+
+        Args:
+            board (ndarray): A 2D numpy array representing the Tic-Tac-Toe board.
+
+        Returns:
+            int: Number of cells redrawn (all of them after a restart or resize).
+        """
+        grid, sprites = self._cached_surfaces()
+        if self.drawn is None:  # Full redraw
+            self.screen.blit(grid, (0, 0))
+            self.drawn = np.zeros((self.board_rows, self.board_cols), dtype=int)
+            dirty = [pygame.Rect(0, 0, self.board_width, self.board_height)]
+            changed = np.argwhere(np.asarray(board) != 0)
+        else:
+            dirty = []
+            changed = np.argwhere(np.asarray(board) != self.drawn)
+
+        for row, col in changed:
+            rect = pygame.Rect(col * self.square_size, row * self.square_size, self.square_size, self.square_size)
+            self.screen.blit(grid, rect, rect)  # Restore the empty cell, grid lines included
+            symbol = int(board[row][col])
+            if symbol in sprites:
+                self.screen.blit(sprites[symbol], rect)
+            self.drawn[row][col] = symbol
+            dirty.append(rect)
+
+        if dirty:
+            pygame.display.update(dirty)
+        return len(changed)
+
+    def _tick(self):
+        """
+        Ends a frame: waits to respect the frame rate cap and records the frame statistics.
+
+        Returns:
+            float: Time spent on the frame in milliseconds, excluding the wait.
+        """
+        now = time.perf_counter()
+        frame_ms = (now - self.frame_start) * 1000
+        self.frames += 1
+        self.frame_ms_total += frame_ms
+        self.frame_ms_max = max(self.frame_ms_max, frame_ms)
+        if self.last_tick is not None:  # Time between two frames: what the user perceives as latency
+            self.interval_ms_max = max(self.interval_ms_max, (now - self.last_tick) * 1000)
+        self.last_tick = now
+        self.clock.tick(self.fps or 0)
+        self.frame_start = time.perf_counter()
+        return frame_ms
+
+    def _mark_idle(self):
+        """
+        Tells _tick that the loop slept waiting for an event, so the gap is counted neither as
+        latency nor as frame time: the frame starts now, when the event has arrived.
+        """
+        self.last_tick = None
+        self.frame_start = time.perf_counter()
+
+    def _reset_frame_stats(self):
+        """Starts a new measurement period for _frame_report."""
+        self.frames = 0
+        self.frame_ms_total = 0.0
+        self.frame_ms_max = 0.0
+        self.interval_ms_max = 0.0
+        self.last_tick = None
+        self.frame_start = self.stats_start = time.perf_counter()
+        self.cpu_start = time.process_time()
+
+    def _frame_report(self):
+        """
+        Returns frame statistics since the last reset.
+
+        Returns:
+            dict: Frames per second, mean and worst frame time (ms, excluding the frame cap
+                  wait), the worst time between two frames (ms, including the wait) and the
+                  CPU usage of the process in percent of one core.
+        """
+        elapsed = max(time.perf_counter() - self.stats_start, 1e-9)
+        return {
+            'fps': self.frames / elapsed,
+            'frame_ms_mean': self.frame_ms_total / self.frames if self.frames else 0.0,
+            'frame_ms_max': self.frame_ms_max,
+            'frame_interval_ms_max': self.interval_ms_max,
+            'cpu_percent': 100 * (time.process_time() - self.cpu_start) / elapsed,
+        }
+
+    def _show_thinking(self, thinking):
+        """
+        Shows in the window caption whether the AI is searching for its move.
+
+        Args:
+            thinking (bool): True while the AI's search runs in the background.
+        """
+        if thinking != self.thinking:  # Only touch the window when the state changes
+            self.thinking = thinking
+            pygame.display.set_caption(f"{self.CAPTION} - AI is thinking..." if thinking else self.CAPTION)
+
     def _restart_game(self):
         """
         Restarts the game by resetting the board and clearing the screen.
         """
         self.screen.fill(self.colors['BLACK'])  # Clear the screen
         self._draw_grid()  # Redraw the grid
+        self.drawn = None  # The next _render redraws everything
 
     def _update_dimensions(self, board_rows, board_cols):
         """
@@ -0,0 +1,112 @@
+import json  # Records are exported as JSON lines
+
+
+class SearchStats:
+    """
+    Opt-in statistics about the searches of an AI, one record per move.
+
+    The search only touches the collector at a few places (cutoffs, heuristic evaluations,
+    end of each iteration), each guarded by a single `is not None` check, so an AI created
+    without a collector pays almost nothing for it. Nodes are counted by the search anyway.
+
+    A record holds:
+    - nodes: nodes visited (including frontier leaves),
+    - leaf_evaluations: positions scored by the heuristic evaluation,
+    - cutoffs_by_ply: alpha-beta cutoffs per ply, ply 0 being the position right after the
+      root move,
+    - completed_depth: depth of the last completed iteration,
+    - branching_factor: effective branching factor, nodes of the last completed iteration
+      divided by the nodes of the one before,
+    - iterations: depth, nodes, score and wall time of each completed iteration,
+    - time_ms, move, score and source ('search', 'book', or 'ponder' for a move searched
+      while the opponent was thinking).
+
+    With parallel workers, cutoffs and leaf evaluations happen in the worker processes and
+    are not counted; nodes are.
+    """
+
+    def __init__(self, board_size):
+        """
+        Args:
+            board_size (int): Size of the board, which bounds the number of plies.
+        """
+        self.board_size = board_size
+        self.records = []  # One record per move, oldest first
+        self.last = None  # Record of the last move
+        self._begin_move()
+
+    def _begin_move(self):
+        """Resets the counters before the search of a new move."""
+        self.leaf_evaluations = 0
+        self.cutoffs = [0] * (self.board_size * self.board_size + 2)  # cutoffs[ply]
+        self.iterations = []
+
+    def _record_iteration(self, depth, nodes, score, seconds):
+        """
+        Records a completed iterative deepening iteration.
+
+        Args:
+            depth (int): Depth of the iteration.
+            nodes (int): Nodes visited by the iteration.
+            score (int): Score of the iteration's best move.
+            seconds (float): Wall time of the iteration.
+        """
+        self.iterations.append({'depth': depth, 'nodes': nodes, 'score': score,
+                                'time_ms': round(seconds * 1000, 3)})
+
+    def _end_move(self, move, score, nodes, completed_depth, seconds, source='search'):
+        """
+        Closes the record of the current move.
+
+        Args:
+            move (tuple or None): The move played, as (row, col).
+            score (int or None): Its score.
+            nodes (int): Nodes visited by the whole search.
+            completed_depth (int): Depth of the last completed iteration.
+            seconds (float): Wall time of the whole search.
+            source (str): 'search', or 'book' for a move read from the opening book.
+
+        Returns:
+            dict: The record.
+        """
+        branching_factor = None
+        if len(self.iterations) >= 2 and self.iterations[-2]['nodes']:
+            branching_factor = round(self.iterations[-1]['nodes'] / self.iterations[-2]['nodes'], 3)
+        last_ply = max((ply for ply, count in enumerate(self.cutoffs) if count), default=-1)
+        self.last = {
+            'move': list(move) if move is not None else None,
+            'score': score,
+            'source': source,
+            'nodes': nodes,
+            'leaf_evaluations': self.leaf_evaluations,
+            'cutoffs_by_ply': self.cutoffs[:last_ply + 1],
+            'completed_depth': completed_depth,
+            'branching_factor': branching_factor,
+            'time_ms': round(seconds * 1000, 3),
+            'iterations': self.iterations,
+        }
+        self.records.append(self.last)
+        return self.last
+
+    def _add_record(self, record):
+        """Appends a record closed by another collector, e.g. the one used while pondering."""
+        self.last = record
+        self.records.append(record)
+        return record
+
+    def _clear(self):
+        """Forgets the records of previous moves."""
+        self.records = []
+        self.last = None
+
+    def _write_jsonl(self, path, append=True):
+        """
+        Writes every record as one JSON line.
+
+        Args:
+            path (str): Destination file.
+            append (bool): Append to the file instead of overwriting it.
+        """
+        with open(path, 'a' if append else 'w') as file:
+            for record in self.records:
+                file.write(json.dumps(record) + "\n")
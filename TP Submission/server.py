@@ -0,0 +1,327 @@
+import argparse  # Command line of the server
+import asyncio
+import itertools
+import json  # Requests and responses are JSON lines
+import time
+from concurrent.futures import ProcessPoolExecutor
+from bitboard import Bitboard
+from game_state import GameState  # Board, move history and win/draw checks of each hosted game
+from parallel_search import _worker_engine  # Engines of a worker process, kept warm across requests
+
+
+def _percentile(values, fraction):
+    """
+    Returns a percentile of sorted values, e.g. of search latencies.
+
+    Args:
+        values (list): Values sorted in increasing order.
+        fraction (float): Percentile as a fraction, e.g. 0.99 for p99.
+
+    Returns:
+        float or None: The value at that rank, None if there are no values.
+    """
+    return values[min(len(values) - 1, int(fraction * len(values)))] if values else None
+
+
+def _search_move(board_size, win_length, masks, time_budget_ms):
+    """
+    Finds the AI's move in a worker process.
+
+    Args:
+        board_size (int): Size of the board.
+        win_length (int): Marks in a row needed to win.
+        masks (tuple): (human_mask, ai_mask) of the position, with the AI to move.
+        time_budget_ms (int): Time budget of the search.
+
+    Returns:
+        tuple: (cell, nodes, completed_depth, search time in ms).
+    """
+    # Only the time budget ends the search; it is passed per call, as the engine serves every game
+    ai = _worker_engine((board_size, win_length, None, True), with_book=True, max_depth=board_size * board_size)
+    ai.position = Bitboard._from_masks(board_size, masks, win_length)
+
+    start = time.perf_counter()
+    row, col = ai._best_move(time_budget_ms=time_budget_ms)
+    return row * board_size + col, ai.nodes, ai.completed_depth, (time.perf_counter() - start) * 1000
+
+
+class ServerError(Exception):
+    """A request that cannot be served; its message is sent back to the client."""
+
+
+class Game:
+    """A game hosted by the server: the human is X (1) and the AI is O (2)."""
+
+    def __init__(self, game_id, board_size, time_budget_ms, win_length=None):
+        """
+        Args:
+            game_id (int): Identifier of the game.
+            board_size (int): Size of the board.
+            time_budget_ms (int): Default time budget of the AI's searches in this game.
+            win_length (int or None): Marks in a row needed to win, None for the board size.
+        """
+        self.game_id = game_id
+        self.board_size = board_size
+        self.win_length = board_size if win_length is None else win_length
+        self.time_budget_ms = time_budget_ms
+        self.state = GameState(board_size, self.win_length)
+        self.winner = 0
+        self.over = False
+        self.searching = False  # True while the AI's reply is being searched
+
+    def _play(self, cell, player):
+        """
+        Applies a move and updates the game status.
+
+        Raises:
+            ServerError: If the game is over or the cell is not an empty cell of the board.
+        """
+        if self.over:
+            raise ServerError("The game is over.")
+        if not self.state._is_legal(cell):
+            raise ServerError(f"Cell {cell} is not an empty cell of the board.")
+        self.state._make(cell, player)
+        self.winner, self.over = self.state.winner, self.state._is_over()
+
+    def _state(self):
+        """Returns the game as a JSON-serializable dict."""
+        return {'game': self.game_id, 'board_size': self.board_size, 'win_length': self.win_length,
+                'moves': [divmod(cell, self.board_size) for cell in self.state.history],
+                'winner': self.winner, 'over': self.over}
+
+
+class GameServer:
+    """
+    Hosts many concurrent games against the AI over JSON lines (TCP or Unix socket).
+
+    Each request is one JSON object per line and gets one JSON response per line, in order:
+        {"op": "new_game", "board_size": 5, "win_length": 4, "time_budget_ms": 200, "ai_first": false}
+        {"op": "move", "game": 1, "row": 2, "col": 2}   -> the state after the AI's reply
+        {"op": "state", "game": 1}
+        {"op": "close", "game": 1}
+        {"op": "metrics"}
+    A move may carry its own "time_budget_ms" for the AI's reply; otherwise the game's is used.
+    A request may carry an "id", which is echoed back. Errors are answered with {"error": ...}.
+    A move sent while the AI is still answering the previous one in the same game (e.g. from
+    a second connection) is rejected with an error.
+    Boards go from 3x3 to 15x15; "win_length" defaults to the board size.
+
+    AI searches run in a bounded process pool. At most `workers` searches run at once;
+    up to `max_queue` more wait for a worker, and requests beyond that are rejected with
+    a "busy" error instead of piling up. Connections are served one request at a time and
+    responses wait for the socket to drain, so a slow client only slows itself down.
+    """
+
+    SUPPORTED_SIZES = range(3, 16)
+    LATENCY_SAMPLES = 10000  # Recent search latencies kept for the percentiles
+
+    def __init__(self, workers=2, max_queue=64, default_budget_ms=200, max_budget_ms=5000):
+        """
+        Args:
+            workers (int): Worker processes running the searches.
+            max_queue (int): Searches allowed to wait for a worker before requests are rejected.
+            default_budget_ms (int): Search time budget of games that do not choose one.
+            max_budget_ms (int): Largest time budget a game may ask for.
+        """
+        self.workers = workers
+        self.max_queue = max_queue
+        self.default_budget_ms = default_budget_ms
+        self.max_budget_ms = max_budget_ms
+        self.executor = ProcessPoolExecutor(max_workers=workers)
+        self.slots = None  # asyncio.Semaphore with one slot per worker, created in the event loop
+        self.games = {}
+        self.game_ids = itertools.count(1)
+
+        self.queued = 0  # Searches waiting for a worker
+        self.running = 0  # Searches running in a worker
+        self.max_queue_depth = 0
+        self.completed = 0
+        self.rejected = 0
+        self.latencies_ms = []  # Recent search latencies, queueing included
+        self.connections = 0
+
+    async def _serve_tcp(self, host, port):
+        """Serves clients on a TCP port until cancelled."""
+        self.slots = asyncio.Semaphore(self.workers)
+        server = await asyncio.start_server(self._handle_connection, host, port)
+        async with server:
+            await server.serve_forever()
+
+    async def _serve_unix(self, path):
+        """Serves clients on a Unix socket until cancelled."""
+        self.slots = asyncio.Semaphore(self.workers)
+        server = await asyncio.start_unix_server(self._handle_connection, path)
+        async with server:
+            await server.serve_forever()
+
+    def _close(self):
+        """Stops the worker processes."""
+        self.executor.shutdown(cancel_futures=True)
+
+    async def _handle_connection(self, reader, writer):
+        """Answers the requests of one client, in order, until it disconnects."""
+        self.connections += 1
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                response = await self._handle_line(line)
+                writer.write(json.dumps(response).encode() + b"\n")
+                await writer.drain()  # Backpressure: stop reading while the client does not read
+        except ConnectionError:
+            pass
+        finally:
+            self.connections -= 1
+            writer.close()
+
+    async def _handle_line(self, line):
+        """Decodes a request line and returns the response dict."""
+        request_id = None
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ServerError("A request must be a JSON object.")
+            request_id = request.get('id')
+            response = await self._handle_request(request)
+        except ServerError as error:
+            response = {'error': str(error)}
+        except (ValueError, KeyError, TypeError) as error:
+            response = {'error': f"Invalid request: {error}"}
+        if request_id is not None:
+            response['id'] = request_id
+        return response
+
+    async def _handle_request(self, request):
+        """
+        Serves one request.
+
+        Raises:
+            ServerError: If the request cannot be served.
+        """
+        op = request.get('op')
+        if op == 'metrics':
+            return self._metrics()
+        if op == 'new_game':
+            board_size = int(request.get('board_size', 3))
+            if board_size not in self.SUPPORTED_SIZES:
+                raise ServerError(f"Unsupported board size {board_size}, expected {self.SUPPORTED_SIZES.start} "
+                                  f"to {self.SUPPORTED_SIZES.stop - 1}.")
+            win_length = int(request.get('win_length', board_size))
+            if not 3 <= win_length <= board_size:
+                raise ServerError(f"win_length must be between 3 and {board_size}.")
+            budget = self._budget(request, self.default_budget_ms)
+            if request.get('ai_first'):
+                self._check_capacity()
+            game = Game(next(self.game_ids), board_size, budget, win_length)
+            self.games[game.game_id] = game
+            if request.get('ai_first'):
+                await self._ai_move(game, budget)
+            return game._state()
+
+        game = self.games.get(request.get('game'))
+        if game is None:
+            raise ServerError(f"Unknown game {request.get('game')!r}.")
+        if op == 'state':
+            return game._state()
+        if op == 'close':
+            del self.games[game.game_id]
+            return {'game': game.game_id, 'closed': True}
+        if op == 'move':
+            if game.searching:  # The human's next move must wait for the AI's reply
+                raise ServerError("The AI is still searching its move in this game.")
+            row, col = int(request['row']), int(request['col'])
+            if not 0 <= row < game.board_size or not 0 <= col < game.board_size:
+                raise ServerError(f"Cell ({row}, {col}) is off the {game.board_size}x{game.board_size} board.")
+            budget = self._budget(request, game.time_budget_ms)
+            self._check_capacity()  # Rejected before the human's move is applied, so the client can retry
+            game._play(row * game.board_size + col, 1)
+            if not game.over:
+                await self._ai_move(game, budget)
+            return game._state()
+        raise ServerError(f"Unknown op {op!r}.")
+
+    def _budget(self, request, default):
+        """
+        Returns the search time budget a request asks for.
+
+        Raises:
+            ServerError: If it is not between 1 and max_budget_ms.
+        """
+        budget = int(request.get('time_budget_ms', default))
+        if not 0 < budget <= self.max_budget_ms:
+            raise ServerError(f"time_budget_ms must be between 1 and {self.max_budget_ms}.")
+        return budget
+
+    def _check_capacity(self):
+        """
+        Rejects a request that would need a search while the queue is full.
+
+        Raises:
+            ServerError: "busy" if every worker is taken and max_queue searches already wait.
+        """
+        if self.queued >= self.max_queue and self.slots.locked():
+            self.rejected += 1
+            raise ServerError("busy")
+
+    async def _ai_move(self, game, time_budget_ms):
+        """Searches and plays the AI's move in a game within a time budget, waiting for a free worker."""
+        game.searching = True
+        try:
+            await self._search_ai_move(game, time_budget_ms)
+        finally:
+            game.searching = False
+
+    async def _search_ai_move(self, game, time_budget_ms):
+        """Runs the search of _ai_move in a worker and plays the move found."""
+        start = time.perf_counter()
+        self.queued += 1
+        self.max_queue_depth = max(self.max_queue_depth, self.queued)
+        try:
+            await self.slots.acquire()
+        finally:
+            self.queued -= 1
+        self.running += 1
+        try:
+            masks = (game.state.masks[1], game.state.masks[2])
+            loop = asyncio.get_running_loop()
+            cell, _, _, _ = await loop.run_in_executor(self.executor, _search_move, game.board_size,
+                                                       game.win_length, masks, time_budget_ms)
+        finally:
+            self.running -= 1
+            self.slots.release()
+        if game.game_id in self.games and not game.over:  # The game may have been closed meanwhile
+            game._play(cell, 2)
+        self.completed += 1
+        self.latencies_ms.append((time.perf_counter() - start) * 1000)
+        del self.latencies_ms[:-self.LATENCY_SAMPLES]
+
+    def _metrics(self):
+        """Returns the server's load and latency metrics."""
+        latencies = sorted(self.latencies_ms)
+        return {'games': len(self.games), 'connections': self.connections, 'queue_depth': self.queued,
+                'max_queue_depth': self.max_queue_depth, 'running': self.running, 'workers': self.workers,
+                'completed': self.completed, 'rejected': self.rejected,
+                'search_p50_ms': _percentile(latencies, 0.5), 'search_p99_ms': _percentile(latencies, 0.99)}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Host Tic-Tac-Toe games against the AI over JSON lines.")
+    parser.add_argument('--host', default='127.0.0.1', help="TCP host.")
+    parser.add_argument('--port', type=int, default=8765, help="TCP port.")
+    parser.add_argument('--unix', default=None, help="Unix socket path (instead of TCP).")
+    parser.add_argument('--workers', type=int, default=2, help="Search worker processes.")
+    parser.add_argument('--max-queue', type=int, default=64, help="Searches allowed to wait before rejecting.")
+    parser.add_argument('--budget-ms', type=int, default=200, help="Default search time budget per move.")
+    args = parser.parse_args()
+
+    game_server = GameServer(args.workers, args.max_queue, args.budget_ms)
+    try:
+        if args.unix:
+            asyncio.run(game_server._serve_unix(args.unix))
+        else:
+            asyncio.run(game_server._serve_tcp(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        game_server._close()
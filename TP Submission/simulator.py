@@ -0,0 +1,332 @@
+import argparse  # Command line of the simulator
+import json  # Results are streamed as JSON lines
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from game_state import GameState
+from minimax_ai import AI
+from mcts_ai import MCTS
+
+# Headless: nothing here (or in the modules above) imports pygame, so games run without a window.
+
+
+class RandomAgent:
+    """Plays a uniformly random empty cell."""
+
+    def __init__(self, symbol, board_size, seed=None):
+        """
+        Args:
+            symbol (int): The agent's symbol (1 for X, 2 for O).
+            board_size (int): Size of the board.
+            seed (int or None): Seed of the agent's random generator.
+        """
+        self.symbol = symbol
+        self.random = random.Random(seed)
+
+    def _new_game(self):
+        """Nothing to reset between games."""
+
+    def _observe(self, cell, player):
+        """Moves are read from the position, nothing to track."""
+
+    def _choose(self, position):
+        """Returns a random empty cell of the position."""
+        return self.random.choice(position._empty_cells())
+
+
+class ScriptedAgent:
+    """Plays the first empty cell of a fixed preference list, then the first empty cell."""
+
+    def __init__(self, symbol, board_size, script):
+        """
+        Args:
+            symbol (int): The agent's symbol (1 for X, 2 for O).
+            board_size (int): Size of the board.
+            script (list): Preferred positions, numbered from 1 like in the move log.
+        """
+        self.symbol = symbol
+        self.script = [position - 1 for position in script]
+
+    def _new_game(self):
+        """Nothing to reset between games."""
+
+    def _observe(self, cell, player):
+        """Moves are read from the position, nothing to track."""
+
+    def _choose(self, position):
+        """Returns the first scripted cell that is still empty."""
+        empty = position._empty_cells()
+        for cell in self.script:
+            if cell in empty:
+                return cell
+        return empty[0]
+
+
+class EngineAgent:
+    """
+    Plays with the minimax AI engine or the MCTS engine.
+
+    The engines always play as player 2, so when the agent plays X the colors are swapped
+    in everything the engine is told.
+    """
+
+    def __init__(self, symbol, board_size, depth=3, time_budget_ms=None, win_length=None, algorithm='minimax',
+                 iterations=None, seed=None):
+        """
+        Args:
+            symbol (int): The agent's symbol (1 for X, 2 for O).
+            board_size (int): Size of the board.
+            depth (int or None): Maximum search depth of minimax, None for no limit.
+            time_budget_ms (int or None): Time budget per move, None for a fixed-depth (or fixed-iterations) search.
+            win_length (int or None): Marks in a row needed to win, None for the board size.
+            algorithm (str): 'minimax' or 'mcts'.
+            iterations (int or None): Playouts per move of MCTS.
+            seed (int or None): Seed of the MCTS playouts.
+        """
+        self.symbol = symbol
+        self.board_size = board_size
+        if algorithm == 'mcts':
+            self.engine = MCTS(board_size, time_budget_ms=time_budget_ms, iterations=iterations,
+                               win_length=win_length, seed=seed)
+        else:
+            self.engine = AI(board_size, max_depth=depth, time_budget_ms=time_budget_ms, win_length=win_length)
+
+    def _new_game(self):
+        """Resets the engine's position, keeping its caches warm."""
+        self.engine._new_game()
+
+    def _observe(self, cell, player):
+        """Forwards a move to the engine, from the engine's point of view."""
+        self.engine._notify_move(cell, 2 if player == self.symbol else 1)
+
+    def _choose(self, position):
+        """Returns the engine's best move as a cell index."""
+        row, col = self.engine._best_move()
+        return row * self.board_size + col
+
+
+class Simulator:
+    """
+    Plays batches of headless games between two agents and streams the results.
+
+    An agent is described by a spec string:
+    - 'ai' or 'ai:<depth>': the minimax engine with a fixed depth (3 by default),
+    - 'mcts' or 'mcts:<iterations>': the MCTS engine with a fixed number of playouts
+      (MCTS.DEFAULT_ITERATIONS by default),
+    - 'random': random moves,
+    - 'scripted:<p1>,<p2>,...': preferred positions, numbered from 1 like in the move log.
+
+    With a time budget per move, both engines search for that long instead, the depth or
+    iterations of a spec becoming an upper limit: this compares engines at equal time.
+
+    The two agents swap colors every game, so both get to move first equally often.
+    Win/draw/loss rates are reported from the first agent's point of view.
+    """
+
+    CHUNK_SIZE = 25  # Games per task sent to a worker process
+
+    @staticmethod
+    def _make_agent(spec, symbol, board_size, seed, win_length=None, time_budget_ms=None):
+        """
+        Builds an agent from its spec string.
+
+        Raises:
+            ValueError: If the spec is not recognized.
+        """
+        kind, _, argument = spec.partition(':')
+        if kind == 'ai':
+            depth = int(argument) if argument else (3 if time_budget_ms is None else None)
+            return EngineAgent(symbol, board_size, depth=depth, time_budget_ms=time_budget_ms, win_length=win_length)
+        if kind == 'mcts':
+            return EngineAgent(symbol, board_size, time_budget_ms=time_budget_ms, win_length=win_length,
+                               algorithm='mcts', iterations=int(argument) if argument else None, seed=seed)
+        if kind == 'random':
+            return RandomAgent(symbol, board_size, seed)
+        if kind == 'scripted':
+            return ScriptedAgent(symbol, board_size, [int(position) for position in argument.split(',') if position])
+        raise ValueError(f"Unknown agent spec {spec!r}, expected 'ai[:depth]', 'mcts[:iterations]', 'random' "
+                         f"or 'scripted:<positions>'.")
+
+    @staticmethod
+    def _play_game(board_size, agents, win_length=None):
+        """
+        Plays one game to the end.
+
+        Args:
+            board_size (int): Size of the board.
+            agents (dict): Maps symbol 1 (X, moves first) and 2 (O) to agents.
+            win_length (int or None): Marks in a row needed to win, None for the board size.
+
+        Returns:
+            tuple: (winner, moves, latencies) where winner is 0 for a draw, moves are log
+                   positions (numbered from 1) and latencies are per-move times in ms.
+        """
+        position = GameState(board_size, win_length)
+        for agent in agents.values():
+            agent._new_game()
+
+        moves, latencies = [], []
+        player = 1
+        while True:
+            start = time.perf_counter()
+            cell = agents[player]._choose(position)
+            latencies.append((time.perf_counter() - start) * 1000)
+            if not position._is_legal(cell):
+                raise ValueError(f"Agent for player {player} played occupied cell {cell + 1}.")
+
+            position._make(cell, player)
+            moves.append(position._position(cell))
+            for agent in agents.values():
+                agent._observe(cell, player)
+            if position.winner:
+                return player, moves, latencies
+            if position._is_full():
+                return 0, moves, latencies
+            player = 3 - player
+
+    @classmethod
+    def _run_chunk(cls, board_size, win_length, spec_a, spec_b, game_indices, seed, time_budget_ms=None):
+        """
+        Plays a chunk of games in a worker process, reusing the agents between games.
+
+        Returns:
+            list: One result dict per game.
+        """
+        agents_a = {symbol: cls._make_agent(spec_a, symbol, board_size, seed * 7919 + symbol, win_length,
+                                            time_budget_ms) for symbol in (1, 2)}
+        agents_b = {symbol: cls._make_agent(spec_b, symbol, board_size, seed * 7919 + 2 + symbol, win_length,
+                                            time_budget_ms) for symbol in (1, 2)}
+
+        results = []
+        for index in game_indices:
+            a_symbol = 1 if index % 2 == 0 else 2  # Swap colors every game
+            agents = {a_symbol: agents_a[a_symbol], 3 - a_symbol: agents_b[3 - a_symbol]}
+            for agent in agents.values():
+                if isinstance(agent, RandomAgent):
+                    agent.random.seed(seed * 1000003 + index)  # Each game is reproducible on its own
+            winner, moves, latencies = cls._play_game(board_size, agents, win_length)
+            results.append({
+                'game': index,
+                'board_size': board_size,
+                'win_length': win_length or board_size,
+                'x': spec_a if a_symbol == 1 else spec_b,
+                'o': spec_b if a_symbol == 1 else spec_a,
+                'a_symbol': a_symbol,
+                'winner': winner,
+                'moves': moves,
+                'latency_ms': [round(latency, 3) for latency in latencies],
+            })
+        return results
+
+    def __init__(self, workers=1, seed=0, win_length=None, time_budget_ms=None):
+        """
+        Args:
+            workers (int): Number of worker processes; 1 plays in this process.
+            seed (int): Base seed of the random agents.
+            win_length (int or None): Marks in a row needed to win, capped at each board size;
+                                      None for full rows.
+            time_budget_ms (int or None): Time per move of the engine agents, None for fixed
+                                          depths and iterations.
+        """
+        self.workers = workers
+        self.seed = seed
+        self.win_length = win_length
+        self.time_budget_ms = time_budget_ms
+
+    def _run(self, board_sizes, spec_a, spec_b, games, output):
+        """
+        Plays `games` games per board size and streams each result to `output` as a JSON line.
+
+        Args:
+            board_sizes (list): Board sizes to simulate.
+            spec_a (str): Spec of the first agent.
+            spec_b (str): Spec of the second agent.
+            games (int): Number of games per board size.
+            output (file): Writable text file for the JSON lines.
+
+        Returns:
+            dict: Summary per board size (games, games/sec, win/draw/loss rates of agent A,
+                  mean move latency overall and of each agent).
+        """
+        tasks = []
+        for board_size in board_sizes:
+            for start in range(0, games, self.CHUNK_SIZE):
+                indices = list(range(start, min(start + self.CHUNK_SIZE, games)))
+                win_length = min(self.win_length, board_size) if self.win_length else None
+                tasks.append((board_size, win_length, spec_a, spec_b, indices, self.seed + board_size,
+                              self.time_budget_ms))
+
+        totals = {size: {'games': 0, 'wins': 0, 'draws': 0, 'losses': 0, 'moves': 0, 'latency_ms': 0.0,
+                         'a_moves': 0, 'a_latency_ms': 0.0} for size in board_sizes}
+        start_time = time.perf_counter()
+
+        def record(results):
+            for result in results:
+                output.write(json.dumps(result) + "\n")
+                total = totals[result['board_size']]
+                total['games'] += 1
+                if result['winner'] == 0:
+                    total['draws'] += 1
+                elif result['winner'] == result['a_symbol']:
+                    total['wins'] += 1
+                else:
+                    total['losses'] += 1
+                total['moves'] += len(result['moves'])
+                total['latency_ms'] += sum(result['latency_ms'])
+                a_latencies = result['latency_ms'][result['a_symbol'] - 1::2]  # X plays the even plies
+                total['a_moves'] += len(a_latencies)
+                total['a_latency_ms'] += sum(a_latencies)
+
+        if self.workers <= 1:
+            for task in tasks:
+                record(self._run_chunk(*task))
+        else:
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                futures = [executor.submit(Simulator._run_chunk, *task) for task in tasks]
+                for future in as_completed(futures):  # Stream results as soon as a chunk is done
+                    record(future.result())
+
+        elapsed = time.perf_counter() - start_time
+        summary = {}
+        for size, total in totals.items():
+            count = max(total['games'], 1)
+            summary[size] = {
+                'games': total['games'],
+                'win_rate': total['wins'] / count,
+                'draw_rate': total['draws'] / count,
+                'loss_rate': total['losses'] / count,
+                'mean_move_latency_ms': total['latency_ms'] / max(total['moves'], 1),
+                'a_mean_move_latency_ms': total['a_latency_ms'] / max(total['a_moves'], 1),
+                'b_mean_move_latency_ms': ((total['latency_ms'] - total['a_latency_ms'])
+                                           / max(total['moves'] - total['a_moves'], 1)),
+            }
+        summary['elapsed_s'] = elapsed
+        summary['games_per_s'] = sum(total['games'] for total in totals.values()) / elapsed if elapsed else 0.0
+        return summary
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Play headless Tic-Tac-Toe games between two agents.")
+    parser.add_argument('--size', type=int, nargs='+', default=[3], help="Board sizes to simulate.")
+    parser.add_argument('--a', default='ai',
+                        help="First agent: 'ai[:depth]', 'mcts[:iterations]', 'random' or 'scripted:<positions>'.")
+    parser.add_argument('--b', default='random', help="Second agent, same format as --a.")
+    parser.add_argument('--win-length', type=int, default=None, help="Marks in a row to win (default: full rows).")
+    parser.add_argument('--time-ms', type=int, default=None,
+                        help="Time per move of both engines (compares them at equal time).")
+    parser.add_argument('--games', type=int, default=100, help="Games per board size.")
+    parser.add_argument('--workers', type=int, default=1, help="Worker processes.")
+    parser.add_argument('--seed', type=int, default=0, help="Base seed of the random agents.")
+    parser.add_argument('--output', default='simulation.jsonl', help="JSON lines file receiving one line per game.")
+    args = parser.parse_args()
+
+    with open(args.output, 'w') as results_file:
+        report = Simulator(args.workers, args.seed, args.win_length, args.time_ms)._run(args.size, args.a, args.b, args.games, results_file)
+
+    print(f"{args.a} vs {args.b}: {report['games_per_s']:.1f} games/s ({report['elapsed_s']:.2f}s)")
+    for board_size in args.size:
+        stats = report[board_size]
+        print(f"  {board_size}x{board_size}: {stats['games']} games, "
+              f"win {stats['win_rate']:.1%} / draw {stats['draw_rate']:.1%} / loss {stats['loss_rate']:.1%}, "
+              f"mean move {stats['mean_move_latency_ms']:.2f} ms "
+              f"({args.a} {stats['a_mean_move_latency_ms']:.2f} ms, {args.b} {stats['b_mean_move_latency_ms']:.2f} ms)")
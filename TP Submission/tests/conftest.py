@@ -0,0 +1,26 @@
+import pytest
+
+from aiPlayer import AIPlayer
+from logger import Logger
+
+
+@pytest.fixture
+def ai_player(tmp_path):
+    """
+    Returns a factory of (AIPlayer playing O, Logger) for a board size, logging to tmp_path.
+
+    Every player and logger it made is closed after the test, even when the test fails.
+    """
+    made = []
+
+    def make(board_size=3, **kwargs):
+        logger = Logger(str(tmp_path / "log.txt"))
+        logger._set_board_size(board_size)
+        player = AIPlayer(2, board_size, logger, **kwargs)
+        made.append((player, logger))
+        return player, logger
+
+    yield make
+    for player, logger in made:
+        player._close()
+        logger._close()
@@ -0,0 +1,47 @@
+import sys
+import time
+
+from game_state import GameState
+
+
+def _wait_for_move(player, state, logger, timeout=5.0):
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        move = player._poll_move(state, logger)
+        if move is not None:
+            return move
+        time.sleep(0.005)
+    raise AssertionError("the background search did not finish")
+
+
+def test_background_search_plays_a_move(ai_player):
+    player, logger = ai_player(time_budget_ms=50)
+    state = GameState(3)
+    state._make(4, 1)
+    player._notify_move(1, 1, 1)
+    player._start_move(state)
+    assert player._is_thinking()
+    move = _wait_for_move(player, state, logger)
+    assert not player._is_thinking()
+    assert state.masks[2] == 1 << state._cell(*move)
+
+
+def test_cancel_returns_promptly(ai_player):
+    player, _ = ai_player(board_size=7, time_budget_ms=30000)
+    state = GameState(7)
+    player._start_move(state)
+    time.sleep(0.05)
+    start = time.perf_counter()
+    player._cancel_move()
+    assert time.perf_counter() - start < 0.5
+    assert not player._is_thinking()
+    assert state.masks[2] == 0  # Nothing was played
+
+
+def test_switch_interval_is_restored(ai_player):
+    default = sys.getswitchinterval()
+    player, logger = ai_player(time_budget_ms=20)
+    state = GameState(3)
+    player._start_move(state)
+    _wait_for_move(player, state, logger)
+    assert sys.getswitchinterval() == default
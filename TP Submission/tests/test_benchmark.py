@@ -0,0 +1,34 @@
+from benchmark import CORPUS, Benchmark, _compare
+
+
+def _results(time_ms_min=10.0, nodes_per_s=1000, nodes=500, move=(1, 1)):
+    return {'searches': {'3x3/midgame': {'time_ms_min': time_ms_min, 'nodes_per_s': nodes_per_s, 'peak_kib': 100.0,
+                                         'nodes': nodes, 'move': list(move)}},
+            'primitives': {'3x3/is_win': {'ns_per_call_min': 200.0, 'peak_kib': 1.0}}}
+
+
+def test_compare_flags_regressions_and_improvements():
+    report = _compare(_results(), _results(time_ms_min=12.0, nodes_per_s=1200))
+    assert [(entry['metric'], entry['change']) for entry in report['regressions']] == [('time_ms_min', 0.2)]
+    assert [entry['metric'] for entry in report['improvements']] == ['nodes_per_s']
+    assert report['changed'] == [] and report['missing'] == []
+    assert _compare(_results(), _results(time_ms_min=10.5))['regressions'] == []  # Within the threshold
+
+
+def test_compare_reports_changed_and_missing_benchmarks():
+    report = _compare(_results(), _results(nodes=480))
+    assert report['changed'][0]['benchmark'] == '3x3/midgame'
+    current = _results()
+    del current['primitives']['3x3/is_win']
+    assert _compare(_results(), current)['missing'] == ['primitives:3x3/is_win']
+
+
+def test_suite_runs_on_a_small_corpus():
+    names = []
+    suite = Benchmark(repeats=1, corpus=[entry for entry in CORPUS if entry['name'] == '3x3/midgame'], name_filter='3x3/')
+    suite.PRIMITIVE_CALLS = 100
+    results = suite._run(progress=names.append)
+    search = results['searches']['3x3/midgame']
+    assert search['nodes'] > 0 and search['move'] is not None
+    assert names[0] == '3x3/midgame' and '3x3/is_win' in results['primitives']
+    assert _compare(results, results) == {'regressions': [], 'improvements': [], 'changed': [], 'missing': []}
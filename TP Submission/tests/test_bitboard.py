@@ -0,0 +1,64 @@
+import numpy as np
+from bitboard import Bitboard
+from minimax_ai import AI
+
+
+def test_row_column_and_diagonal_wins():
+    for cells in ([0, 1, 2], [0, 3, 6], [0, 4, 8], [2, 4, 6]):
+        bitboard = Bitboard(3)
+        for cell in cells:
+            bitboard._make(cell, 1)
+        assert bitboard._is_win(1)
+        assert not bitboard._is_win(2)
+        assert bitboard._winner() == 1
+        assert bitboard._is_win_at(cells[-1], 1)
+
+
+def test_no_win_on_broken_line():
+    bitboard = Bitboard(3)
+    for cell, player in ((0, 1), (1, 2), (2, 1)):
+        bitboard._make(cell, player)
+    assert bitboard._winner() == 0
+
+
+def test_full_board_and_empty_cells():
+    bitboard = Bitboard(3)
+    assert bitboard._empty_cells() == list(range(9))
+    for cell in range(9):
+        bitboard._make(cell, 1 + cell % 2)
+    assert bitboard._is_full()
+    assert bitboard._empty_cells() == []
+
+
+def test_make_unmake_restores_masks_and_hash():
+    bitboard = Bitboard(5)
+    bitboard._make(7, 1)
+    masks, key = list(bitboard.masks), bitboard.hash
+    bitboard._make(12, 2)
+    bitboard._unmake(12, 2)
+    assert bitboard.masks == masks
+    assert bitboard.hash == key
+
+
+def test_from_array_matches_moves():
+    board = np.zeros((3, 3), dtype=int)
+    board[0][0], board[1][1] = 1, 2
+    bitboard = Bitboard._from_array(board)
+    assert bitboard.masks[1] == 1 << 0
+    assert bitboard.masks[2] == 1 << 4
+
+
+def test_ai_takes_the_win_and_blocks():
+    board = np.array([[2, 2, 0], [1, 1, 0], [1, 0, 0]])
+    assert AI(3)._best_move(board) == (0, 2)
+    board = np.array([[1, 1, 0], [0, 2, 0], [0, 0, 0]])
+    assert AI(3)._best_move(board) == (0, 2)
+
+
+def test_from_masks_matches_the_moves():
+    bitboard = Bitboard(4)
+    for cell, player in ((5, 1), (0, 2), (10, 1)):
+        bitboard._make(cell, player)
+    rebuilt = Bitboard._from_masks(4, (bitboard.masks[1], bitboard.masks[2]))
+    assert rebuilt.masks == bitboard.masks
+    assert rebuilt._canonical_key(2) == bitboard._canonical_key(2)
@@ -0,0 +1,47 @@
+import numpy as np
+
+from bitboard import Bitboard
+from evaluator import LineEvaluator
+
+
+def _random_boards(board_size, count, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.integers(0, 3, size=(count, board_size, board_size))
+
+
+def test_open_line_weights():
+    evaluator = LineEvaluator(3)
+    board = np.zeros((3, 3), dtype=int)
+    board[1, 1] = 2  # The center is on 4 open lines of one piece
+    assert evaluator._evaluate(board) == 4
+    board[0, 0] = 1  # Closes the diagonal for both players, opens 2 lines for player 1
+    assert evaluator._evaluate(board) == 3 - 2
+    assert LineEvaluator(3, player=1)._evaluate(board) == -(3 - 2)
+
+
+def test_batch_matches_single_boards():
+    for board_size, win_length in ((3, None), (5, None), (6, 4)):
+        evaluator = LineEvaluator(board_size, win_length=win_length)
+        boards = _random_boards(board_size, 20)
+        expected = [evaluator._evaluate(board) for board in boards]
+        assert evaluator._evaluate_batch(boards).tolist() == expected
+
+
+def test_score_limit_clips():
+    evaluator = LineEvaluator(5, score_limit=50)
+    board = np.zeros((5, 5), dtype=int)
+    board[0, :4] = 2
+    assert evaluator._evaluate(board) == 50
+
+
+def test_children_match_making_each_move():
+    evaluator = LineEvaluator(4)
+    board = np.array([[1, 0, 0, 0], [0, 2, 0, 0], [0, 0, 0, 0], [0, 0, 0, 1]])
+    bitboard = Bitboard._from_array(board)
+    cells = bitboard._empty_cells()
+    expected = []
+    for cell in cells:
+        child = board.copy()
+        child[divmod(cell, 4)] = 2
+        expected.append(evaluator._evaluate(child))
+    assert evaluator._evaluate_children(bitboard, cells, 2).tolist() == expected
@@ -0,0 +1,67 @@
+import pickle
+
+import pytest
+
+from game_state import GameState
+
+
+def _state(moves, board_size=3, win_length=None):
+    state = GameState(board_size, win_length)
+    for cell, player in moves:
+        state._make(cell, player)
+    return state
+
+
+def test_make_caches_the_winner():
+    state = _state([(0, 1), (3, 2), (1, 1), (4, 2)])
+    assert not state._make(8, 1)
+    assert state._make(5, 2)
+    assert state.winner == 2 and state._is_over()
+    assert not state._is_legal(2)  # No move after a win
+
+
+def test_undo_restores_the_position():
+    state = _state([(4, 1), (0, 2)])
+    before = (bytes(state.cells), list(state.masks), state.empty_count)
+    state._make(8, 1)
+    assert state._undo() == (8, 1)
+    assert (bytes(state.cells), list(state.masks), state.empty_count) == before
+    assert state._moves() == [(4, 1), (0, 2)]
+
+
+def test_illegal_moves_raise():
+    state = _state([(4, 1)])
+    for cell in (4, 9, -1):
+        with pytest.raises(ValueError):
+            state._make(cell, 2)
+    assert state.history.tolist() == [4]
+
+
+def test_draw_and_reset():
+    state = _state(enumerate([1, 2, 1, 1, 2, 2, 2, 1, 1]))
+    assert state._is_full() and state._is_over() and state.winner == 0
+    state._reset()
+    assert state.empty_count == 9 and state._empty_cells() == list(range(9)) and not state.history
+
+
+def test_array_view_follows_moves():
+    state = GameState(4)
+    board = state._as_array()
+    state._make(state._cell(1, 2), 1)
+    assert board.shape == (4, 4) and board[1][2] == 1
+
+
+def test_copy_is_independent():
+    state = _state([(0, 1), (1, 1)])
+    clone = state._copy()
+    clone._make(2, 1)
+    assert clone.winner == 1
+    assert state.winner == 0 and state._is_legal(2) and state.masks[1] == 0b11
+
+
+def test_serialize_and_pickle_round_trip():
+    state = _state([(12, 1), (6, 2), (18, 1)], board_size=5, win_length=4)
+    for copy in (GameState._deserialize(state._serialize()), pickle.loads(pickle.dumps(state))):
+        assert copy._moves() == state._moves()
+        assert (copy.board_size, copy.win_length) == (5, 4)
+        assert copy.masks == state.masks and copy.empty_count == state.empty_count
@@ -0,0 +1,43 @@
+import time
+
+import numpy as np
+
+from minimax_ai import AI
+
+
+def test_time_budget_is_respected():
+    ai = AI(5, time_budget_ms=100)
+    start = time.perf_counter()
+    move = ai._best_move(np.zeros((5, 5), dtype=int))
+    elapsed = time.perf_counter() - start
+    assert move is not None
+    assert ai.completed_depth >= 1
+    assert elapsed < 0.5  # The budget plus the check interval and one completed iteration
+
+
+def test_fixed_depth_without_budget():
+    ai = AI(3, max_depth=2)
+    assert ai._best_move(np.zeros((3, 3), dtype=int)) is not None
+    assert ai.completed_depth == 2
+    assert sorted(ai.nodes_per_depth) == [1, 2]
+
+
+def test_pv_starts_with_the_move_played():
+    ai = AI(3, max_depth=4)
+    board = np.array([[1, 0, 0], [0, 0, 0], [0, 0, 0]])
+    row, col = ai._best_move(board)
+    assert ai.pv[0] == row * 3 + col
+
+
+def test_stop_request_returns_the_last_completed_move():
+    ai = AI(5, time_budget_ms=10000)
+    ai.stop_requested = True  # Abandons every iteration after the first
+    start = time.perf_counter()
+    assert ai._best_move(np.zeros((5, 5), dtype=int)) is not None
+    assert time.perf_counter() - start < 1
+    assert ai.completed_depth >= 1
+
+
+def test_full_board_has_no_move():
+    board = np.array([[1, 2, 1], [1, 2, 2], [2, 1, 1]])
+    assert AI(3)._best_move(board) is None
@@ -0,0 +1,65 @@
+import numpy as np
+
+from bitboard import Bitboard
+from minimax_ai import AI
+
+
+def _position(board_size, win_length, moves):
+    bitboard = Bitboard(board_size, win_length)
+    for cell, player in moves:
+        bitboard._make(cell, player)
+    return bitboard
+
+
+def test_segment_counts():
+    assert len(Bitboard._build_lines(3)) == 8
+    # Rows and columns: 2 * n * (n - k + 1); each diagonal direction: (n - k + 1) ** 2
+    assert len(Bitboard._build_lines(7, 4)) == 2 * 7 * 4 + 2 * 4 * 4
+    assert all(len(line) == 5 for line in Bitboard._build_lines(15, 5))
+
+
+def test_k_in_a_row_wins_anywhere():
+    bitboard = _position(9, 4, [(20, 2), (30, 2), (40, 2)])  # Diagonal from (2, 2)
+    assert not bitboard._winner()
+    bitboard._make(50, 2)
+    assert bitboard._is_win_at(50, 2)
+    assert bitboard._winner() == 2
+
+
+def test_candidate_cells_stay_near_the_pieces():
+    assert Bitboard(9)._candidate_cells(2) == [40]  # Empty board: only the center
+    bitboard = _position(9, 5, [(0, 1)])
+    assert bitboard._candidate_cells(1) == [1, 9, 10]
+    assert len(bitboard._candidate_cells(None)) == 80
+
+
+def test_winning_cells():
+    bitboard = _position(7, 4, [(8, 2), (9, 2), (10, 2), (22, 1), (29, 1), (36, 1)])
+    assert bitboard._winning_cells(2, bitboard._empty_cells()) == [7, 11]
+    assert bitboard._winning_cells(1, bitboard._empty_cells()) == [15, 43]
+
+
+def test_ai_wins_and_blocks_on_large_boards():
+    board = np.zeros((9, 9), dtype=int)
+    board[4, 2:5] = 2
+    board[0, 0:3] = 1
+    assert AI(9, win_length=4, time_budget_ms=200)._best_move(board) in ((4, 1), (4, 5))
+    board[4, 2:5] = 0
+    board[5, 5] = 2
+    assert AI(9, win_length=4, time_budget_ms=200)._best_move(board) == (0, 3)
+
+
+def test_board_size_update_rederives_limits():
+    ai = AI(3)
+    assert (ai.radius, ai.max_depth) == (None, 5)
+    ai._update_board_size(9, 5)
+    assert (ai.board_size, ai.win_length, ai.radius, ai.max_depth) == (9, 5, 2, 5)
+    assert ai._best_move(np.zeros((9, 9), dtype=int)) == (4, 4)
+
+    timed = AI(3, time_budget_ms=100)
+    timed._update_board_size(7)
+    assert (timed.radius, timed.max_depth) == (2, 49)
+
+    explicit = AI(3, max_depth=3, radius=1)
+    explicit._update_board_size(9)
+    assert (explicit.radius, explicit.max_depth) == (1, 3)
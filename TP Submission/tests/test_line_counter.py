@@ -0,0 +1,50 @@
+from line_counter import LineCounter
+
+
+def test_make_detects_wins_on_rows_columns_and_diagonals():
+    for cells in ([0, 1, 2], [1, 4, 7], [0, 4, 8], [2, 4, 6]):
+        counter = LineCounter(3)
+        assert [counter._make(cell, 1) for cell in cells] == [False, False, True]
+        assert counter.winner == 1
+
+
+def test_k_in_a_row_on_a_larger_board():
+    counter = LineCounter(5, 3)
+    assert not counter._make(6, 2)
+    assert not counter._make(7, 2)
+    assert counter._make(8, 2)
+    assert counter.winner == 2
+
+
+def test_unmake_restores_counts():
+    counter = LineCounter(3)
+    before = [list(counts) for counts in counter.counts]
+    for cell in (0, 1, 2):
+        counter._make(cell, 1)
+    for cell in (2, 1, 0):
+        counter._unmake(cell, 1)
+    assert counter.counts == before
+    assert counter.winner == 0
+    assert counter.empty_count == 9
+
+
+def test_full_board_and_reset():
+    counter = LineCounter(3)
+    for cell, player in enumerate([1, 2, 1, 1, 2, 2, 2, 1, 1]):
+        assert not counter._make(cell, player)
+    assert counter._is_full()
+    assert counter.winner == 0
+    counter._reset()
+    assert not counter._is_full()
+    assert counter.empty_count == 9
+
+
+def test_copy_is_independent():
+    counter = LineCounter(3)
+    counter._make(0, 1)
+    clone = counter._copy()
+    clone._make(1, 1)
+    clone._make(2, 1)
+    assert clone.winner == 1
+    assert counter.winner == 0
+    assert counter.empty_count == 8
@@ -0,0 +1,63 @@
+from log_analyzer import LogParser, _analyze
+from logger import Logger
+
+GAMES = [
+    (3, None, [1, 4, 2, 5, 3]),  # X wins on the top row
+    (3, None, [1, 5, 2, 3, 9, 7]),  # O wins on a diagonal
+    (3, None, [1, 5, 2, 3, 7, 4, 6, 8, 9]),  # Draw
+    (3, None, [5, 1]),  # Unfinished
+    (3, None, [5, 5]),  # Invalid: the same cell twice
+    (5, 4, [7, 1, 8, 2, 9, 3, 10]),  # X wins with 4 in a row
+]
+
+
+def _write_log(path, log_format, repeat=20):
+    logger = Logger(str(path), log_format, buffer_size=256)
+    for index in range(repeat):
+        for board_size, win_length, positions in GAMES:
+            if logger.move_log:
+                logger._restart_round()
+            logger._set_board_size(board_size, win_length)
+            for ply, position in enumerate(positions):
+                logger._log_move(position, 1 + ply % 2)
+            logger._end_round()
+    logger._close()
+
+
+def test_parser_reads_back_every_round(tmp_path):
+    for log_format in Logger.FORMATS:
+        path = tmp_path / f"log.{log_format}"
+        _write_log(path, log_format, repeat=1)
+        parser = LogParser(str(path))
+        try:
+            assert parser.log_format == log_format
+            rounds = list(parser._rounds())
+        finally:
+            parser._close()
+        assert [list(game_round.positions) for game_round in rounds] == [positions for _, _, positions in GAMES]
+        assert [game_round.number for game_round in rounds] == [1, 2, 3, 4, 5, 6]
+        assert rounds[5].board_size == 5 and rounds[5].win_length == 4
+        assert list(rounds[0].players) == [1, 2, 1, 2, 1]
+
+
+def test_same_summary_for_every_format_and_worker_count(tmp_path):
+    summaries = []
+    for log_format in Logger.FORMATS:
+        path = tmp_path / f"log.{log_format}"
+        _write_log(path, log_format)
+        for workers in (1, 3):
+            summaries.append(_analyze(str(path), workers)._summary())
+    assert all(summary == summaries[0] for summary in summaries)
+
+    summary = summaries[0]
+    assert summary['3x3']['outcomes'] == {'x_wins': 20, 'o_wins': 20, 'draws': 20, 'unfinished': 20, 'invalid': 20}
+    assert summary['3x3']['average_length'] == (5 + 6 + 9) / 3
+    assert summary['3x3']['human_beat_ai'] == [{'moves': [1, 4, 2, 5, 3], 'count': 20}]
+    assert summary['5x5/4']['outcomes']['x_wins'] == 20
+    assert summary['5x5/4']['openings'] == [{'moves': [7, 1], 'count': 20}]
+
+
+def test_empty_log(tmp_path):
+    path = tmp_path / "empty.txt"
+    path.write_text("")
+    assert _analyze(str(path), 2)._summary() == {}
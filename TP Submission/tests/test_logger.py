@@ -0,0 +1,86 @@
+import json
+
+import pytest
+
+from logger import Logger
+
+
+def _log_rounds(path, log_format, rounds=2, board_size=3, win_length=None):
+    logger = Logger(str(path), log_format)
+    logger._set_board_size(board_size, win_length)
+    for round_index in range(rounds):
+        if round_index:
+            logger._restart_round()
+        logger._log_move(5, 1)
+        logger._log_move(1, 2)
+        logger._end_round()
+    logger._close()
+    return logger
+
+
+def test_text_layout(tmp_path):
+    path = tmp_path / "log.txt"
+    _log_rounds(path, 'text', rounds=1)
+    assert path.read_text() == "\nRound 1 (Board Size: 3x3):\nX\tO\nX:5\t\n\tO:1\n"
+    _log_rounds(path, 'text', rounds=1, board_size=5, win_length=4)
+    assert "Round 2 (Board Size: 5x5, Win Length: 4):" in path.read_text()
+
+
+def test_jsonl_records(tmp_path):
+    path = tmp_path / "log.jsonl"
+    _log_rounds(path, 'jsonl')
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    assert records[0] == {'type': 'round', 'round': 1, 'board_size': 3}
+    assert records[1] == {'type': 'move', 'round': 1, 'player': 1, 'position': 5}
+    assert [record['round'] for record in records] == [1, 1, 1, 2, 2, 2]
+
+
+def test_binary_records(tmp_path):
+    path = tmp_path / "log.bin"
+    _log_rounds(path, 'binary')
+    data = path.read_bytes()
+    assert data[:4] == Logger.BINARY_MAGIC
+    records = list(Logger.BINARY_RECORD.iter_unpack(data[Logger.BINARY_HEADER.size:]))
+    assert records[:3] == [(1, 3, 0, 0), (1, 3, 1, 5), (1, 3, 2, 1)]
+    assert len(records) == 6
+
+
+def test_sidecar_gives_the_next_round_number(tmp_path):
+    for log_format in Logger.FORMATS:
+        path = tmp_path / f"log.{log_format}"
+        _log_rounds(path, log_format)
+        index = json.loads((tmp_path / f"log.{log_format}.idx").read_text())
+        assert index == {'rounds': 2, 'log_bytes': path.stat().st_size, 'format': log_format}
+        assert Logger(str(path), log_format).round_number == 3
+
+
+def test_stale_sidecar_triggers_a_rescan(tmp_path):
+    path = tmp_path / "log.txt"
+    _log_rounds(path, 'text')
+    with open(path, "a") as file:  # Edited behind the logger's back
+        file.write("\nRound 3 (Board Size: 3x3):\nX\tO\nX:1\t\n")
+    logger = Logger(str(path))
+    assert logger.round_number == 4
+    assert json.loads((tmp_path / "log.txt.idx").read_text())['log_bytes'] == path.stat().st_size
+
+    (tmp_path / "log.txt.idx").unlink()
+    assert Logger(str(path)).round_number == 4
+
+
+def test_moves_are_buffered_until_the_round_ends(tmp_path):
+    path = tmp_path / "log.txt"
+    logger = Logger(str(path), flush_interval=60)
+    logger._set_board_size(3)
+    logger._log_move(5, 1)
+    assert not path.exists()
+    logger._end_round()
+    assert "X:5" in path.read_text()
+    logger._close()
+
+
+def test_invalid_settings_are_rejected(tmp_path):
+    for call in (lambda: Logger(str(tmp_path / "log"), 'xml'),
+                 lambda: Logger(str(tmp_path / "log"))._set_board_size(2),
+                 lambda: Logger(str(tmp_path / "log"))._set_board_size(5, 6)):
+        with pytest.raises(ValueError):
+            call()
@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+from mcts_ai import MCTS
+
+
+def test_takes_the_win_and_blocks():
+    board = np.array([[2, 2, 0], [1, 1, 0], [1, 0, 0]])
+    assert MCTS(3, iterations=200, seed=1)._best_move(board) == (0, 2)
+    board = np.array([[1, 1, 0], [0, 2, 0], [0, 0, 0]])
+    assert MCTS(3, iterations=200, seed=1)._best_move(board) == (0, 2)
+
+
+def test_iteration_budget_is_honored():
+    engine = MCTS(5, iterations=300, seed=0)
+    assert engine._best_move(np.zeros((5, 5), dtype=int)) is not None
+    assert engine.nodes == 300
+    assert sum(child.visits for child in engine.root.children.values()) == 300
+
+
+def test_same_seed_same_move():
+    board = np.zeros((5, 5), dtype=int)
+    board[2, 2] = 1
+    moves = {MCTS(5, iterations=500, seed=7)._best_move(board) for _ in range(2)}
+    assert len(moves) == 1
+
+
+def test_tree_is_reused_after_moves():
+    engine = MCTS(4, iterations=2000, seed=0)
+    row, col = engine._best_move(np.zeros((4, 4), dtype=int))
+    engine._notify_move(row * 4 + col, 2)
+    reply = max(engine.root.children.values(), key=lambda child: child.visits)
+    visits = reply.visits
+    engine._notify_move(reply.move, 1)
+    assert engine.root is reply and engine.tree_size == visits
+    engine._best_move()
+    assert engine.root.visits >= visits + 2000  # Statistics of the earlier search are kept
+
+
+def test_tree_is_dropped_when_it_does_not_match():
+    engine = MCTS(4, iterations=100, seed=0)
+    engine._best_move(np.zeros((4, 4), dtype=int))
+    engine._notify_move(5, 1)  # The root's children are moves of player 2
+    assert engine.root is None
+    assert engine._best_move() is not None
+
+
+def test_finished_positions_have_no_move():
+    assert MCTS(3, iterations=10)._best_move(np.array([[1, 2, 1], [1, 2, 2], [2, 1, 1]])) is None
+    assert MCTS(3, iterations=10)._best_move(np.array([[1, 1, 1], [2, 2, 0], [0, 0, 0]])) is None
+
+
+def test_invalid_budgets_are_rejected():
+    for kwargs in ({'iterations': 0}, {'time_budget_ms': -1}):
+        with pytest.raises(ValueError):
+            MCTS(3, **kwargs)
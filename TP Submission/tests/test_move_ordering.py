@@ -0,0 +1,59 @@
+import numpy as np
+
+from minimax_ai import AI
+from move_ordering import MoveOrderer
+
+
+POSITIONS = [
+    np.array([[1, 0, 0], [0, 0, 0], [0, 0, 0]]),
+    np.array([[1, 2, 0], [0, 1, 0], [0, 0, 0]]),
+    np.array([[1, 0, 0, 0], [0, 2, 0, 0], [0, 0, 1, 0], [0, 0, 0, 0]]),
+]
+
+
+def test_ordering_does_not_change_the_score():
+    for board in POSITIONS:
+        size = len(board)
+        ordered = AI(size, max_depth=4)
+        plain = AI(size, max_depth=4, move_ordering=False)
+        ordered._best_move(board)
+        plain._best_move(board)
+        assert ordered.best_score == plain.best_score
+
+
+def test_ordering_searches_fewer_nodes():
+    board = POSITIONS[2]
+    ordered = AI(4, max_depth=4)
+    plain = AI(4, max_depth=4, move_ordering=False)
+    ordered._best_move(board)
+    plain._best_move(board)
+    assert ordered.nodes < plain.nodes
+
+
+def test_static_scores_prefer_the_center_then_corners():
+    orderer = MoveOrderer(3)
+    assert orderer._order_root(list(range(9)))[:5] == [4, 0, 2, 6, 8]
+
+
+def test_root_order_puts_threats_then_the_pv_first():
+    orderer = MoveOrderer(3)
+    assert orderer._order_root([1, 3, 4, 5], pv_move=5)[0] == 5
+    assert orderer._order_root([1, 3, 4, 5], pv_move=5, threats=[3])[:2] == [3, 5]
+    assert orderer._order_root([1, 3, 4], pv_move=7)[0] == 4  # A stale PV move is ignored
+
+
+def test_killers_and_history_order_inner_nodes():
+    orderer = MoveOrderer(3)
+    orderer._record_cutoff(1, 2, 2, 3)
+    assert orderer._order([0, 1, 4], 2, 2)[0] == 1  # Killer of the same depth
+    assert orderer._order([0, 1, 4], 3, 2)[0] == 1  # History score at another depth
+    assert orderer._order([0, 1, 4], 3, 1)[0] == 4  # The other player's history is separate
+    assert orderer._order([0, 1, 4], 2, 2, first_moves=(0, None))[:2] == [0, 1]
+
+
+def test_new_search_drops_killers_and_ages_history():
+    orderer = MoveOrderer(3)
+    orderer._record_cutoff(1, 2, 2, 3)
+    orderer._new_search()
+    assert orderer.killers[2] == []
+    assert orderer.history[2][1] == 4
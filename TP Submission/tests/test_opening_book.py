@@ -0,0 +1,77 @@
+import pytest
+
+from bitboard import Bitboard
+from minimax_ai import AI
+from opening_book import BookGenerator, OpeningBook
+
+
+def _position(moves, board_size=3):
+    bitboard = Bitboard(board_size)
+    for cell, player in moves:
+        bitboard._make(cell, player)
+    return bitboard
+
+
+def _rotate(cell, board_size=3):
+    row, col = divmod(cell, board_size)
+    return col * board_size + (board_size - 1 - row)
+
+
+def _book(tmp_path, max_stones=3):
+    path = str(tmp_path / "book.bin")
+    OpeningBook._write(path, 3, BookGenerator(3)._solve(max_stones))
+    return OpeningBook(path)
+
+
+def test_lookup_maps_moves_back_through_symmetries(tmp_path):
+    book = _book(tmp_path)
+    try:
+        moves = [(0, 1), (5, 2), (7, 1)]
+        (row, col), score = book._lookup(_position(moves))
+        rotated = [(_rotate(cell), player) for cell, player in moves]
+        assert book._lookup(_position(rotated)) == (divmod(_rotate(row * 3 + col), 3), score)
+        assert book.hits == 2
+    finally:
+        book._close()
+
+
+def test_book_moves_agree_with_the_search(tmp_path):
+    book = _book(tmp_path, max_stones=4)
+    try:
+        position = _position([(0, 1), (4, 2), (8, 1)])
+        move, score = book._lookup(position)
+        ai = AI(3, max_depth=9)
+        ai.position = position._copy()
+        ai._best_move()
+        assert score == ai.best_score
+        assert book._lookup(_position([(0, 1), (1, 1), (4, 2), (8, 2)]))[0] == (0, 2)  # Blocks the top row
+    finally:
+        book._close()
+
+
+def test_missing_positions_and_other_sizes_miss(tmp_path):
+    book = _book(tmp_path, max_stones=1)
+    try:
+        assert book._lookup(_position([(0, 1), (4, 2), (8, 1)])) is None
+        assert book._lookup(Bitboard(4)) is None
+        assert book.misses == 1  # Other board sizes are rejected before the search
+    finally:
+        book._close()
+
+
+def test_ai_plays_book_moves_without_searching(tmp_path):
+    book = _book(tmp_path)
+    try:
+        ai = AI(3, book=book, collect_stats=True)
+        assert ai._best_move() is not None
+        assert ai.nodes == 0
+        assert ai.stats.last['source'] == 'book'
+    finally:
+        book._close()
+
+
+def test_other_files_are_rejected(tmp_path):
+    path = tmp_path / "not_a_book.bin"
+    path.write_bytes(b'\0' * 32)
+    with pytest.raises(ValueError):
+        OpeningBook(str(path))
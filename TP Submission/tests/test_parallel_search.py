@@ -0,0 +1,51 @@
+import threading
+import time
+
+import numpy as np
+
+from minimax_ai import AI
+
+
+def test_parallel_search_matches_serial_search():
+    board = np.zeros((4, 4), dtype=int)
+    board[0, 0] = 1
+    board[1, 1] = 2
+    board[2, 1] = 1
+    serial = AI(4, max_depth=3)
+    parallel = AI(4, max_depth=3, workers=2)
+    try:
+        assert parallel._best_move(board) == serial._best_move(board)
+        assert parallel.best_score == serial.best_score
+        assert parallel.completed_depth == 3
+    finally:
+        parallel._close()
+    assert parallel.parallel is None
+
+
+def test_stopped_search_does_not_leak_into_the_next_one():
+    first = np.zeros((5, 5), dtype=int)
+    first[1, 1] = first[1, 2] = first[2, 1] = 2
+    first[4, 4] = first[4, 0] = 1
+    second = np.zeros((5, 5), dtype=int)
+    for row, col in ((0, 1), (0, 2), (0, 3), (3, 3), (2, 2)):
+        second[row, col] = 1
+    for row, col in ((0, 4), (4, 4), (1, 1)):
+        second[row, col] = 2
+
+    parallel = AI(5, workers=2)
+    try:
+        for stop_after, depth in ((0.3, 3), (0.8, 4)):
+            parallel.max_depth = 8
+            search = threading.Thread(target=parallel._best_move, args=(first,))
+            search.start()
+            time.sleep(stop_after)
+            parallel.stop_requested = True  # What AIPlayer._cancel_move and _stop_pondering do
+            search.join()
+            parallel.stop_requested = False
+
+            serial = AI(5, max_depth=depth)
+            parallel.max_depth = depth
+            assert parallel._best_move(second) == serial._best_move(second)
+            assert parallel.best_score == serial.best_score
+    finally:
+        parallel._close()
@@ -0,0 +1,58 @@
+from game_state import GameState
+
+
+def _setup(ai_player, **kwargs):
+    player, logger = ai_player(4, time_budget_ms=30, ponder=True, **kwargs)
+    state = GameState(4)
+    state._make(5, 1)
+    player._notify_move(1, 1, 1)
+    player._make_move(state, logger, None)  # Starts pondering on the human's replies
+    assert player.pondering is not None
+    player.pondering.result(timeout=5)
+    return player, logger, state
+
+
+def test_predicted_reply_is_answered_from_pondering(ai_player):
+    player, logger, state = _setup(ai_player)
+    assert player._ponder_stats()['searches'] == 3
+    human_mask, _ = next(iter(player.ponder_results))
+    reply = (human_mask & ~state.masks[1]).bit_length() - 1
+    state._make(reply, 1)
+    player._notify_move(*divmod(reply, 4), 1)
+    assert player._make_move(state, logger, None) is not None
+    assert player._ponder_stats()['hits'] == 1
+
+
+def test_ponder_hit_reports_the_search_that_found_the_move(ai_player):
+    player, logger, state = _setup(ai_player, collect_stats=True)
+    before = player._last_search_stats()
+    human_mask, _ = next(iter(player.ponder_results))
+    reply = (human_mask & ~state.masks[1]).bit_length() - 1
+    state._make(reply, 1)
+    player._notify_move(*divmod(reply, 4), 1)
+    move = player._make_move(state, logger, None)
+    player._stop_pondering()
+    record = player._last_search_stats()
+    assert record is not before
+    assert (record['source'], record['move']) == ('ponder', list(move))
+    assert player.engine.pv[0] == move[0] * 4 + move[1]
+    assert player.engine.best_score == record['score']
+    assert player.engine.stats.records[-1] is record
+
+
+def test_unexpected_reply_is_searched(ai_player):
+    player, logger, state = _setup(ai_player, ponder_moves=1)
+    pondered = {(human_mask & ~state.masks[1]).bit_length() - 1 for human_mask, _ in player.ponder_results}
+    reply = next(cell for cell in state._empty_cells() if cell not in pondered)
+    state._make(reply, 1)
+    player._notify_move(*divmod(reply, 4), 1)
+    assert player._make_move(state, logger, None) is not None
+    stats = player._ponder_stats()
+    assert (stats['hits'], stats['misses'], stats['hit_rate']) == (0, 1, 0.0)
+
+
+def test_pondering_is_off_by_default(ai_player):
+    player, logger = ai_player(time_budget_ms=20)
+    state = GameState(3)
+    player._make_move(state, logger, None)
+    assert player.pondering is None
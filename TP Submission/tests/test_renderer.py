@@ -0,0 +1,56 @@
+import time
+
+import numpy as np
+import pygame
+
+from renderer import Renderer
+
+COLORS = {'WHITE': (255, 255, 255), 'BLACK': (0, 0, 0), 'RED': (250, 0, 0), 'GREEN': (0, 255, 0)}
+
+
+def _renderer(board_size=3, fps=None):
+    pygame.init()
+    return Renderer(300, 300, board_size, board_size, COLORS, fps=fps)
+
+
+def test_idle_wait_is_not_frame_time():
+    renderer = _renderer()
+    renderer._tick()
+    time.sleep(0.2)  # Blocked in pygame.event.wait() until the next event
+    renderer._mark_idle()
+    renderer._render(np.zeros((3, 3), dtype=int))
+    renderer._tick()
+    report = renderer._frame_report()
+    assert report['frame_ms_max'] < 100
+    assert report['frame_interval_ms_max'] < 100
+    assert renderer.frames == 2
+
+
+def test_busy_frames_are_measured():
+    renderer = _renderer()
+    renderer._tick()
+    time.sleep(0.05)
+    renderer._tick()
+    report = renderer._frame_report()
+    assert report['frame_ms_max'] >= 50
+    assert report['frame_interval_ms_max'] >= 50
+
+
+def test_only_changed_cells_are_redrawn():
+    renderer = _renderer()
+    board = np.zeros((3, 3), dtype=int)
+    board[1, 1] = 1
+    assert renderer._render(board) == 1  # Full redraw, one figure
+    assert renderer._render(board) == 0
+    board[0, 2] = 2
+    assert renderer._render(board) == 1
+    renderer._restart_game()
+    assert renderer._render(np.zeros((3, 3), dtype=int)) == 0
+
+
+def test_surfaces_are_cached_per_size():
+    renderer = _renderer(4)
+    assert renderer._cached_surfaces() is renderer._cached_surfaces()
+    renderer._update_dimensions(5, 5)
+    grid, sprites = renderer._cached_surfaces()
+    assert sprites[1].get_size() == (renderer.square_size, renderer.square_size)
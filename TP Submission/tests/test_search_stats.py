@@ -0,0 +1,52 @@
+import json
+
+import numpy as np
+
+from minimax_ai import AI
+from search_stats import SearchStats
+
+
+def test_search_records_one_entry_per_move():
+    ai = AI(4, max_depth=3, collect_stats=True)
+    board = np.zeros((4, 4), dtype=int)
+    board[0, 0] = 1
+    move = ai._best_move(board)
+    record = ai.stats.last
+    assert record['move'] == list(move)
+    assert record['source'] == 'search'
+    assert record['nodes'] == ai.nodes
+    assert record['completed_depth'] == 3
+    assert [iteration['depth'] for iteration in record['iterations']] == [1, 2, 3]
+    assert sum(iteration['nodes'] for iteration in record['iterations']) == ai.nodes
+    assert sum(record['cutoffs_by_ply']) > 0
+    assert record['leaf_evaluations'] > 0
+    assert record['branching_factor'] == round(record['iterations'][2]['nodes'] / record['iterations'][1]['nodes'], 3)
+
+    ai._best_move(board)
+    assert len(ai.stats.records) == 2
+
+
+def test_stats_are_off_by_default():
+    ai = AI(3, max_depth=2)
+    ai._best_move(np.zeros((3, 3), dtype=int))
+    assert ai.stats is None
+
+
+def test_jsonl_export(tmp_path):
+    stats = SearchStats(3)
+    stats._record_iteration(1, 9, 5, 0.001)
+    stats._end_move((1, 1), 5, 9, 1, 0.002)
+    stats._begin_move()
+    stats._end_move(None, None, 0, 0, 0.0, 'book')
+    path = tmp_path / "stats.jsonl"
+    stats._write_jsonl(str(path))
+    stats._write_jsonl(str(path))
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert len(lines) == 4
+    assert lines[0]['move'] == [1, 1] and lines[0]['iterations'][0]['nodes'] == 9
+    assert lines[1]['source'] == 'book' and lines[1]['iterations'] == []
+    stats._write_jsonl(str(path), append=False)
+    assert len(path.read_text().splitlines()) == 2
+    stats._clear()
+    assert stats.records == [] and stats.last is None
+
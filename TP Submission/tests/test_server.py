@@ -0,0 +1,156 @@
+import asyncio
+import json
+
+from parallel_search import _worker_engine
+from server import GameServer, _percentile, _search_move
+
+
+def _serve(requests, **kwargs):
+    """Runs requests (lists run concurrently) against a fresh server and returns the responses."""
+    async def run():
+        server = GameServer(workers=1, default_budget_ms=20, **kwargs)
+        server.slots = asyncio.Semaphore(server.workers)
+        try:
+            responses = []
+            for request in requests:
+                if isinstance(request, list):
+                    responses.append(await asyncio.gather(
+                        *(server._handle_line(json.dumps(item).encode()) for item in request)))
+                else:
+                    responses.append(await server._handle_line(json.dumps(request).encode()))
+            return responses
+        finally:
+            server._close()
+    return asyncio.run(run())
+
+
+def test_move_gets_the_ai_reply():
+    new_game, move, state = _serve([
+        {'op': 'new_game', 'board_size': 3, 'id': 'a'},
+        {'op': 'move', 'game': 1, 'row': 1, 'col': 1},
+        {'op': 'state', 'game': 1},
+    ])
+    assert new_game == {'game': 1, 'board_size': 3, 'win_length': 3, 'moves': [], 'winner': 0, 'over': False,
+                        'id': 'a'}
+    assert move['moves'][0] == (1, 1) and len(move['moves']) == 2
+    assert state == move
+
+
+def test_ai_first_and_win_length():
+    (game,) = _serve([{'op': 'new_game', 'board_size': 5, 'win_length': 4, 'ai_first': True}])
+    assert game['win_length'] == 4
+    assert len(game['moves']) == 1
+
+
+def test_off_board_moves_are_rejected():
+    responses = _serve([{'op': 'new_game', 'board_size': 3}]
+                       + [{'op': 'move', 'game': 1, 'row': row, 'col': col}
+                          for row, col in ((0, 4), (0, -1), (3, 0), (-1, 2))]
+                       + [{'op': 'state', 'game': 1}])
+    for response in responses[1:-1]:
+        assert 'off the 3x3 board' in response['error']
+    assert responses[-1]['moves'] == []
+
+
+def test_invalid_requests_get_errors():
+    responses = _serve([
+        {'op': 'new_game', 'board_size': 2},
+        {'op': 'new_game', 'board_size': 5, 'win_length': 6},
+        {'op': 'new_game', 'time_budget_ms': 0},
+        {'op': 'move', 'game': 7, 'row': 0, 'col': 0},
+        {'op': 'new_game'},
+        {'op': 'move', 'game': 1, 'row': 0},
+        {'op': 'fly', 'game': 1},
+        'not an object',
+    ])
+    assert all('error' in response for response in responses[:4] + responses[5:])
+    assert responses[5]['error'].startswith("Invalid request")
+    assert responses[6]['error'] == "Unknown op 'fly'."
+
+
+def test_each_move_may_carry_its_own_budget():
+    responses = _serve([
+        {'op': 'new_game', 'board_size': 3},
+        {'op': 'move', 'game': 1, 'row': 1, 'col': 1, 'time_budget_ms': 0},
+        {'op': 'move', 'game': 1, 'row': 1, 'col': 1, 'time_budget_ms': 10 ** 6},
+        {'op': 'state', 'game': 1},
+        {'op': 'move', 'game': 1, 'row': 1, 'col': 1, 'time_budget_ms': 50},
+    ])
+    assert all('time_budget_ms' in response['error'] for response in responses[1:3])
+    assert responses[3]['moves'] == []  # Rejected before the human's move was applied
+    assert len(responses[4]['moves']) == 2
+
+
+def test_search_leaves_the_shared_engine_settings_alone():
+    for budget in (10, 30):
+        cell, _, _, _ = _search_move(4, 4, (1 << 5, 0), budget)
+        assert cell != 5
+    engine = _worker_engine((4, 4, None, True), with_book=True, max_depth=16)
+    assert engine.time_budget_ms is None and engine.max_depth == 16
+    assert _worker_engine((4, 4, None, True)).max_depth == 5  # Parallel search engines keep their defaults
+
+
+def test_occupied_cells_and_finished_games():
+    responses = _serve([
+        {'op': 'new_game', 'board_size': 3},
+        {'op': 'move', 'game': 1, 'row': 1, 'col': 1},
+        {'op': 'move', 'game': 1, 'row': 1, 'col': 1},
+        {'op': 'close', 'game': 1},
+        {'op': 'state', 'game': 1},
+    ])
+    assert responses[2]['error'] == "Cell 4 is not an empty cell of the board."
+    assert responses[3] == {'game': 1, 'closed': True}
+    assert 'error' in responses[4]
+
+
+def test_metrics_count_searches():
+    responses = _serve([
+        {'op': 'new_game', 'board_size': 3},
+        {'op': 'move', 'game': 1, 'row': 0, 'col': 0},
+        {'op': 'metrics'},
+    ])
+    metrics = responses[-1]
+    assert metrics['games'] == 1 and metrics['completed'] == 1 and metrics['rejected'] == 0
+    assert metrics['search_p50_ms'] is not None
+
+
+def test_concurrent_moves_in_one_game():
+    responses = _serve([
+        {'op': 'new_game', 'board_size': 5},
+        [{'op': 'move', 'game': 1, 'row': 2, 'col': 2}, {'op': 'move', 'game': 1, 'row': 0, 'col': 0}],
+        {'op': 'move', 'game': 1, 'row': 4, 'col': 4},
+    ])
+    first, second = responses[1]
+    assert len(first['moves']) == 2
+    assert second['error'] == "The AI is still searching its move in this game."
+    assert len(responses[2]['moves']) == 4  # The game goes on normally
+
+
+def test_concurrent_games_share_the_workers():
+    responses = _serve([
+        {'op': 'new_game', 'board_size': 3},
+        {'op': 'new_game', 'board_size': 4},
+        [{'op': 'move', 'game': 1, 'row': 0, 'col': 0}, {'op': 'move', 'game': 2, 'row': 0, 'col': 0}],
+        {'op': 'metrics'},
+    ])
+    assert all(len(response['moves']) == 2 for response in responses[2])
+    assert responses[3]['completed'] == 2 and responses[3]['max_queue_depth'] >= 1
+
+
+def test_full_queue_rejects_moves():
+    responses = _serve([
+        {'op': 'new_game', 'board_size': 3},
+        {'op': 'new_game', 'board_size': 3},
+        [{'op': 'move', 'game': 1, 'row': 0, 'col': 0}, {'op': 'move', 'game': 2, 'row': 0, 'col': 0}],
+        {'op': 'state', 'game': 2},
+    ], max_queue=0)
+    assert responses[2][1] == {'error': 'busy'}
+    assert responses[3]['moves'] == []  # Rejected before the human's move was applied
+
+
+def test_percentile():
+    assert _percentile([], 0.5) is None
+    assert _percentile([4.0], 0.99) == 4.0
+    values = list(range(100))
+    assert _percentile(values, 0.5) == 50
+    assert _percentile(values, 0.99) == 99
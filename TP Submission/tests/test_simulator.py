@@ -0,0 +1,41 @@
+import io
+import json
+
+import pytest
+
+from simulator import RandomAgent, ScriptedAgent, Simulator
+
+
+def test_scripted_game_has_a_known_winner():
+    agents = {1: ScriptedAgent(1, 3, [1, 2, 3]), 2: ScriptedAgent(2, 3, [4, 5, 6])}
+    winner, moves, latencies = Simulator._play_game(3, agents)
+    assert winner == 1
+    assert moves == [1, 4, 2, 5, 3]
+    assert len(latencies) == 5
+
+
+def test_engine_never_loses_to_random_on_3x3():
+    output = io.StringIO()
+    summary = Simulator(seed=1)._run([3], 'ai:9', 'random', 6, output)
+    assert summary[3]['games'] == 6
+    assert summary[3]['loss_rate'] == 0.0
+    results = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert [result['a_symbol'] for result in results] == [1, 2, 1, 2, 1, 2]  # Colors alternate
+
+
+def test_results_are_reproducible_with_a_seed():
+    runs = []
+    for workers in (1, 2, 1):
+        output = io.StringIO()
+        Simulator(workers=workers, seed=3)._run([3], 'random', 'random', 30, output)
+        results = sorted((json.loads(line) for line in output.getvalue().splitlines()), key=lambda r: r['game'])
+        runs.append([(result['winner'], result['moves']) for result in results])
+    assert runs[0] == runs[1] == runs[2]
+
+
+def test_agent_specs():
+    assert isinstance(Simulator._make_agent('random', 1, 3, 0), RandomAgent)
+    assert Simulator._make_agent('scripted:5,1', 1, 3, 0).script == [4, 0]
+    assert Simulator._make_agent('ai:2', 2, 3, 0).engine.max_depth == 2
+    with pytest.raises(ValueError):
+        Simulator._make_agent('minimax', 1, 3, 0)
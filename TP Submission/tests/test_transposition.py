@@ -0,0 +1,90 @@
+import numpy as np
+import pytest
+
+from bitboard import Bitboard
+from minimax_ai import AI
+from transposition import TranspositionTable
+from zobrist import Zobrist
+
+
+def _position(board_size, moves):
+    bitboard = Bitboard(board_size)
+    for cell, player in moves:
+        bitboard._make(cell, player)
+    return bitboard
+
+
+def _rotate(cell, board_size):
+    row, col = divmod(cell, board_size)
+    return col * board_size + (board_size - 1 - row)
+
+
+def test_symmetric_positions_share_a_key():
+    moves = [(0, 1), (5, 2), (7, 1)]
+    for board_size in (3, 5):
+        variants = [moves]
+        for _ in range(3):
+            variants.append([(_rotate(cell, board_size), player) for cell, player in variants[-1]])
+        variants.append([(cell // board_size * board_size + board_size - 1 - cell % board_size, player)
+                         for cell, player in moves])  # Mirrored
+        keys = {_position(board_size, variant)._canonical_key(1) for variant in variants}
+        assert len(keys) == 1
+
+
+def test_key_depends_on_side_to_move_and_pieces():
+    bitboard = _position(3, [(0, 1)])
+    assert bitboard._canonical_key(1) != bitboard._canonical_key(2)
+    assert bitboard._canonical_key(1) != _position(3, [(0, 2)])._canonical_key(1)
+    assert bitboard._canonical_key(1) != _position(3, [(4, 1)])._canonical_key(1)
+
+
+def test_permutations_are_inverted():
+    zobrist = Zobrist(5)
+    for permutation, inverse in zip(zobrist.permutations, zobrist.inverse_permutations):
+        assert [inverse[permutation[cell]] for cell in range(25)] == list(range(25))
+
+
+def test_lru_evicts_least_recently_used():
+    table = TranspositionTable(2, 'lru')
+    table._store(1, 3, 10, TranspositionTable.EXACT)
+    table._store(2, 3, 20, TranspositionTable.EXACT)
+    assert table._probe(1) is not None  # 1 becomes the most recently used
+    table._store(3, 3, 30, TranspositionTable.EXACT)
+    assert table._probe(2) is None
+    assert table._probe(1) == (3, 10, TranspositionTable.EXACT, None)
+    assert table.evictions == 1
+
+
+def test_depth_policy_keeps_deeper_entries():
+    table = TranspositionTable(4, 'depth')
+    table._store(1, 5, 10, TranspositionTable.LOWER, move=3)
+    table._store(5, 2, 20, TranspositionTable.EXACT)  # Same slot, shallower: ignored
+    assert table._probe(5) is None
+    assert table._probe(1) == (5, 10, TranspositionTable.LOWER, 3)
+    table._store(5, 7, 30, TranspositionTable.EXACT)  # Same slot, deeper: replaces
+    assert table._probe(1) is None
+    assert table._probe(5) == (7, 30, TranspositionTable.EXACT, None)
+
+
+def test_unknown_policy_is_rejected():
+    with pytest.raises(ValueError):
+        TranspositionTable(4, 'fifo')
+
+
+def test_depth_policy_replaces_entries_of_earlier_searches():
+    table = TranspositionTable(4, 'depth')
+    table._store(1, 9, 10, TranspositionTable.EXACT)
+    table._new_search()
+    assert table._probe(1) == (9, 10, TranspositionTable.EXACT, None)  # Still usable
+    table._store(5, 1, 20, TranspositionTable.UPPER)  # Same slot, shallower, but the old entry is stale
+    assert table._probe(1) is None
+    assert table._probe(5) == (1, 20, TranspositionTable.UPPER, None)
+    table._store(9, 0, 30, TranspositionTable.EXACT)  # The new entry belongs to this search: kept
+    assert table._probe(5) is not None
+
+
+def test_each_move_starts_a_new_table_generation():
+    ai = AI(3, max_depth=2, tt_policy='depth')
+    ai._best_move(np.zeros((3, 3), dtype=int))
+    ai._best_move(np.zeros((3, 3), dtype=int))
+    assert ai.tt.generation == 2
@@ -0,0 +1,48 @@
+import numpy as np
+
+from game_state import GameState
+from minimax_ai import AI
+
+
+def test_notified_position_matches_a_fresh_search():
+    moves = [(0, 1), (4, 2), (8, 1)]
+    warm = AI(3, max_depth=4)
+    warm._new_game()
+    board = np.zeros((3, 3), dtype=int)
+    for cell, player in moves:
+        warm._notify_move(cell, player)
+        board[divmod(cell, 3)] = player
+    assert warm._best_move() == AI(3, max_depth=4)._best_move(board)
+
+
+def test_new_game_resets_the_position():
+    ai = AI(3, max_depth=2)
+    ai._notify_move(4, 1)
+    ai._new_game()
+    assert ai.position.masks[1] == 0 and ai.position.masks[2] == 0
+    assert ai._best_move() is not None
+
+
+def test_ai_player_keeps_its_engine_in_sync(ai_player):
+    player, logger = ai_player(time_budget_ms=None)
+    engine = player.engine
+    state = GameState(3)
+    for _ in range(2):  # Two rounds with the same engine
+        player._new_game()
+        state._reset()
+        state._make(0, 1)
+        player._notify_move(0, 0, 1)
+        move = player._make_move(state, logger, None)
+        assert state._cell(*move) != 0
+        assert engine.position.masks == state.masks
+    assert player.engine is engine
+
+
+def test_ai_player_resynchronizes_a_stale_engine(ai_player):
+    player, logger = ai_player(time_budget_ms=None)
+    state = GameState(3)
+    state._make(0, 1)  # Not reported with _notify_move
+    move = player._make_move(state, logger, None)
+    assert move is not None and state._cell(*move) != 0
+    assert state.masks[2] != 0
+    assert player.engine.position.masks == state.masks
@@ -0,0 +1,135 @@
+from collections import OrderedDict
+
+
+class TranspositionTable:
+    """
+    Bounded cache of search results keyed by canonical Zobrist hash.
+
+    Each entry stores the score, the remaining depth it was searched to, the bound
+    type of the score and the best move found (in the canonical frame of the position).
+    Two replacement policies are available once the table is full:
+
+    - 'lru': evict the least recently used entry.
+    - 'depth': each key maps to a fixed slot (key modulo size), and an occupied slot is
+      only overwritten by a result searched at least as deep, or by any result once the
+      entry is left over from an earlier search (see _new_search).
+    """
+
+    EXACT = 0  # The score is the exact minimax value
+    LOWER = 1  # The score is a lower bound (the search failed high)
+    UPPER = 2  # The score is an upper bound (the search failed low)
+
+    POLICIES = ('lru', 'depth')
+
+    def __init__(self, max_entries=1 << 18, policy='lru'):
+        """
+        Initializes an empty table.
+
+        Args:
+            max_entries (int): Maximum number of entries kept in the table.
+            policy (str): Replacement policy, either 'lru' or 'depth'.
+        """
+        if policy not in self.POLICIES:
+            raise ValueError(f"Unknown replacement policy {policy!r}, expected one of {self.POLICIES}.")
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1.")
+        self.max_entries = max_entries
+        self.policy = policy
+        self._clear()
+
+    def _clear(self):
+        """Removes all entries and resets the counters."""
+        if self.policy == 'lru':
+            self.entries = OrderedDict()
+        else:
+            self.entries = [None] * self.max_entries  # One (key, depth, score, bound, move, generation) slot per index
+        self.generation = 0  # Number of the current search, stored with each 'depth' entry
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+
+    def _new_search(self):
+        """
+        Starts a new search (e.g. for the next move): the entries stored so far become stale.
+
+        Stale entries can still be probed, but with the 'depth' policy they no longer keep
+        a slot against shallower results. Otherwise a table kept across moves and games
+        would fill up with deep results of positions that cannot occur any more.
+        """
+        self.generation += 1
+
+    def _probe(self, key):
+        """
+        Looks up a position.
+
+        Args:
+            key (int): Canonical hash of the position.
+
+        Returns:
+            tuple or None: (depth, score, bound, move) if the position is stored, None otherwise.
+        """
+        if self.policy == 'lru':
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)  # Mark as most recently used
+        else:
+            slot = self.entries[key % self.max_entries]
+            entry = slot[1:5] if slot is not None and slot[0] == key else None
+
+        if entry is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return entry
+
+    def _store(self, key, depth, score, bound, move=None):
+        """
+        Stores a search result, evicting an older entry if the table is full.
+
+        Args:
+            key (int): Canonical hash of the position.
+            depth (int): Remaining depth the position was searched to.
+            score (int): Score of the position.
+            bound (int): One of EXACT, LOWER or UPPER.
+            move (int or None): Best move found, as a cell index in the canonical frame.
+        """
+        if self.policy == 'lru':
+            if key in self.entries:
+                self.entries.move_to_end(key)
+            elif len(self.entries) >= self.max_entries:
+                self.entries.popitem(last=False)  # Drop the least recently used entry
+                self.evictions += 1
+            self.entries[key] = (depth, score, bound, move)
+        else:
+            index = key % self.max_entries
+            slot = self.entries[index]
+            if slot is not None and slot[0] != key:
+                if slot[1] > depth and slot[5] == self.generation:
+                    return  # Keep the deeper result of the current search already in the slot
+                self.evictions += 1
+            self.entries[index] = (key, depth, score, bound, move, self.generation)
+        self.stores += 1
+
+    def _stats(self):
+        """
+        Returns the table counters, useful for sizing the table.
+
+        Returns:
+            dict: Entry count, capacity, hits, misses, stores, evictions and hit rate.
+        """
+        if self.policy == 'lru':
+            size = len(self.entries)
+        else:
+            size = sum(1 for slot in self.entries if slot is not None)
+        probes = self.hits + self.misses
+        return {
+            'policy': self.policy,
+            'size': size,
+            'capacity': self.max_entries,
+            'hits': self.hits,
+            'misses': self.misses,
+            'stores': self.stores,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / probes if probes else 0.0,
+        }
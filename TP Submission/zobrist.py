@@ -0,0 +1,97 @@
+import random
+
+
+class Zobrist:
+    """
+    Zobrist keys for hashing positions, canonicalized over the 8 symmetries of the square board.
+
+    A position is hashed once per symmetry of the dihedral group D4 (4 rotations, each
+    optionally mirrored). The 8 hashes are 64-bit lanes packed into a single Python int,
+    so updating all of them after a move is one XOR with the precomputed key for that
+    (player, cell). The canonical key of a position is the smallest lane, which is the
+    same for all 8 symmetric variants of the position.
+    """
+
+    NUM_SYMMETRIES = 8
+    LANE_BITS = 64
+    LANE_MASK = (1 << LANE_BITS) - 1
+
+    _cache = {}  # Keys and permutations only depend on the board size
+
+    def __init__(self, board_size, seed=0x7AC7AC):
+        """
+        Builds (or reuses) the key tables for the given board size.
+
+        Args:
+            board_size (int): Size of the board.
+            seed (int): Seed for the key generator, fixed so that hashes are reproducible.
+        """
+        self.board_size = board_size
+        if board_size not in self._cache:
+            self._cache[board_size] = self._build_tables(board_size, seed)
+        self.permutations, self.inverse_permutations, self.keys, self.side_key = self._cache[board_size]
+
+    @classmethod
+    def _build_tables(cls, board_size, seed):
+        """
+        Generates the symmetry permutations and the packed per-cell keys.
+
+        Returns:
+            tuple: (permutations, inverse_permutations, keys, side_key) where permutations[s][cell]
+                   is the image of the cell under symmetry s, inverse_permutations[s] maps an
+                   image back to its cell and keys[player][cell] is the packed key.
+        """
+        n = board_size
+        permutations = []
+        for mirrored in (False, True):
+            for turns in range(4):
+                permutation = []
+                for cell in range(n * n):
+                    row, col = divmod(cell, n)
+                    if mirrored:
+                        col = n - 1 - col  # Reflect across the vertical axis first
+                    for _ in range(turns):
+                        row, col = col, n - 1 - row  # Rotate 90 degrees clockwise
+                    permutation.append(row * n + col)
+                permutations.append(permutation)
+
+        inverse_permutations = []
+        for permutation in permutations:
+            inverse = [0] * len(permutation)
+            for cell, image in enumerate(permutation):
+                inverse[image] = cell
+            inverse_permutations.append(inverse)
+
+        generator = random.Random(seed * 31 + board_size)
+        base_keys = [[generator.getrandbits(cls.LANE_BITS) for _ in range(n * n)] for _ in range(3)]
+
+        # Lane s of a cell's key is the base key of the cell's image under symmetry s
+        keys = [[0] * (n * n) for _ in range(3)]
+        for player in (1, 2):
+            for cell in range(n * n):
+                packed = 0
+                for symmetry, permutation in enumerate(permutations):
+                    packed |= base_keys[player][permutation[cell]] << (cls.LANE_BITS * symmetry)
+                keys[player][cell] = packed
+
+        side_key = generator.getrandbits(cls.LANE_BITS)  # Distinguishes the side to move
+        return permutations, inverse_permutations, keys, side_key
+
+    def _canonical(self, packed_hash):
+        """
+        Returns the canonical key of a packed hash together with the symmetry that produced it.
+
+        Args:
+            packed_hash (int): The 8 packed hash lanes of a position.
+
+        Returns:
+            tuple: (key, symmetry) where key is the smallest lane.
+        """
+        best_key = packed_hash & self.LANE_MASK
+        best_symmetry = 0
+        for symmetry in range(1, self.NUM_SYMMETRIES):
+            lane = (packed_hash >> (self.LANE_BITS * symmetry)) & self.LANE_MASK
+            if lane < best_key:
+                best_key = lane
+                best_symmetry = symmetry
+        return best_key, best_symmetry